@@ -1,29 +1,62 @@
-from fastapi import APIRouter, File, UploadFile, HTTPException, Query
+from fastapi import APIRouter, File, UploadFile, HTTPException, Query, Request, Response
+from fastapi.responses import JSONResponse
 from app.services.attribution_service import ClothingAttributionService
 from app.services.styler_service import StylerService
 from app.core.image_storage_service import get_image_storage_service
+from app.core.upload_stream import parse_upload_stream
 from app.models.response import (
     AttributeAnalysisResponse,
+    AttributeJobResponse,
+    AttributeJobStatus,
     HealthResponse,
     StylerResponse,
 )
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List
+import hashlib
+import orjson
 
 router = APIRouter()
 
+# Static part of the /health body; only the timestamp changes per call
+_HEALTH_PREFIX = b'{"status":"healthy","timestamp":"'
+
 
 @router.get("/health", response_model=HealthResponse)
 async def health_check():
-    """Health check endpoint"""
-    return HealthResponse(status="healthy", timestamp=datetime.now().isoformat())
+    """
+    Health check endpoint
+
+    Probes hit this often, so the HealthResponse-shaped body is written
+    directly instead of being built and validated as a model.
+    """
+    return Response(
+        content=_HEALTH_PREFIX + datetime.now().isoformat().encode() + b'"}',
+        media_type="application/json",
+        headers={"Cache-Control": "no-store"},
+    )
 
 
 @router.get("/storage-info")
-async def storage_info() -> Dict[str, Any]:
-    """Get information about the current storage configuration"""
+async def storage_info(request: Request) -> Response:
+    """
+    Get information about the current storage configuration
+
+    The configuration only changes on restart, so the response carries an
+    ETag and may be cached; a matching If-None-Match gets an empty 304.
+    """
     image_storage = get_image_storage_service()
-    return image_storage.get_storage_info()
+    # The service returns a read-only view; JSON encoders need a real dict
+    info = dict(image_storage.get_storage_info())
+
+    digest = hashlib.blake2b(
+        orjson.dumps(info, option=orjson.OPT_SORT_KEYS), digest_size=8
+    ).hexdigest()
+    headers = {"ETag": f'W/"{digest}"', "Cache-Control": "public, max-age=300"}
+
+    if request.headers.get("if-none-match") == headers["ETag"]:
+        return Response(status_code=304, headers=headers)
+    return JSONResponse(info, headers=headers)
 
 
 @router.post("/attribute_clothes", response_model=AttributeAnalysisResponse)
@@ -42,11 +75,77 @@ async def attribute_clothes(user_id: str, files: List[UploadFile] = File(...)):
     Returns:
         JSON response with analysis results for all images
     """
+    # Refuse unsupported or oversized uploads before reading any file body
+    for file in files:
+        ClothingAttributionService.check_upload_before_read(file)
+
+    return await ClothingAttributionService.process_images_for_attributes(
+        files, user_id
+    )
+
+
+@router.post("/attribute_clothes_stream", response_model=AttributeAnalysisResponse)
+async def attribute_clothes_stream(user_id: str, request: Request):
+    """
+    Process uploaded image files, parsing the multipart body as it streams in
+
+    Same processing and response as /attribute_clothes. Each file's type is
+    checked as soon as its part starts and its size while its bytes
+    arrive, without spooling the upload to a temporary file first.
+
+    Args:
+        user_id: Unique identifier for the user (required)
+        request: Request whose multipart body carries the `files` fields
+
+    Returns:
+        JSON response with analysis results for all images
+    """
+    files = await parse_upload_stream(
+        request, ClothingAttributionService.check_upload_before_read
+    )
     return await ClothingAttributionService.process_images_for_attributes(
         files, user_id
     )
 
 
+@router.post("/attribute_clothes_async", response_model=AttributeJobResponse)
+async def attribute_clothes_async(user_id: str, files: List[UploadFile] = File(...)):
+    """
+    Queue uploaded image files for background clothing attribute analysis
+
+    Same processing as /attribute_clothes, but the response is returned as
+    soon as the uploads are read. Poll /attribute_status/{token} for each
+    returned token to get the per-image result.
+
+    Args:
+        user_id: Unique identifier for the user (required)
+        files: List of image files to be processed
+
+    Returns:
+        JSON response with one polling token per image
+    """
+    for file in files:
+        ClothingAttributionService.check_upload_before_read(file)
+
+    return await ClothingAttributionService.submit_images_for_attributes(
+        files, user_id
+    )
+
+
+@router.get("/attribute_status/{token}", response_model=AttributeJobStatus)
+async def attribute_status(token: str):
+    """
+    Get the status of a queued image analysis
+
+    Args:
+        token: Polling token returned by /attribute_clothes_async
+
+    Returns:
+        JSON response with the job status and, once completed, its result
+    """
+    return ClothingAttributionService.get_attribute_job(token)
+
+
 @router.post("/styler", response_model=StylerResponse)
 async def styler(
     user_id: str,
@@ -82,7 +181,7 @@ async def styler(
         city, weather, occasion
     )
 
-    return await StylerService.generate_outfit_recommendation(
+    return await StylerService.get_outfit_recommendation(
         user_id=user_id,
         city=validated_params["city"],
         weather=validated_params["weather"],
@@ -0,0 +1,108 @@
+"""
+Async micro-batching queue.
+
+Requests added within a short window are grouped and handed to a single
+batch function, so per-call overhead (connection, auth, prompt tokens) is
+paid once per batch instead of once per request.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Set, Tuple
+
+from app.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+class AsyncBatchQueue:
+    """Collects requests and processes them in batches."""
+
+    def __init__(
+        self,
+        process_fn: Callable[[List[Any]], Awaitable[List[Any]]],
+        max_batch_size: int = 8,
+        max_wait_time: float = 0.1,
+    ):
+        """
+        Initialize the batch queue.
+
+        Args:
+            process_fn: Async function taking a list of items and returning a
+                list of results in the same order
+            max_batch_size: Maximum number of items passed to process_fn at once
+            max_wait_time: Seconds to wait for more items after the first one
+        """
+        self.process_fn = process_fn
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait_time = max_wait_time
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._in_flight: Set[asyncio.Task] = set()
+
+    async def add_request(self, item: Any, key: Hashable = None) -> Any:
+        """
+        Queue an item and wait for its result.
+
+        Args:
+            item: Item to process
+            key: Only items queued with the same key share a process_fn call
+
+        Returns:
+            The result process_fn produced for this item
+        """
+        self._ensure_worker()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((key, item, future))
+        return await future
+
+    def _ensure_worker(self) -> None:
+        """Start the drain task for the running event loop if needed."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._worker is None or self._worker.done():
+            if self._loop is not loop:
+                self._queue = asyncio.Queue()
+                self._loop = loop
+            self._worker = loop.create_task(self._drain())
+
+    async def _drain(self) -> None:
+        """Take batches off the queue until the task is cancelled."""
+        while True:
+            batch = [await self._queue.get()]
+            deadline = asyncio.get_running_loop().time() + self.max_wait_time
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - asyncio.get_running_loop().time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            groups: Dict[Hashable, List[Tuple[Any, asyncio.Future]]] = {}
+            for key, item, future in batch:
+                groups.setdefault(key, []).append((item, future))
+            # Batches run concurrently so a slow call does not hold up the next
+            for group in groups.values():
+                task = asyncio.create_task(self._process_batch(group))
+                self._in_flight.add(task)
+                task.add_done_callback(self._in_flight.discard)
+
+    async def _process_batch(self, batch: List[Tuple[Any, asyncio.Future]]) -> None:
+        """Run process_fn on one batch and resolve each caller's future."""
+        items = [item for item, _ in batch]
+        try:
+            results = await self.process_fn(items)
+            if len(results) != len(items):
+                raise ValueError(
+                    f"Batch function returned {len(results)} results for {len(items)} items"
+                )
+        except Exception as e:
+            logger.error(f"Batch of {len(items)} items failed: {e}")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
@@ -1,5 +1,5 @@
 from pydantic_settings import BaseSettings
-from typing import Set
+from typing import FrozenSet
 import os
 
 
@@ -13,7 +13,7 @@ class Settings(BaseSettings):
     APP_VERSION: str = "1.0.0"
 
     # Image validation settings
-    ALLOWED_EXTENSIONS: Set[str] = {
+    ALLOWED_EXTENSIONS: FrozenSet[str] = frozenset({
         ".jpg",
         ".jpeg",
         ".png",
@@ -21,13 +21,19 @@ class Settings(BaseSettings):
         ".bmp",
         ".webp",
         ".avif",
-    }
+    })
     MAX_FILE_SIZE: int = 10 * 1024 * 1024  # 10MB
+    MAX_FILES_PER_REQUEST: int = 10  # Files accepted in one upload request
+    UPLOAD_CHUNK_SIZE: int = 1024 * 1024  # 1MB read size when streaming uploads
 
     # Image processing settings
     TARGET_WIDTH: int = 512  # Target width for clothing recognition
     TARGET_HEIGHT: int = 512  # Target height for clothing recognition
     JPEG_QUALITY: int = 85  # JPEG compression quality (1-100)
+    JPEG_OPTIMIZE: bool = True  # Optimized Huffman tables for stored images (smaller, slower encode)
+    JPEG_PROGRESSIVE: bool = True  # Progressive scans for stored images (smaller, renders incrementally)
+    JPEG_SUBSAMPLING: int = -1  # Chroma subsampling for stored images: -1 Pillow default (4:2:0), 0 = 4:4:4 (sharper color, larger)
+    JPEG_KEEP_SOURCE_QUALITY: bool = True  # Re-encode unmodified JPEG inputs with their own tables (quality="keep")
     MAINTAIN_ASPECT_RATIO: bool = True  # Keep original aspect ratio when resizing
 
     # Image storage settings
@@ -42,6 +48,9 @@ class Settings(BaseSettings):
         "image_attributes.json"  # JSON file to store attributes (will be per-user)
     )
     AVOID_DUPLICATES: bool = True  # Whether to avoid saving duplicate images
+    ATTRIBUTE_JOB_TTL: float = 3600.0  # Seconds finished background analyses stay pollable
+    USER_DATA_COMPACT_THRESHOLD: int = 256 * 1024  # Fold image log into JSON past this size
+    USER_DATA_CACHE_SIZE: int = 128  # Max users kept in the in-process data cache
 
     # User-specific storage settings
     USER_DATA_DIRECTORY: str = "user_data"  # Base directory for user-specific data
@@ -54,18 +63,40 @@ class Settings(BaseSettings):
     # Firebase configuration
     FIREBASE_SERVICE_ACCOUNT_KEY: str = ""
     USE_FIREBASE: bool = False
+    FIRESTORE_POOL_SIZE: int = 20  # Threads used to fan out independent Firestore writes
+    FIRESTORE_CACHE_SIZE: int = 4096  # Max user documents kept in the read cache
+    FIRESTORE_CACHE_TTL: float = 60.0  # Seconds to reuse a read document (0 disables)
+    FIRESTORE_LOCAL_CACHE_PATH: str = ""  # SQLite file shared by workers as a second read cache tier (empty disables)
+    FIRESTORE_LOCAL_CACHE_TTL: float = 300.0  # Seconds to reuse a document from the local tier
+    FIRESTORE_LOCAL_CACHE_MAX_ENTRIES: int = 10000  # Documents kept in the local tier; the oldest are pruned
 
     # Google Cloud Storage configuration
     USE_GCS: bool = False  # Whether to use GCS for image storage
     GCS_BUCKET_NAME: str = ""  # GCS bucket name for storing images
     GCS_SERVICE_ACCOUNT_KEY: str = ""  # Path to GCS service account key file
+    GCS_HTTP_POOL_SIZE: int = 128  # Max pooled HTTPS connections to GCS (requests default is 10)
+    GCS_SIGNED_URL_CACHE_TTL: float = 300.0  # Seconds to reuse a signed URL (capped at half its lifetime, 0 disables)
+    GCS_DOWNLOAD_CACHE_BYTES: int = 64 * 1024 * 1024  # Memory for recently downloaded blobs (0 disables)
+    GCS_DOWNLOAD_CACHE_MAX_ENTRY_BYTES: int = 2 * 1024 * 1024  # Larger blobs are not cached
+    GCS_MAX_CONCURRENCY: int = 32  # Threads used to save several images at once
+    GCS_LIST_SHARD_MONTHS: int = 0  # Split user listings into monthly key ranges listed in parallel (0 = one listing)
 
     # Styler configuration
     DEFAULT_STYLER: str = "openai"  # Options: "gemini" or "openai"
+    STYLER_CACHE_TTL: float = 60.0  # Seconds to reuse an identical outfit recommendation
+
+    # AI model call settings
+    MLLM_CONCURRENCY: int = 5  # Max concurrent attribute extractions per request
+    MLLM_BATCH_SIZE: int = 8  # Max images sent in one attribute extraction call
+    MLLM_BATCH_WAIT: float = 0.1  # Seconds to gather images into a batch
 
     # Server settings
     HOST: str = "0.0.0.0"
     PORT: int = 8000
+    LIMIT_CONCURRENCY: int = 1024  # Max open connections before uvicorn answers 503
+    BACKLOG: int = 2048  # Pending connection queue size
+    TIMEOUT_KEEP_ALIVE: int = 30  # Seconds idle keep-alive connections stay open
+    THREADPOOL_SIZE: int = 64  # Worker threads for blocking I/O and model calls
 
     # Logging settings
     LOG_LEVEL: str = "INFO"  # DEBUG, INFO, WARNING, ERROR, CRITICAL
@@ -5,8 +5,14 @@ This service provides a consistent interface for storing and retrieving user dat
 with the ability to switch between local file storage and Firebase storage.
 """
 
-import json
-from typing import Dict, Any, Optional
+import asyncio
+import mmap
+import os
+import threading
+import orjson
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, Any, Optional, Tuple
 from pathlib import Path
 
 from app.core.config import settings
@@ -16,6 +22,24 @@ from app.core.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Upper bound on memoized per-user file paths before the memo is reset
+_PATH_CACHE_SIZE = 10_000
+
+# JSON files larger than this are parsed straight from a read-only mmap
+_MMAP_THRESHOLD = 1 << 20
+
+
+def _resolve_batch(done: asyncio.Future):
+    """Build a callback that copies a finished write's outcome onto a batch future."""
+    def callback(write: asyncio.Future):
+        if write.cancelled():
+            done.cancel()
+        elif write.exception() is not None:
+            done.set_exception(write.exception())
+        else:
+            done.set_result(write.result())
+    return callback
+
 
 class UnifiedDataService:
     """Service that can use either local JSON or Firebase for data storage."""
@@ -27,6 +51,32 @@ class UnifiedDataService:
             self.firebase_service is not None and self.firebase_service.is_available
         )
         self.use_firebase = settings.USE_FIREBASE and firebase_available
+        
+        # Storage layout is fixed for the instance's lifetime, which also keeps
+        # the memoized paths below consistent with the settings they came from
+        self._user_data_dir = Path(settings.USER_DATA_DIRECTORY)
+        self._attributes_file = settings.ATTRIBUTES_JSON_FILE
+        self._create_user_subdirs = settings.CREATE_USER_SUBDIRS
+        
+        # user_id -> (version stamp, user data); see load_user_data
+        self._cache: "OrderedDict[str, Tuple[Any, Dict[str, Any]]]" = OrderedDict()
+        # user_id -> number of writes started or finished; lets callers that
+        # cache results derived from user data tell when it has changed
+        self._write_versions: Dict[str, int] = {}
+        # user_id -> (json path, image log path) as plain strings
+        self._path_cache: Dict[str, Tuple[str, str]] = {}
+        # Parent directories already created by this instance
+        self._dirs_made: set = set()
+        # Calls may run on worker threads (see the async methods below):
+        # one lock guards the cache, another keeps local file reads from
+        # interleaving with appends and compaction
+        self._cache_lock = threading.Lock()
+        self._local_lock = threading.RLock()
+        # Per-user write serialization for aupdate_user_image: the lock, how
+        # many callers are using it, and the batch waiting for the next write
+        self._update_locks: Dict[str, asyncio.Lock] = {}
+        self._update_lock_users: Dict[str, int] = {}
+        self._pending_updates: Dict[str, Tuple[Dict[str, Dict[str, Any]], asyncio.Future]] = {}
 
         if self.use_firebase:
             logger.info("Using Firebase for data storage")
@@ -37,18 +87,44 @@ class UnifiedDataService:
         """Get the path to user's JSON file (for local storage)."""
         normalized_user_id = normalize_user_id(user_id)
         
-        if settings.CREATE_USER_SUBDIRS:
-            user_dir = Path(settings.USER_DATA_DIRECTORY) / normalized_user_id
-            json_path = user_dir / settings.ATTRIBUTES_JSON_FILE
+        if self._create_user_subdirs:
+            json_path = self._user_data_dir / normalized_user_id / self._attributes_file
         else:
-            json_path = Path(f"{normalized_user_id}_{settings.ATTRIBUTES_JSON_FILE}")
+            json_path = Path(f"{normalized_user_id}_{self._attributes_file}")
             
         return json_path
     
+    def get_user_image_log_path(self, user_id: str) -> Path:
+        """Get the path to user's append-only image log (for local storage)."""
+        return self.get_user_json_file_path(user_id).with_suffix(".ndjson")
+    
+    def _get_user_paths(self, user_id: str) -> Tuple[str, str]:
+        """Get the user's JSON file and image log paths, memoized as strings."""
+        paths = self._path_cache.get(user_id)
+        if paths is None:
+            json_path = self.get_user_json_file_path(user_id)
+            paths = (os.fspath(json_path), os.fspath(json_path.with_suffix(".ndjson")))
+            if len(self._path_cache) >= _PATH_CACHE_SIZE:
+                self._path_cache.clear()
+            self._path_cache[user_id] = paths
+        return paths
+    
+    def _ensure_parent_dir(self, file_path: str):
+        """Create the parent directory of file_path once per service instance."""
+        parent = os.path.dirname(file_path)
+        if parent and parent not in self._dirs_made:
+            os.makedirs(parent, exist_ok=True)
+            self._dirs_made.add(parent)
+    
     def load_user_data(self, user_id: str) -> Optional[Dict[str, Any]]:
         """
         Load user data from either Firebase or local JSON file.
         
+        Results are cached in-process: local entries are reused while the
+        user's files are unchanged on disk, and Firebase reads go through
+        FirebaseService's TTL cache. The returned dict is shared with the
+        cache and must not be mutated.
+        
         Args:
             user_id: Unique identifier for the user
             
@@ -57,8 +133,54 @@ class UnifiedDataService:
         """
         if self.use_firebase:
             return self._load_from_firebase(user_id)
-        else:
-            return self._load_from_json(user_id)
+        
+        with self._local_lock:
+            stamp = self._get_local_data_version(user_id)
+            cached = self._get_cached(user_id)
+            if cached is not None and cached[0] == stamp:
+                return cached[1]
+            user_data = self._load_from_json(user_id)
+        
+        with self._cache_lock:
+            if user_data is None:
+                self._cache.pop(user_id, None)
+            else:
+                self._cache[user_id] = (stamp, user_data)
+                self._cache.move_to_end(user_id)
+                while len(self._cache) > settings.USER_DATA_CACHE_SIZE:
+                    self._cache.popitem(last=False)
+        
+        return user_data
+    
+    def _get_cached(self, user_id: str) -> Optional[Tuple[Any, Dict[str, Any]]]:
+        """Get the user's cache entry, marking it as recently used."""
+        with self._cache_lock:
+            entry = self._cache.get(user_id)
+            if entry is not None:
+                self._cache.move_to_end(user_id)
+            return entry
+    
+    def _invalidate_cache(self, user_id: str):
+        """Drop the user's cache entry and bump their write version around a write."""
+        with self._cache_lock:
+            self._cache.pop(user_id, None)
+            self._write_versions[user_id] = self._write_versions.get(user_id, 0) + 1
+    
+    def get_write_version(self, user_id: str) -> int:
+        """
+        Get a counter that changes whenever the user's data is written.
+        
+        Bumped both before and after each write, so a result computed from
+        data read during a write is never filed under the final version.
+        
+        Args:
+            user_id: Normalized user identifier
+            
+        Returns:
+            The user's current write version
+        """
+        with self._cache_lock:
+            return self._write_versions.get(user_id, 0)
     
     def save_user_data(self, user_id: str, data: Dict[str, Any]) -> bool:
         """
@@ -71,10 +193,15 @@ class UnifiedDataService:
         Returns:
             bool: True if successful, False otherwise
         """
-        if self.use_firebase:
-            return self._save_to_firebase(user_id, data)
-        else:
-            return self._save_to_json(user_id, data)
+        self._invalidate_cache(user_id)
+        try:
+            if self.use_firebase:
+                return self._save_to_firebase(user_id, data)
+            else:
+                with self._local_lock:
+                    return self._save_to_json(user_id, data)
+        finally:
+            self._invalidate_cache(user_id)
     
     def update_user_image(self, user_id: str, image_hash: str, image_data: Dict[str, Any]) -> bool:
         """
@@ -88,50 +215,236 @@ class UnifiedDataService:
         Returns:
             bool: True if successful, False otherwise
         """
+        return self.update_user_images(user_id, {image_hash: image_data})
+    
+    def update_user_images(self, user_id: str, images: Dict[str, Dict[str, Any]]) -> bool:
+        """
+        Update or add several images for a user in one write.
+        
+        Args:
+            user_id: Unique identifier for the user
+            images: Mapping of image hash to image attributes and metadata
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        self._invalidate_cache(user_id)
+        try:
+            if self.use_firebase:
+                return self.firebase_service.update_user_images_bulk(user_id, images)
+            else:
+                # For local storage, append to the image log instead of rewriting
+                # the whole user file; the log is folded in once it grows large
+                with self._local_lock:
+                    if not self._append_image_log(user_id, images):
+                        return False
+                    
+                    _, log_path = self._get_user_paths(user_id)
+                    if os.path.getsize(log_path) > settings.USER_DATA_COMPACT_THRESHOLD:
+                        self.compact_user_data(user_id)
+                    return True
+        finally:
+            self._invalidate_cache(user_id)
+    
+    async def aload_user_data(self, user_id: str) -> Optional[Dict[str, Any]]:
+        """Async load_user_data; Firebase reads use the async client, local reads a worker thread."""
         if self.use_firebase:
-            return self.firebase_service.update_user_images(user_id, image_hash, image_data)
-        else:
-            # For local storage, load existing data, update, and save
-            user_data = self.load_user_data(user_id) or {"images": {}}
+            return await self.firebase_service.aget_user_data(user_id)
+        return await asyncio.to_thread(self.load_user_data, user_id)
+    
+    async def asave_user_data(self, user_id: str, data: Dict[str, Any]) -> bool:
+        """Async save_user_data; the blocking write runs in a worker thread."""
+        return await asyncio.to_thread(self.save_user_data, user_id, data)
+    
+    async def aupdate_user_image(self, user_id: str, image_hash: str, image_data: Dict[str, Any]) -> bool:
+        """
+        Async update_user_image; the blocking write runs in a worker thread.
+        
+        Updates for the same user are serialized, and updates that queue up
+        while a write is in progress are flushed together in a single write.
+        
+        Args:
+            user_id: Unique identifier for the user
+            image_hash: Unique hash for the image
+            image_data: Dictionary containing image attributes and metadata
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        batch = self._pending_updates.get(user_id)
+        if batch is None:
+            batch = ({}, asyncio.get_running_loop().create_future())
+            self._pending_updates[user_id] = batch
+        images, done = batch
+        images[image_hash] = image_data
+        
+        lock = self._update_locks.setdefault(user_id, asyncio.Lock())
+        self._update_lock_users[user_id] = self._update_lock_users.get(user_id, 0) + 1
+        try:
+            async with lock:
+                # Whoever takes the lock first writes the whole batch; later
+                # callers find it already flushed and just collect the result
+                if self._pending_updates.get(user_id) is batch:
+                    del self._pending_updates[user_id]
+                    write = asyncio.ensure_future(
+                        asyncio.to_thread(self.update_user_images, user_id, images)
+                    )
+                    write.add_done_callback(_resolve_batch(done))
+                    # Shielded so the batch still lands if this caller is cancelled.
+                    # Waiting on done rather than write also retrieves a failed
+                    # write's exception from done, which nobody else may await
+                    await asyncio.shield(done)
+        finally:
+            remaining = self._update_lock_users[user_id] - 1
+            if remaining:
+                self._update_lock_users[user_id] = remaining
+            else:
+                del self._update_lock_users[user_id]
+                del self._update_locks[user_id]
+        
+        return await done
+    
+    def compact_user_data(self, user_id: str) -> bool:
+        """
+        Fold the user's image log into their JSON file (local storage only).
+        
+        Args:
+            user_id: Unique identifier for the user
             
-            if "images" not in user_data:
-                user_data["images"] = {}
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        with self._local_lock:
+            user_data = self._load_from_json(user_id)
+            if user_data is None:
+                return False
             
-            user_data["images"][image_hash] = image_data
-            return self.save_user_data(user_id, user_data)
+            success = self._save_to_json(user_id, user_data)
+        if success:
+            logger.debug(f"Compacted image log for user: {user_id}")
+        return success
+    
+    def _get_local_data_version(self, user_id: str) -> Tuple[Optional[Tuple[int, int]], ...]:
+        """Get (mtime, size) of the user's JSON file and image log to validate cached data."""
+        version = []
+        for path in self._get_user_paths(user_id):
+            try:
+                stat = os.stat(path)
+                version.append((stat.st_mtime_ns, stat.st_size))
+            except FileNotFoundError:
+                version.append(None)
+        return tuple(version)
     
     def _load_from_firebase(self, user_id: str) -> Optional[Dict[str, Any]]:
         """Load user data from Firebase."""
         return self.firebase_service.get_user_data(user_id)
     
     def _load_from_json(self, user_id: str) -> Optional[Dict[str, Any]]:
-        """Load user data from local JSON file."""
-        json_file_path = self.get_user_json_file_path(user_id)
-        
-        if not json_file_path.exists():
-            return None
+        """Load user data from local JSON file, merging any pending image log."""
+        json_file_path, log_path = self._get_user_paths(user_id)
         
+        # Open directly rather than checking existence first: one syscall
+        # per file on the common path, and no window between check and open
         try:
-            with open(json_file_path, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError) as e:
+            try:
+                user_data = self._read_json_file(json_file_path)
+                found = True
+            except FileNotFoundError:
+                user_data, found = {"images": {}}, False
+            
+            try:
+                self._merge_image_log(user_data, log_path, user_id)
+                found = True
+            except FileNotFoundError:
+                pass
+            
+            return user_data if found else None
+        except (orjson.JSONDecodeError, OSError) as e:
             logger.error(f"Error loading user data from {json_file_path}: {e}")
             return None
     
+    def _read_json_file(self, file_path: str) -> Dict[str, Any]:
+        """Parse a JSON file, mapping large files instead of copying them into memory."""
+        with open(file_path, "rb") as f:
+            if os.fstat(f.fileno()).st_size > _MMAP_THRESHOLD:
+                # orjson reads the mapped pages directly; the view must be
+                # released before the map is closed
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped, \
+                        memoryview(mapped) as view:
+                    return orjson.loads(view)
+            return orjson.loads(f.read())
+    
+    def _merge_image_log(self, user_data: Dict[str, Any], log_path: str, user_id: str):
+        """Apply image log records on top of the loaded user data (later records win)."""
+        images = user_data.setdefault("images", {})
+        last_updated = None
+        
+        with open(log_path, "rb") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    record = orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    # A torn final line from an interrupted append; skip it
+                    logger.warning(f"Skipping malformed record in {log_path}")
+                    continue
+                images[record["image_hash"]] = record["data"]
+                last_updated = record.get("updated")
+                # Image entries carry the ID as the caller gave it, not normalized
+                user_id = record["data"].get("user_id") or user_id
+        
+        if last_updated is not None:
+            metadata = user_data.setdefault("metadata", {})
+            metadata["user_id"] = user_id
+            metadata["total_images"] = len(images)
+            metadata["last_updated"] = last_updated
+    
+    def _append_image_log(self, user_id: str, images: Dict[str, Dict[str, Any]]) -> bool:
+        """Append one record per image to the user's image log in a single write."""
+        _, log_path = self._get_user_paths(user_id)
+        updated = datetime.now().isoformat()
+        lines = b"".join(
+            orjson.dumps({"image_hash": image_hash, "data": image_data, "updated": updated}) + b"\n"
+            for image_hash, image_data in images.items()
+        )
+        
+        try:
+            self._ensure_parent_dir(log_path)
+            
+            with open(log_path, "ab") as f:
+                f.write(lines)
+            
+            return True
+            
+        except IOError as e:
+            logger.error(f"Error appending image data to {log_path}: {e}")
+            return False
+    
     def _save_to_firebase(self, user_id: str, data: Dict[str, Any]) -> bool:
         """Save user data to Firebase."""
         return self.firebase_service.store_user_data(user_id, data)
     
     def _save_to_json(self, user_id: str, data: Dict[str, Any]) -> bool:
         """Save user data to local JSON file."""
-        json_file_path = self.get_user_json_file_path(user_id)
+        json_file_path, log_path = self._get_user_paths(user_id)
         
         try:
             # Create directory if it doesn't exist
-            json_file_path.parent.mkdir(parents=True, exist_ok=True)
+            self._ensure_parent_dir(json_file_path)
+            
+            # Write a temp file and swap it in, so readers (including ones
+            # holding a mmap of the old file) never see a truncated file
+            tmp_path = f"{json_file_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+            os.replace(tmp_path, json_file_path)
             
-            with open(json_file_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            # The full file now supersedes any pending image log records
+            try:
+                os.remove(log_path)
+            except FileNotFoundError:
+                pass
             
             return True
             
@@ -192,10 +505,16 @@ class UnifiedDataService:
         return success
 
 
-# Global unified data service instance
-unified_data_service = UnifiedDataService()
+# Global unified data service instance, created on first use so importing
+# this module (e.g. in the uvicorn parent before workers fork) does no I/O
+_data_service = None
 
 
 def get_data_service() -> UnifiedDataService:
     """Get the global unified data service instance."""
-    return unified_data_service
+    global _data_service
+    
+    if _data_service is None:
+        _data_service = UnifiedDataService()
+    
+    return _data_service
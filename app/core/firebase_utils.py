@@ -5,11 +5,19 @@ This module provides a simple interface for interacting with Firebase Firestore
 to store and retrieve user clothing attributes and other JSON data.
 """
 
-import json
+import asyncio
 import os
-from typing import Dict, Any, Optional, List
+import threading
+import orjson
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
+from typing import Dict, Any, Iterable, Optional, List, Sequence, Tuple
 from pathlib import Path
 
+from app.core.local_document_cache import LocalDocumentCache
 from app.core.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -21,8 +29,29 @@ try:
 except ImportError:
     FIREBASE_AVAILABLE = False
 
+try:
+    from firebase_admin import firestore_async
+    FIRESTORE_ASYNC_AVAILABLE = True
+except ImportError:
+    FIRESTORE_ASYNC_AVAILABLE = False
+
+try:
+    from google.cloud.firestore_v1.base_query import FieldFilter
+except ImportError:
+    # google-cloud-firestore < 2.11 only has the positional where() form
+    FieldFilter = None
+
 from app.core.config import settings
 
+# Firestore rejects batches with more writes than this
+_FIRESTORE_BATCH_LIMIT = 500
+
+
+@lru_cache(maxsize=8192)
+def _normalize_user_id(user_id: str) -> str:
+    """Normalize a user ID to its Firestore document ID (memoized)."""
+    return user_id.lower().strip()
+
 
 class FirebaseService:
     """Service for Firebase Firestore operations."""
@@ -30,18 +59,43 @@ class FirebaseService:
     def __init__(self):
         """Initialize Firebase service."""
         self._db = None
+        self._adb = None
         self._initialized = False
+        # Created on first fan-out; the client is thread-safe and its gRPC
+        # channel multiplexes concurrent calls
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+        # normalized user_id -> (fetch time, document data), least recent first
+        self._read_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        # normalized user_id -> count of writes; a read only caches its result
+        # if no write landed while it was in flight
+        self._cache_generations: Dict[str, int] = {}
+        self._cache_lock = threading.Lock()
+        # Host-wide tier behind the in-memory cache, checked before Firestore
+        self._local_cache: Optional[LocalDocumentCache] = None
+        if settings.FIRESTORE_LOCAL_CACHE_PATH:
+            try:
+                self._local_cache = LocalDocumentCache(
+                    settings.FIRESTORE_LOCAL_CACHE_PATH,
+                    ttl=settings.FIRESTORE_LOCAL_CACHE_TTL,
+                    max_entries=settings.FIRESTORE_LOCAL_CACHE_MAX_ENTRIES,
+                )
+            except Exception as e:
+                logger.warning(f"Local document cache disabled: {e}")
         
         if not FIREBASE_AVAILABLE:
             logger.warning("Firebase Admin SDK not available. Install with: pip install firebase-admin")
-            return
-            
-        self._initialize_firebase()
+        else:
+            self._initialize_firebase()
+        
+        if not self.is_available:
+            self._disable_operations()
     
     def _initialize_firebase(self):
         """Initialize Firebase Admin SDK."""
         try:
-            # Check if Firebase is already initialized
+            # Check if Firebase is already initialized; firestore.client()
+            # returns the app's existing client rather than opening a new one
             if firebase_admin._apps:
                 self._db = firestore.client()
                 self._initialized = True
@@ -78,6 +132,26 @@ class FirebaseService:
         """Check if Firebase is available and initialized."""
         return FIREBASE_AVAILABLE and self._initialized and self._db is not None
     
+    def _disable_operations(self):
+        """
+        Replace the Firestore operations with stubs returning their failure value.
+        
+        Availability cannot change after initialization, so this is done once
+        here instead of checking is_available on every call.
+        """
+        logger.warning("Firebase not available, user data operations are disabled")
+        self.store_user_data = lambda *args, **kwargs: False
+        self.store_user_data_bulk = lambda *args, **kwargs: False
+        self.get_user_data = lambda *args, **kwargs: None
+        self.get_users_data = lambda *args, **kwargs: {}
+        self.update_user_images = lambda *args, **kwargs: False
+        self.update_user_images_bulk = lambda *args, **kwargs: False
+        self.store_many = lambda items: [False for _ in items]
+        self.update_images_many = lambda updates: [False for _ in updates]
+        self.delete_user_data = lambda *args, **kwargs: False
+        self.list_users = lambda *args, **kwargs: []
+        self.list_users_where = lambda *args, **kwargs: []
+    
     def store_user_data(self, user_id: str, data: Dict[str, Any]) -> bool:
         """
         Store user data in Firebase Firestore.
@@ -89,58 +163,128 @@ class FirebaseService:
         Returns:
             bool: True if successful, False otherwise
         """
-        if not self.is_available:
-            logger.warning("Firebase not available, cannot store data")
-            return False
+        return self.store_user_data_bulk([(user_id, data)])
+    
+    def store_user_data_bulk(self, items: Iterable[Tuple[str, Dict[str, Any]]]) -> bool:
+        """
+        Store data for many users, merging up to 500 documents per commit.
         
-        try:
-            # Normalize user_id for consistent storage
-            normalized_user_id = user_id.lower().strip()
+        Args:
+            items: (user_id, data) pairs to store
             
-            # Store in 'users' collection with user_id as document ID
-            doc_ref = self._db.collection('users').document(normalized_user_id)
+        Returns:
+            bool: True if every batch was committed, False otherwise
+        """
+        try:
+            users_ref = self._db.collection('users')
+            items = iter(items)
+            stored = 0
             
-            # Add timestamp for tracking
-            from datetime import datetime
-            data_with_timestamp = {
-                **data,
-                'last_updated': datetime.utcnow(),
-                'user_id': normalized_user_id
-            }
+            while chunk := list(islice(items, _FIRESTORE_BATCH_LIMIT)):
+                batch = self._db.batch()
+                for user_id, data in chunk:
+                    # Normalize user_id for consistent storage
+                    normalized_user_id = _normalize_user_id(user_id)
+                    # Store in 'users' collection with user_id as document ID;
+                    # the server stamps last_updated, avoiding client clock skew
+                    batch.set(
+                        users_ref.document(normalized_user_id),
+                        {**data, 'last_updated': firestore.SERVER_TIMESTAMP, 'user_id': normalized_user_id},
+                        merge=True,
+                    )
+                batch.commit()
+                for user_id, _ in chunk:
+                    self._invalidate_cache(_normalize_user_id(user_id))
+                stored += len(chunk)
             
-            doc_ref.set(data_with_timestamp, merge=True)
             # Only log at debug level for successful store
-            logger.debug(f"Stored data for user: {normalized_user_id}")
+            logger.debug(f"Stored data for {stored} users")
             return True
             
         except Exception as e:
             logger.error(f"Error storing user data: {e}")
             return False
     
-    def get_user_data(self, user_id: str) -> Optional[Dict[str, Any]]:
+    def get_user_data(
+        self, user_id: str, fields: Optional[Sequence[str]] = None
+    ) -> Optional[Dict[str, Any]]:
         """
         Retrieve user data from Firebase Firestore.
         
+        Whole documents are cached for FIRESTORE_CACHE_TTL seconds (and in
+        the local tier for FIRESTORE_LOCAL_CACHE_TTL seconds, if enabled) and
+        dropped when this service writes to them. The returned dict is
+        shared with the cache and must not be mutated.
+        
         Args:
             user_id: Unique identifier for the user
+            fields: Optional field paths to fetch instead of the whole
+                document (e.g. skipping the large images map)
             
         Returns:
             Dict containing user data if found, None otherwise
         """
-        if not self.is_available:
-            logger.warning("Firebase not available, cannot retrieve data")
-            return None
-        
         try:
             # Normalize user_id for consistent retrieval
-            normalized_user_id = user_id.lower().strip()
+            normalized_user_id = _normalize_user_id(user_id)
             
             # Get document from 'users' collection
             doc_ref = self._db.collection('users').document(normalized_user_id)
+            
+            if fields is not None:
+                # Partial documents are fetched directly and never cached
+                doc = doc_ref.get(field_paths=list(fields))
+                return doc.to_dict() if doc.exists else None
+            
+            generation = self._get_cache_generation(normalized_user_id)
+            cached = self._get_cached(normalized_user_id, generation)
+            if cached is not None:
+                return cached
+            
             doc = doc_ref.get()
             
             if doc.exists:
                 data = doc.to_dict()
+                self._set_cached(normalized_user_id, data, generation)
+                logger.debug(f"Retrieved data for user: {normalized_user_id}")
+                return data
+            else:
+                logger.warning(f"No data found for user: {normalized_user_id}")
+                return None
+                
+        except Exception as e:
+            logger.error(f"Error retrieving user data: {e}")
+            return None
+    
+    async def aget_user_data(self, user_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Async get_user_data using the Firestore AsyncClient.
+        
+        Falls back to running get_user_data in a worker thread when the
+        async client is not available.
+        
+        Args:
+            user_id: Unique identifier for the user
+            
+        Returns:
+            Dict containing user data if found, None otherwise
+        """
+        adb = self._get_async_db()
+        if adb is None:
+            return await asyncio.to_thread(self.get_user_data, user_id)
+        
+        try:
+            normalized_user_id = _normalize_user_id(user_id)
+            
+            generation = self._get_cache_generation(normalized_user_id)
+            cached = self._get_cached(normalized_user_id, generation)
+            if cached is not None:
+                return cached
+            
+            doc = await adb.collection('users').document(normalized_user_id).get()
+            if doc.exists:
+                data = doc.to_dict()
+                self._set_cached(normalized_user_id, data, generation)
                 logger.debug(f"Retrieved data for user: {normalized_user_id}")
                 return data
             else:
@@ -151,6 +295,148 @@ class FirebaseService:
             logger.error(f"Error retrieving user data: {e}")
             return None
     
+    async def aget_users_data(
+        self, user_ids: List[str], field_paths: Optional[List[str]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Async get_users_data using the Firestore AsyncClient.
+        
+        Args:
+            user_ids: User identifiers to look up
+            field_paths: Optional fields to fetch instead of whole documents
+            
+        Returns:
+            Dict of normalized user ID to user data; users without data are omitted
+        """
+        adb = self._get_async_db()
+        if adb is None:
+            return await asyncio.to_thread(self.get_users_data, user_ids, field_paths)
+        
+        try:
+            users_ref = adb.collection('users')
+            doc_refs = [
+                users_ref.document(normalized_user_id)
+                for normalized_user_id in dict.fromkeys(_normalize_user_id(u) for u in user_ids)
+            ]
+            if not doc_refs:
+                return {}
+            
+            users_data = {}
+            async for doc in adb.get_all(doc_refs, field_paths=field_paths):
+                if doc.exists:
+                    users_data[doc.id] = doc.to_dict()
+            logger.debug(f"Retrieved data for {len(users_data)}/{len(doc_refs)} users")
+            return users_data
+            
+        except Exception as e:
+            logger.error(f"Error retrieving user data: {e}")
+            return {}
+    
+    def _get_async_db(self):
+        """Get the Firestore AsyncClient, or None if it cannot be used."""
+        if not FIRESTORE_ASYNC_AVAILABLE or not self.is_available:
+            return None
+        if self._adb is None:
+            try:
+                # Shares the default app's credentials with the sync client
+                self._adb = firestore_async.client()
+            except Exception as e:
+                logger.error(f"Firestore async client initialization error: {e}")
+                return None
+        return self._adb
+    
+    def _get_cache_generation(self, normalized_user_id: str) -> int:
+        """Get the user's write count, taken before a read that may be cached."""
+        with self._cache_lock:
+            return self._cache_generations.get(normalized_user_id, 0)
+    
+    def _get_cached(self, normalized_user_id: str, generation: int) -> Optional[Dict[str, Any]]:
+        """Get a cached document from memory, then from the local tier."""
+        with self._cache_lock:
+            entry = self._read_cache.get(normalized_user_id)
+            if entry is not None:
+                if time.monotonic() - entry[0] < settings.FIRESTORE_CACHE_TTL:
+                    self._read_cache.move_to_end(normalized_user_id)
+                    return entry[1]
+                del self._read_cache[normalized_user_id]
+        
+        if self._local_cache is None:
+            return None
+        data = self._local_cache.get(normalized_user_id, settings.FIRESTORE_LOCAL_CACHE_TTL)
+        if data is not None:
+            with self._cache_lock:
+                if self._cache_generations.get(normalized_user_id, 0) == generation:
+                    self._remember(normalized_user_id, data)
+        return data
+    
+    def _set_cached(self, normalized_user_id: str, data: Dict[str, Any], generation: int):
+        """
+        Cache a document freshly read from Firestore in every tier.
+        
+        Skipped if a write invalidated the user since generation was taken,
+        as the read may have returned the document from before that write.
+        """
+        with self._cache_lock:
+            if self._cache_generations.get(normalized_user_id, 0) != generation:
+                return
+            self._remember(normalized_user_id, data)
+            # Stored under the lock so _invalidate_cache's delete comes after it
+            if self._local_cache is not None:
+                self._local_cache.put(normalized_user_id, data)
+    
+    def _remember(self, normalized_user_id: str, data: Dict[str, Any]):
+        """Keep a document in memory, evicting the least recently used (lock held)."""
+        if settings.FIRESTORE_CACHE_TTL <= 0:
+            return
+        self._read_cache[normalized_user_id] = (time.monotonic(), data)
+        self._read_cache.move_to_end(normalized_user_id)
+        while len(self._read_cache) > settings.FIRESTORE_CACHE_SIZE:
+            self._read_cache.popitem(last=False)
+    
+    def _invalidate_cache(self, normalized_user_id: str):
+        """Drop a user's cached document after a write."""
+        with self._cache_lock:
+            self._read_cache.pop(normalized_user_id, None)
+            self._cache_generations[normalized_user_id] = (
+                self._cache_generations.get(normalized_user_id, 0) + 1
+            )
+        if self._local_cache is not None:
+            self._local_cache.delete(normalized_user_id)
+    
+    def get_users_data(
+        self, user_ids: List[str], field_paths: Optional[List[str]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Retrieve data for several users in a single round-trip.
+        
+        Args:
+            user_ids: User identifiers to look up
+            field_paths: Optional fields to fetch instead of whole documents
+            
+        Returns:
+            Dict of normalized user ID to user data; users without data are omitted
+        """
+        try:
+            users_ref = self._db.collection('users')
+            doc_refs = [
+                users_ref.document(normalized_user_id)
+                for normalized_user_id in dict.fromkeys(_normalize_user_id(u) for u in user_ids)
+            ]
+            if not doc_refs:
+                return {}
+            
+            users_data = {
+                doc.id: doc.to_dict()
+                for doc in self._db.get_all(doc_refs, field_paths=field_paths)
+                if doc.exists
+            }
+            logger.debug(f"Retrieved data for {len(users_data)}/{len(doc_refs)} users")
+            return users_data
+            
+        except Exception as e:
+            logger.error(f"Error retrieving user data: {e}")
+            return {}
+    
     def update_user_images(self, user_id: str, image_hash: str, image_data: Dict[str, Any]) -> bool:
         """
         Update or add image data for a user.
@@ -163,30 +449,108 @@ class FirebaseService:
         Returns:
             bool: True if successful, False otherwise
         """
-        if not self.is_available:
-            logger.warning("Firebase not available, cannot update images")
-            return False
+        return self.update_user_images_bulk(user_id, {image_hash: image_data})
+    
+    def update_user_images_bulk(self, user_id: str, images: Dict[str, Dict[str, Any]]) -> bool:
+        """
+        Update or add several images for a user in a single write.
         
+        metadata.total_images is incremented by the number of hashes not yet
+        stored, and metadata.last_updated and metadata.user_id are set, as a
+        full save_user_data would. The existence check reads only those
+        hashes, inside a transaction so concurrent writers count each once.
+        
+        Args:
+            user_id: Unique identifier for the user
+            images: Mapping of image hash to image attributes and metadata
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
         try:
-            normalized_user_id = user_id.lower().strip()
+            normalized_user_id = _normalize_user_id(user_id)
             
-            # Update the specific image in the user's images collection
+            # Update the specific images in the user's images map
             doc_ref = self._db.collection('users').document(normalized_user_id)
+            image_paths = [f'images.{image_hash}' for image_hash in images]
+            # Image entries carry the ID as the caller gave it, not normalized
+            display_user_id = next(
+                (data['user_id'] for data in images.values() if data.get('user_id')),
+                normalized_user_id,
+            )
             
-            # Use Firestore's nested field update syntax
-            update_data = {
-                f'images.{image_hash}': image_data,
-                'last_updated': firestore.SERVER_TIMESTAMP
-            }
+            @firestore.transactional
+            def write(transaction):
+                snapshot = doc_ref.get(field_paths=image_paths, transaction=transaction)
+                stored = (snapshot.to_dict() or {}).get('images', {}) if snapshot.exists else {}
+                added = sum(1 for image_hash in images if image_hash not in stored)
+                
+                # set() takes keys literally, so images go in as a nested map and
+                # the merge paths replace exactly those entries
+                update_data = {
+                    'images': images,
+                    'last_updated': firestore.SERVER_TIMESTAMP,
+                    'metadata': {
+                        'total_images': firestore.Increment(added),
+                        'last_updated': firestore.SERVER_TIMESTAMP,
+                        'user_id': display_user_id,
+                    },
+                }
+                merge_fields = image_paths + [
+                    'last_updated',
+                    'metadata.total_images',
+                    'metadata.last_updated',
+                    'metadata.user_id',
+                ]
+                transaction.set(doc_ref, update_data, merge=merge_fields)
             
-            doc_ref.set(update_data, merge=True)
-            logger.debug(f"Updated image {image_hash[:8]}... for user: {normalized_user_id}")
+            write(self._db.transaction())
+            self._invalidate_cache(normalized_user_id)
+            logger.debug(f"Updated {len(images)} images for user: {normalized_user_id}")
             return True
             
         except Exception as e:
             logger.error(f"Error updating user images: {e}")
             return False
     
+    def store_many(self, items: Iterable[Tuple[str, Dict[str, Any]]]) -> List[bool]:
+        """
+        Store data for several users concurrently, one write per user.
+        
+        Unlike store_user_data_bulk, each user's write succeeds or fails on
+        its own.
+        
+        Args:
+            items: (user_id, data) pairs to store
+            
+        Returns:
+            List of per-item results, in input order
+        """
+        return list(self._get_pool().map(lambda item: self.store_user_data(*item), items))
+    
+    def update_images_many(self, updates: Iterable[Tuple[str, str, Dict[str, Any]]]) -> List[bool]:
+        """
+        Apply several image updates concurrently.
+        
+        Args:
+            updates: (user_id, image_hash, image_data) triples
+            
+        Returns:
+            List of per-update results, in input order
+        """
+        return list(self._get_pool().map(lambda update: self.update_user_images(*update), updates))
+    
+    def _get_pool(self) -> ThreadPoolExecutor:
+        """Get the shared thread pool used to fan out writes."""
+        if self._pool is None:
+            with self._pool_lock:
+                if self._pool is None:
+                    self._pool = ThreadPoolExecutor(
+                        max_workers=settings.FIRESTORE_POOL_SIZE,
+                        thread_name_prefix="firestore",
+                    )
+        return self._pool
+    
     def delete_user_data(self, user_id: str) -> bool:
         """
         Delete user data from Firebase Firestore.
@@ -197,16 +561,13 @@ class FirebaseService:
         Returns:
             bool: True if successful, False otherwise
         """
-        if not self.is_available:
-            logger.warning("Firebase not available, cannot delete data")
-            return False
-        
         try:
-            normalized_user_id = user_id.lower().strip()
+            normalized_user_id = _normalize_user_id(user_id)
             
             # Delete document from 'users' collection
             doc_ref = self._db.collection('users').document(normalized_user_id)
             doc_ref.delete()
+            self._invalidate_cache(normalized_user_id)
             logger.debug(f"Deleted data for user: {normalized_user_id}")
             return True
             
@@ -224,20 +585,85 @@ class FirebaseService:
         Returns:
             List of user IDs
         """
-        if not self.is_available:
-            logger.warning("Firebase not available, cannot list users")
-            return []
-        
         try:
-            users_ref = self._db.collection('users').limit(limit)
-            docs = users_ref.stream()
-            user_ids = [doc.id for doc in docs]
+            user_ids = self._stream_ids(self._db.collection('users'), limit)
             logger.info(f"Listing users (count={len(user_ids)})")
             return user_ids
         except Exception as e:
             logger.error(f"Error listing users: {e}")
             return []
     
+    def list_users_where(
+        self, field: str, op: str, value: Any, limit: int = 50, collection_group: bool = False
+    ) -> List[str]:
+        """
+        List the IDs of users whose documents match a filter.
+        
+        The filter runs server-side, so only matching document names are
+        read. A single-field filter is served by Firestore's automatic
+        indexes; adding another inequality or an order_by on a different
+        field needs a composite index (field + __name__) declared in
+        firestore.indexes.json, plus a COLLECTION_GROUP scope entry when
+        collection_group is used.
+        
+        Args:
+            field: Field path to filter on (e.g. 'user_id' or 'metadata.plan')
+            op: Firestore operator ('==', '<', 'array-contains', 'in', ...)
+            value: Value to compare against
+            limit: Maximum number of users to return
+            collection_group: Query every 'users' collection, including
+                sub-collections, instead of only the top-level one
+            
+        Returns:
+            List of matching user IDs
+        """
+        try:
+            users_ref = (
+                self._db.collection_group('users') if collection_group
+                else self._db.collection('users')
+            )
+            if FieldFilter is not None:
+                query = users_ref.where(filter=FieldFilter(field, op, value))
+            else:
+                query = users_ref.where(field, op, value)
+            
+            # Range filters order by their field, so page cursors need its value
+            user_ids = self._stream_ids(query, limit, fields=[field])
+            logger.info(f"Listing users where {field} {op} {value!r} (count={len(user_ids)})")
+            return user_ids
+        except Exception as e:
+            logger.error(f"Error listing users where {field} {op} {value!r}: {e}")
+            return []
+    
+    def _stream_ids(self, query, limit: int, fields: Sequence[str] = ()) -> List[str]:
+        """
+        Stream up to limit document IDs of a query, one cursor page at a time.
+        
+        Args:
+            query: Firestore query or collection reference
+            limit: Maximum number of IDs to return
+            fields: Fields the query filters on; start_after() reads the
+                values of the fields a query orders by from the last
+                snapshot, so they must be part of the projection
+            
+        Returns:
+            List of document IDs
+        """
+        # Project only the filter fields (none returns document names only)
+        query = query.select(list(fields))
+        doc_ids = []
+        last_doc = None
+        
+        # Page with cursors so large limits don't become one huge query
+        while len(doc_ids) < limit:
+            page_ref = query if last_doc is None else query.start_after(last_doc)
+            page = list(page_ref.limit(min(limit - len(doc_ids), _FIRESTORE_BATCH_LIMIT)).stream())
+            doc_ids.extend(doc.id for doc in page)
+            if len(page) < _FIRESTORE_BATCH_LIMIT:
+                break
+            last_doc = page[-1]
+        return doc_ids
+    
     def backup_to_json(self, user_id: str, file_path: str) -> bool:
         """
         Backup user data from Firebase to a local JSON file.
@@ -255,24 +681,27 @@ class FirebaseService:
             logger.warning(f"No data to backup for user: {user_id}")
             return False
         
+        tmp_path = f"{file_path}.{os.getpid()}.tmp"
         try:
-            # Convert Firestore timestamps to strings for JSON serialization
-            def convert_timestamps(obj):
-                if hasattr(obj, 'timestamp'):
-                    return obj.timestamp()
-                return obj
-            
             # Create directory if it doesn't exist
             Path(file_path).parent.mkdir(parents=True, exist_ok=True)
             
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, default=str, ensure_ascii=False)
+            # orjson calls default=str only for values it cannot encode (Firestore
+            # timestamps, GeoPoints, references), keeping the old backup format.
+            # Written to a temp file and swapped in so a backup is never half-written
+            with open(tmp_path, 'wb') as f:
+                f.write(orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+            os.replace(tmp_path, file_path)
             
             logger.info(f"Backup complete for user {user_id}")
             return True
             
         except Exception as e:
             logger.error(f"Error backing up user data: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
             return False
     
     def restore_from_json(self, user_id: str, file_path: str) -> bool:
@@ -292,8 +721,8 @@ class FirebaseService:
                 logger.error(f"File not found: {file_path}")
                 return False
             
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(file_path, 'rb') as f:
+                data = orjson.loads(f.read())
             
             result = self.store_user_data(user_id, data)
             if result:
@@ -303,12 +732,60 @@ class FirebaseService:
         except Exception as e:
             logger.error(f"Error restoring user data: {e}")
             return False
+    
+    def restore_many(self, items: Iterable[Tuple[str, str]]) -> Dict[str, bool]:
+        """
+        Restore several users from local JSON files to Firebase.
+        
+        Files are read and parsed concurrently on the shared thread pool,
+        then written with store_user_data_bulk (up to 500 users per commit).
+        
+        Args:
+            items: (user_id, file_path) pairs to restore
+            
+        Returns:
+            Dict of user_id to whether it was restored; if any commit fails,
+            every user is reported as not restored
+        """
+        items = list(items)
+        logger.info(f"Restoring {len(items)} users from JSON backups")
+        
+        def load(item: Tuple[str, str]) -> Optional[Dict[str, Any]]:
+            user_id, file_path = item
+            try:
+                with open(file_path, 'rb') as f:
+                    return orjson.loads(f.read())
+            except FileNotFoundError:
+                logger.error(f"File not found: {file_path}")
+            except Exception as e:
+                logger.error(f"Error reading backup for user {user_id}: {e}")
+            return None
+        
+        loaded = list(self._get_pool().map(load, items))
+        to_store = [(user_id, data) for (user_id, _), data in zip(items, loaded) if data is not None]
+        stored = bool(to_store) and self.store_user_data_bulk(to_store)
+        
+        results = {
+            user_id: stored and data is not None
+            for (user_id, _), data in zip(items, loaded)
+        }
+        logger.info(f"Restore complete: {sum(results.values())}/{len(items)} users restored")
+        return results
 
 
-# Global Firebase service instance
-firebase_service = FirebaseService()
+# Global Firebase service instance, created on first use so the Firestore
+# client and its gRPC channel are opened inside the worker process
+_firebase_service = None
+_firebase_service_lock = threading.Lock()
 
 
 def get_firebase_service() -> FirebaseService:
     """Get the global Firebase service instance."""
-    return firebase_service
\ No newline at end of file
+    global _firebase_service
+    
+    if _firebase_service is None:
+        with _firebase_service_lock:
+            if _firebase_service is None:
+                _firebase_service = FirebaseService()
+    
+    return _firebase_service
\ No newline at end of file
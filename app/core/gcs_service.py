@@ -5,9 +5,15 @@ This module provides a service for interacting with Google Cloud Storage
 to store and retrieve processed images instead of storing them locally.
 """
 
+import asyncio
 import io
 import os
-from typing import Optional, Dict, Any
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from datetime import timedelta
+from typing import Optional, Dict, Any, Iterator, List, Set, Tuple
 from pathlib import Path
 from PIL import Image
 
@@ -18,30 +24,94 @@ logger = get_logger(__name__)
 try:
     from google.cloud import storage
     from google.api_core import exceptions as gcp_exceptions
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
     GCS_AVAILABLE = True
 except ImportError:
     GCS_AVAILABLE = False
     logger.warning("Google Cloud Storage client not available. Install with: pip install google-cloud-storage")
 
+try:
+    from google.cloud.storage import transfer_manager
+    TRANSFER_MANAGER_AVAILABLE = True
+except ImportError:
+    TRANSFER_MANAGER_AVAILABLE = False
+
+try:
+    from gcloud.aio.storage import Storage as AioStorage
+    GCLOUD_AIO_AVAILABLE = True
+except ImportError:
+    GCLOUD_AIO_AVAILABLE = False
+
+# Blobs larger than this are downloaded as concurrent ranged GETs
+_CHUNKED_DOWNLOAD_THRESHOLD = 32 * 1024 * 1024
+_DOWNLOAD_CHUNK_SIZE = 32 * 1024 * 1024
+# The JSON API accepts at most this many calls per batch request
+_GCS_BATCH_LIMIT = 100
+# Max signed URLs kept for reuse
+_SIGNED_URL_CACHE_SIZE = 4096
+# Content types for the Pillow format names callers pass
+_CONTENT_TYPES = {
+    "JPEG": "image/jpeg",
+    "PNG": "image/png",
+    "WEBP": "image/webp",
+    "GIF": "image/gif",
+}
+
+
+def _content_type(format: str) -> str:
+    """Get the MIME type for a Pillow format name."""
+    return _CONTENT_TYPES.get(format) or f"image/{format.lower()}"
+
 
 class GCSService:
     """Service for Google Cloud Storage operations."""
     
-    def __init__(self, bucket_name: str, service_account_key_path: str = None):
+    def __init__(
+        self,
+        bucket_name: str,
+        service_account_key_path: str = None,
+        http_pool_size: int = 128,
+        signed_url_cache_ttl: float = 300.0,
+        download_cache_bytes: int = 64 * 1024 * 1024,
+        download_cache_max_entry_bytes: int = 2 * 1024 * 1024
+    ):
         """
         Initialize GCS service.
         
         Args:
             bucket_name: Name of the GCS bucket to use
             service_account_key_path: Path to service account key file (optional)
+            http_pool_size: Max pooled HTTPS connections kept open to GCS
+            signed_url_cache_ttl: Seconds to reuse a generated signed URL
+            download_cache_bytes: Memory budget for recently downloaded blobs
+            download_cache_max_entry_bytes: Largest blob kept in that cache
         """
         self.bucket_name = bucket_name
         self.service_account_key_path = service_account_key_path
+        self.http_pool_size = http_pool_size
+        self.signed_url_cache_ttl = signed_url_cache_ttl
+        # (blob_name, method, expiration_minutes) -> (signing time, URL), least recent first
+        self._signed_urls: "OrderedDict[Tuple[str, str, int], Tuple[float, str]]" = OrderedDict()
+        # blob_name -> its keys in _signed_urls, so a blob's URLs drop without a scan
+        self._signed_url_keys: Dict[str, Set[Tuple[str, str, int]]] = {}
+        self._signed_urls_lock = threading.Lock()
+        self._signed_url_hits = 0
+        self._signed_url_misses = 0
+        self.download_cache_bytes = download_cache_bytes
+        self.download_cache_max_entry_bytes = download_cache_max_entry_bytes
+        # blob_name -> (generation, content), least recent first
+        self._downloads: "OrderedDict[str, Tuple[int, bytes]]" = OrderedDict()
+        self._downloads_size = 0
+        self._downloads_lock = threading.Lock()
         self._client = None
         self._bucket = None
         self._initialized = False
+        # aiohttp-backed client, recreated for each event loop it is used on
+        self._aio_storage = None
+        self._aio_loop = None
         
-        if GCS_AVAILABLE:
+        if GCS_AVAILABLE and bucket_name:
             self._initialize_gcs()
     
     def _initialize_gcs(self):
@@ -56,76 +126,151 @@ class GCSService:
                 self._client = storage.Client()
                 logger.info("GCS initialized with default credentials")
             
-            # Get bucket reference
-            self._bucket = self._client.bucket(self.bucket_name)
+            self._configure_http_pool()
             
-            # Test bucket access
-            if self._bucket.exists():
-                self._initialized = True
-                logger.info(f"GCS bucket '{self.bucket_name}' is accessible")
-            else:
-                logger.error(f"GCS bucket '{self.bucket_name}' does not exist or is not accessible")
+            # Get bucket reference; access is not probed here so startup does
+            # not wait on GCS. The first real operation (or verify()) surfaces
+            # a missing bucket or bad credentials
+            self._bucket = self._client.bucket(self.bucket_name)
+            self._initialized = True
+            logger.info(f"GCS client ready for bucket '{self.bucket_name}'")
                 
         except Exception as e:
             logger.error(f"Failed to initialize GCS: {e}")
             self._initialized = False
     
+    def _configure_http_pool(self):
+        """
+        Widen the client's HTTPS connection pool.
+        
+        The default requests adapter keeps 10 connections, so concurrent
+        uploads beyond that pay a fresh TCP + TLS handshake each time.
+        Failed connection attempts (e.g. a pooled socket the server closed
+        while idle) are retried here; read and status retries stay with the
+        storage client's own retry policy so request bodies are not replayed
+        twice.
+        """
+        try:
+            adapter = HTTPAdapter(
+                pool_connections=self.http_pool_size,
+                pool_maxsize=self.http_pool_size,
+                pool_block=False,
+                max_retries=Retry(total=3, connect=3, read=0, status=0, backoff_factor=0.3),
+            )
+            self._client._http.mount("https://", adapter)
+        except Exception as e:
+            logger.warning(f"Could not resize GCS connection pool: {e}")
+    
     @property
     def is_available(self) -> bool:
         """Check if GCS is available and initialized."""
         return GCS_AVAILABLE and self._initialized
     
+    def verify(self) -> bool:
+        """
+        Check that the bucket exists and is accessible (one network round-trip).
+        
+        Returns:
+            True if the bucket is reachable, False otherwise
+        """
+        if not self.is_available:
+            return False
+        
+        try:
+            if self._bucket.exists():
+                logger.info(f"GCS bucket '{self.bucket_name}' is accessible")
+                return True
+            logger.error(f"GCS bucket '{self.bucket_name}' does not exist or is not accessible")
+            return False
+        except Exception as e:
+            logger.error(f"Failed to verify GCS bucket '{self.bucket_name}': {e}")
+            return False
+    
     def upload_image(
         self, 
         image: Image.Image, 
         blob_name: str, 
         format: str = "JPEG",
         quality: int = 85,
-        metadata: Optional[Dict[str, str]] = None
+        metadata: Optional[Dict[str, str]] = None,
+        optimize: bool = False,
+        progressive: bool = False,
+        raw_bytes: Optional[bytes] = None,
+        overwrite: bool = True
     ) -> Optional[str]:
         """
         Upload a PIL Image to GCS.
         
+        Prefer upload_image_bytes when the encoded bytes are already at hand;
+        passing them as raw_bytes here does the same and skips the re-encode.
+        
         Args:
             image: PIL Image object to upload
             blob_name: Name for the blob in GCS (including path)
             format: Image format (JPEG, PNG, etc.)
             quality: JPEG quality (1-100)
             metadata: Optional metadata to attach to the blob
+            optimize: Run Pillow's extra JPEG Huffman-table pass; slightly
+                smaller files for roughly twice the encode time
+            progressive: Write a progressive JPEG (implies optimized tables);
+                ignored for other formats
+            raw_bytes: Already encoded image in the given format; uploaded
+                as-is instead of encoding image
+            overwrite: If False, only create the blob; an existing blob is
+                left untouched and None is returned
             
         Returns:
             GCS URL if successful, None otherwise
         """
+        if raw_bytes is not None:
+            return self.upload_image_bytes(
+                raw_bytes, blob_name, _content_type(format), metadata, overwrite
+            )
+        
         if not self.is_available:
             logger.warning("GCS not available, cannot upload image")
             return None
         
         try:
             # Convert PIL image to bytes
-            img_buffer = io.BytesIO()
             image_to_save = image
             if format.upper() == "JPEG" and image.mode not in ("RGB", "L"):
                 image_to_save = image.convert("RGB")    
-            if format.upper() == "JPEG":
-                image_to_save.save(img_buffer, format=format, quality=quality, optimize=True)
-            else:
-                image_to_save.save(img_buffer, format=format, optimize=True)
-
-            img_buffer.seek(0)
+            # The buffer is not pre-sized: BytesIO over-allocates as it grows
+            # and getvalue() returns its storage without copying, whereas a
+            # pre-filled buffer costs a zero-fill plus a trimming copy
+            with io.BytesIO() as img_buffer:
+                if format.upper() == "JPEG":
+                    image_to_save.save(
+                        img_buffer,
+                        format=format,
+                        quality=quality,
+                        optimize=optimize,
+                        progressive=progressive,
+                    )
+                else:
+                    image_to_save.save(img_buffer, format=format, optimize=True)
+                payload = img_buffer.getvalue()
             
             # Create blob and upload
             blob = self._bucket.blob(blob_name)
             
             # Set content type based on format
-            content_type = f"image/{format.lower()}"
+            content_type = _content_type(format)
             blob.content_type = content_type
             
             # Add custom metadata if provided
             if metadata:
                 blob.metadata = metadata
             
-            # Upload the image
-            blob.upload_from_file(img_buffer, content_type=content_type)
+            # Upload the encoded bytes directly; upload_from_file would re-read
+            # them from the buffer through another copy
+            blob.upload_from_string(
+                payload,
+                content_type=content_type,
+                if_generation_match=None if overwrite else 0,
+            )
+            self._forget_blob(blob_name)
             
             # Get the public URL
             gcs_url = f"gs://{self.bucket_name}/{blob_name}"
@@ -133,6 +278,9 @@ class GCSService:
             logger.info(f"Image uploaded to GCS: {gcs_url}")
             return gcs_url
             
+        except gcp_exceptions.PreconditionFailed:
+            logger.warning(f"Blob already exists, not overwriting: {blob_name}")
+            return None
         except Exception as e:
             logger.error(f"Error uploading image to GCS: {e}")
             return None
@@ -142,7 +290,8 @@ class GCSService:
         image_bytes: bytes, 
         blob_name: str, 
         content_type: str = "image/jpeg",
-        metadata: Optional[Dict[str, str]] = None
+        metadata: Optional[Dict[str, str]] = None,
+        overwrite: bool = True
     ) -> Optional[str]:
         """
         Upload image bytes directly to GCS.
@@ -152,6 +301,8 @@ class GCSService:
             blob_name: Name for the blob in GCS
             content_type: MIME type of the image
             metadata: Optional metadata to attach to the blob
+            overwrite: If False, only create the blob; an existing blob is
+                left untouched and None is returned
             
         Returns:
             GCS URL if successful, None otherwise
@@ -167,7 +318,131 @@ class GCSService:
             if metadata:
                 blob.metadata = metadata
             
-            blob.upload_from_string(image_bytes, content_type=content_type)
+            # chunk_size is left unset: payloads up to 8 MiB go up as a single
+            # multipart request and larger ones use the library's 100 MiB
+            # resumable chunks, so a smaller chunk_size would only add requests
+            # if_generation_match=0 makes GCS reject the write when the blob
+            # exists, without a separate existence check first
+            blob.upload_from_string(
+                image_bytes,
+                content_type=content_type,
+                if_generation_match=None if overwrite else 0,
+            )
+            self._forget_blob(blob_name)
+            
+            gcs_url = f"gs://{self.bucket_name}/{blob_name}"
+            logger.info(f"Image bytes uploaded to GCS: {gcs_url}")
+            return gcs_url
+            
+        except gcp_exceptions.PreconditionFailed:
+            logger.warning(f"Blob already exists, not overwriting: {blob_name}")
+            return None
+        except Exception as e:
+            logger.error(f"Error uploading image bytes to GCS: {e}")
+            return None
+    
+    def upload_images_batch(
+        self,
+        items: List[Tuple[bytes, str, str]],
+        max_workers: int = 8,
+        shared_metadata: Optional[Dict[str, str]] = None
+    ) -> List[Optional[str]]:
+        """
+        Upload several images concurrently.
+        
+        Uses the storage transfer manager's thread workers, which share the
+        client's connection pool; falls back to sequential uploads when the
+        transfer manager is not available.
+        
+        Args:
+            items: (image_bytes, blob_name, content_type) triples
+            max_workers: Maximum number of uploads in flight
+            shared_metadata: Optional metadata attached to every blob; the
+                one dict is shared rather than built per item
+            
+        Returns:
+            GCS URL per item in input order, None for items that failed
+        """
+        if not self.is_available:
+            logger.warning("GCS not available, cannot upload images")
+            return [None] * len(items)
+        
+        if not TRANSFER_MANAGER_AVAILABLE:
+            return [
+                self.upload_image_bytes(image_bytes, blob_name, content_type, shared_metadata)
+                for image_bytes, blob_name, content_type in items
+            ]
+        
+        try:
+            file_blob_pairs = []
+            for image_bytes, blob_name, content_type in items:
+                blob = self._bucket.blob(blob_name)
+                blob.content_type = content_type
+                if shared_metadata:
+                    blob.metadata = shared_metadata
+                file_blob_pairs.append((io.BytesIO(image_bytes), blob))
+            
+            # Threads, not processes: in-memory buffers cannot be sent to
+            # worker processes, and the uploads are network-bound anyway
+            results = transfer_manager.upload_many(
+                file_blob_pairs,
+                max_workers=max_workers,
+                worker_type=transfer_manager.THREAD,
+                raise_exception=False,
+            )
+        except Exception as e:
+            logger.error(f"Error uploading image batch to GCS: {e}")
+            return [None] * len(items)
+        
+        gcs_urls = []
+        for (_, blob_name, _), result in zip(items, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error uploading image to GCS: {blob_name}: {result}")
+                gcs_urls.append(None)
+            else:
+                self._forget_blob(blob_name)
+                gcs_urls.append(f"gs://{self.bucket_name}/{blob_name}")
+        
+        logger.info(f"Uploaded {sum(url is not None for url in gcs_urls)}/{len(items)} images to GCS")
+        return gcs_urls
+    
+    async def aupload_image_bytes(
+        self,
+        image_bytes: bytes,
+        blob_name: str,
+        content_type: str = "image/jpeg",
+        metadata: Optional[Dict[str, str]] = None
+    ) -> Optional[str]:
+        """
+        Async upload_image_bytes on the event loop via gcloud-aio-storage.
+        
+        Falls back to running upload_image_bytes in a worker thread when
+        gcloud-aio-storage is not installed.
+        
+        Args:
+            image_bytes: Raw image bytes
+            blob_name: Name for the blob in GCS
+            content_type: MIME type of the image
+            metadata: Optional metadata to attach to the blob
+            
+        Returns:
+            GCS URL if successful, None otherwise
+        """
+        aio_storage = self._get_aio_storage()
+        if aio_storage is None:
+            return await asyncio.to_thread(
+                self.upload_image_bytes, image_bytes, blob_name, content_type, metadata
+            )
+        
+        try:
+            await aio_storage.upload(
+                self.bucket_name,
+                blob_name,
+                image_bytes,
+                content_type=content_type,
+                metadata={"metadata": metadata} if metadata else None,
+            )
+            self._forget_blob(blob_name)
             
             gcs_url = f"gs://{self.bucket_name}/{blob_name}"
             logger.info(f"Image bytes uploaded to GCS: {gcs_url}")
@@ -181,6 +456,9 @@ class GCSService:
         """
         Download image bytes from GCS.
         
+        Recently downloaded blobs are kept in memory and served again while
+        their generation is unchanged, saving the body transfer.
+        
         Args:
             blob_name: Name of the blob in GCS
             
@@ -192,13 +470,25 @@ class GCSService:
             return None
         
         try:
-            blob = self._bucket.blob(blob_name)
+            # Same round-trip as blob.exists(), but also returns the size
+            # and generation
+            blob = self._bucket.get_blob(blob_name)
             
-            if not blob.exists():
+            if blob is None:
                 logger.warning(f"Blob does not exist: {blob_name}")
+                self._forget_blob(blob_name)
                 return None
             
-            image_bytes = blob.download_as_bytes()
+            cached = self._get_download(blob_name, blob.generation)
+            if cached is not None:
+                logger.debug(f"Image served from download cache: {blob_name}")
+                return cached
+            
+            if TRANSFER_MANAGER_AVAILABLE and (blob.size or 0) > _CHUNKED_DOWNLOAD_THRESHOLD:
+                image_bytes = self._download_chunked(blob)
+            else:
+                image_bytes = blob.download_as_bytes()
+            self._set_download(blob_name, blob.generation, image_bytes)
             logger.info(f"Image downloaded from GCS: {blob_name}")
             return image_bytes
             
@@ -206,6 +496,141 @@ class GCSService:
             logger.error(f"Error downloading image from GCS: {e}")
             return None
     
+    def _get_download(self, blob_name: str, generation: int) -> Optional[bytes]:
+        """Get a cached download if it is still the blob's current generation."""
+        with self._downloads_lock:
+            entry = self._downloads.get(blob_name)
+            if entry is None or entry[0] != generation:
+                return None
+            self._downloads.move_to_end(blob_name)
+            return entry[1]
+    
+    def _set_download(self, blob_name: str, generation: int, content: bytes):
+        """Cache a download, evicting the least recently used to stay in budget."""
+        # Large blobs would evict many small, frequently reused ones
+        if len(content) > min(self.download_cache_max_entry_bytes, self.download_cache_bytes // 4):
+            return
+        with self._downloads_lock:
+            old = self._downloads.pop(blob_name, None)
+            if old is not None:
+                self._downloads_size -= len(old[1])
+            self._downloads[blob_name] = (generation, content)
+            self._downloads_size += len(content)
+            while self._downloads_size > self.download_cache_bytes:
+                _, (_, evicted) = self._downloads.popitem(last=False)
+                self._downloads_size -= len(evicted)
+    
+    def _forget_blob(self, blob_name: str):
+        """Drop a blob's cached download and signed URLs once it is gone."""
+        with self._downloads_lock:
+            old = self._downloads.pop(blob_name, None)
+            if old is not None:
+                self._downloads_size -= len(old[1])
+        with self._signed_urls_lock:
+            for key in self._signed_url_keys.pop(blob_name, ()):
+                del self._signed_urls[key]
+    
+    def _drop_signed_url(self, key: Tuple[str, str, int]):
+        """Remove one signed URL and its index entry (lock held)."""
+        del self._signed_urls[key]
+        keys = self._signed_url_keys[key[0]]
+        keys.discard(key)
+        if not keys:
+            del self._signed_url_keys[key[0]]
+    
+    def _download_chunked(self, blob, max_workers: int = 8) -> bytes:
+        """Download a large blob as parallel ranged GETs through a temp file."""
+        fd, tmp_path = tempfile.mkstemp(prefix="gcs_download_")
+        os.close(fd)
+        try:
+            transfer_manager.download_chunks_concurrently(
+                blob,
+                tmp_path,
+                chunk_size=_DOWNLOAD_CHUNK_SIZE,
+                max_workers=max_workers,
+                worker_type=transfer_manager.THREAD,
+            )
+            with open(tmp_path, 'rb') as f:
+                return f.read()
+        finally:
+            os.remove(tmp_path)
+    
+    def download_image_range(self, blob_name: str, start: int, size: int) -> Optional[bytes]:
+        """
+        Download part of a blob with a single ranged GET.
+        
+        Args:
+            blob_name: Name of the blob in GCS
+            start: Offset of the first byte
+            size: Number of bytes to read
+            
+        Returns:
+            The bytes if successful, None otherwise
+        """
+        if not self.is_available:
+            logger.warning("GCS not available, cannot download image range")
+            return None
+        
+        try:
+            # end is inclusive
+            return self._bucket.blob(blob_name).download_as_bytes(start=start, end=start + size - 1)
+        except gcp_exceptions.NotFound:
+            logger.warning(f"Blob does not exist: {blob_name}")
+            return None
+        except Exception as e:
+            logger.error(f"Error downloading image range from GCS: {e}")
+            return None
+    
+    def get_metadata(self, blob_name: str) -> Optional[Dict[str, str]]:
+        """
+        Get a blob's custom metadata.
+        
+        Args:
+            blob_name: Name of the blob in GCS
+            
+        Returns:
+            Metadata dict (empty if none is set), None if the blob is missing
+        """
+        if not self.is_available:
+            logger.warning("GCS not available, cannot read metadata")
+            return None
+        
+        try:
+            blob = self._bucket.get_blob(blob_name)
+            if blob is None:
+                logger.warning(f"Blob does not exist: {blob_name}")
+                return None
+            return blob.metadata or {}
+        except Exception as e:
+            logger.error(f"Error reading metadata from GCS: {e}")
+            return None
+    
+    async def adownload_image(self, blob_name: str) -> Optional[bytes]:
+        """
+        Async download_image on the event loop via gcloud-aio-storage.
+        
+        Args:
+            blob_name: Name of the blob in GCS
+            
+        Returns:
+            Image bytes if successful, None otherwise
+        """
+        aio_storage = self._get_aio_storage()
+        if aio_storage is None:
+            return await asyncio.to_thread(self.download_image, blob_name)
+        
+        try:
+            image_bytes = await aio_storage.download(self.bucket_name, blob_name)
+            logger.info(f"Image downloaded from GCS: {blob_name}")
+            return image_bytes
+            
+        except Exception as e:
+            if getattr(e, "status", None) == 404:
+                logger.warning(f"Blob does not exist: {blob_name}")
+            else:
+                logger.error(f"Error downloading image from GCS: {e}")
+            return None
+    
     def delete_image(self, blob_name: str) -> bool:
         """
         Delete an image from GCS.
@@ -221,62 +646,180 @@ class GCSService:
             return False
         
         try:
-            blob = self._bucket.blob(blob_name)
+            # Delete directly; a missing blob comes back as NotFound, so a
+            # prior exists() check would only add a round-trip
+            self._bucket.blob(blob_name).delete()
+            self._forget_blob(blob_name)
+            logger.info(f"Image deleted from GCS: {blob_name}")
+            return True
             
-            if blob.exists():
-                blob.delete()
-                logger.info(f"Image deleted from GCS: {blob_name}")
-                return True
-            else:
-                logger.warning(f"Blob does not exist for deletion: {blob_name}")
-                return False
-                
+        except gcp_exceptions.NotFound:
+            logger.warning(f"Blob does not exist for deletion: {blob_name}")
+            return False
         except Exception as e:
             logger.error(f"Error deleting image from GCS: {e}")
             return False
     
-    def list_images(self, prefix: str = "") -> list:
+    def delete_images(self, blob_names: List[str]) -> int:
+        """
+        Delete several images, up to 100 per batched HTTP request.
+        
+        Blobs that are already gone are not treated as errors.
+        
+        Args:
+            blob_names: Names of the blobs to delete
+            
+        Returns:
+            Number of blobs whose delete request was sent successfully
+        """
+        if not self.is_available:
+            logger.warning("GCS not available, cannot delete images")
+            return 0
+        
+        deleted = 0
+        for start in range(0, len(blob_names), _GCS_BATCH_LIMIT):
+            chunk = blob_names[start:start + _GCS_BATCH_LIMIT]
+            try:
+                # Calls inside the batch are queued and sent as one
+                # multipart/mixed request when the block exits
+                with self._client.batch(raise_exception=False):
+                    for blob_name in chunk:
+                        self._bucket.delete_blob(blob_name)
+                deleted += len(chunk)
+                for blob_name in chunk:
+                    self._forget_blob(blob_name)
+            except Exception as e:
+                logger.error(f"Error deleting {len(chunk)} images from GCS: {e}")
+        
+        logger.info(f"Deleted {deleted}/{len(blob_names)} images from GCS")
+        return deleted
+    
+    async def adelete_image(self, blob_name: str) -> bool:
+        """
+        Async delete_image on the event loop via gcloud-aio-storage.
+        
+        Args:
+            blob_name: Name of the blob to delete
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        aio_storage = self._get_aio_storage()
+        if aio_storage is None:
+            return await asyncio.to_thread(self.delete_image, blob_name)
+        
+        try:
+            await aio_storage.delete(self.bucket_name, blob_name)
+            self._forget_blob(blob_name)
+            logger.info(f"Image deleted from GCS: {blob_name}")
+            return True
+            
+        except Exception as e:
+            if getattr(e, "status", None) == 404:
+                logger.warning(f"Blob does not exist for deletion: {blob_name}")
+            else:
+                logger.error(f"Error deleting image from GCS: {e}")
+            return False
+    
+    def _get_aio_storage(self):
+        """Get the gcloud-aio Storage client for the running loop, or None if unavailable."""
+        if not GCLOUD_AIO_AVAILABLE or not self.is_available:
+            return None
+        loop = asyncio.get_running_loop()
+        if self._aio_loop is not loop:
+            # Its aiohttp session is bound to the loop that created it, so
+            # the old one is closed there before a client is built for this loop
+            self._close_stale_aio_storage()
+            service_file = (
+                self.service_account_key_path
+                if self.service_account_key_path and os.path.exists(self.service_account_key_path)
+                else None
+            )
+            self._aio_storage = AioStorage(service_file=service_file)
+            self._aio_loop = loop
+        return self._aio_storage
+    
+    def _close_stale_aio_storage(self):
+        """Close the client of a previous event loop on that loop, if it still runs."""
+        old_storage, old_loop = self._aio_storage, self._aio_loop
+        self._aio_storage = None
+        self._aio_loop = None
+        if old_storage is not None and old_loop is not None and old_loop.is_running():
+            asyncio.run_coroutine_threadsafe(old_storage.close(), old_loop)
+    
+    async def aclose(self):
+        """Close the gcloud-aio client and its aiohttp session."""
+        if self._aio_loop is not asyncio.get_running_loop():
+            self._close_stale_aio_storage()
+            return
+        aio_storage = self._aio_storage
+        self._aio_storage = None
+        self._aio_loop = None
+        try:
+            await aio_storage.close()
+        except Exception as e:
+            logger.warning(f"Error closing GCS async client: {e}")
+    
+    def list_images(
+        self,
+        prefix: str = "",
+        page_size: int = 1000,
+        start_offset: Optional[str] = None,
+        end_offset: Optional[str] = None,
+    ) -> Iterator[str]:
         """
         List images in the bucket with optional prefix filter.
         
+        Names are yielded as each page arrives rather than after every page
+        has been fetched, and only the name field is requested per object.
+        
         Args:
             prefix: Optional prefix to filter blobs
+            page_size: Number of blobs fetched per request
+            start_offset: Only list names >= this one
+            end_offset: Only list names < this one
             
-        Returns:
-            List of blob names
+        Yields:
+            Blob names
         """
         if not self.is_available:
             logger.warning("GCS not available, cannot list images")
-            return []
+            return
         
+        count = 0
         try:
-            blobs = self._bucket.list_blobs(prefix=prefix)
-            blob_names = [blob.name for blob in blobs]
-            logger.info(f"Listed {len(blob_names)} images from GCS with prefix '{prefix}'")
-            return blob_names
+            blobs = self._bucket.list_blobs(
+                prefix=prefix,
+                page_size=page_size,
+                start_offset=start_offset,
+                end_offset=end_offset,
+                fields="items(name),nextPageToken",
+            )
+            for blob in blobs:
+                count += 1
+                yield blob.name
+            logger.info(f"Listed {count} images from GCS with prefix '{prefix}'")
             
         except Exception as e:
             logger.error(f"Error listing images from GCS: {e}")
-            return []
     
     def get_public_url(self, blob_name: str) -> Optional[str]:
         """
         Get the public URL for a blob.
         
+        The URL is built locally without checking that the blob exists.
+        
         Args:
             blob_name: Name of the blob
             
         Returns:
-            Public URL if blob exists, None otherwise
+            Public URL, or None if GCS is not available
         """
         if not self.is_available:
             return None
         
         try:
-            blob = self._bucket.blob(blob_name)
-            if blob.exists():
-                return blob.public_url
-            return None
+            return self._bucket.blob(blob_name).public_url
         except Exception as e:
             logger.error(f"Error getting public URL for {blob_name}: {e}")
             return None
@@ -290,6 +833,10 @@ class GCSService:
         """
         Generate a signed URL for secure access to a blob.
         
+        Signing is CPU-bound, so a URL is reused for the same blob, method
+        and expiration for signed_url_cache_ttl seconds, but never past half
+        its lifetime; callers always get at least half the requested validity.
+        
         Args:
             blob_name: Name of the blob
             expiration_minutes: URL expiration time in minutes
@@ -301,11 +848,25 @@ class GCSService:
         if not self.is_available:
             return None
         
+        key = (blob_name, method, expiration_minutes)
+        max_age = min(self.signed_url_cache_ttl, expiration_minutes * 30)
+        with self._signed_urls_lock:
+            entry = self._signed_urls.get(key)
+            if entry is not None:
+                if time.monotonic() - entry[0] < max_age:
+                    self._signed_urls.move_to_end(key)
+                    self._signed_url_hits += 1
+                    return entry[1]
+                self._drop_signed_url(key)
+            self._signed_url_misses += 1
+            lookups = self._signed_url_hits + self._signed_url_misses
+        logger.debug(f"Signed URL cache hit ratio: {self._signed_url_hits / lookups:.0%} of {lookups}")
+        
         try:
-            from datetime import datetime, timedelta
-            
+            signed_at = time.monotonic()
             blob = self._bucket.blob(blob_name)
-            expiration = datetime.utcnow() + timedelta(minutes=expiration_minutes)
+            # A timedelta is taken relative to the signing time by the client
+            expiration = timedelta(minutes=expiration_minutes)
             
             signed_url = blob.generate_signed_url(
                 expiration=expiration,
@@ -313,6 +874,14 @@ class GCSService:
                 version="v4"
             )
             
+            if max_age > 0:
+                with self._signed_urls_lock:
+                    self._signed_urls[key] = (signed_at, signed_url)
+                    self._signed_urls.move_to_end(key)
+                    self._signed_url_keys.setdefault(blob_name, set()).add(key)
+                    while len(self._signed_urls) > _SIGNED_URL_CACHE_SIZE:
+                        self._drop_signed_url(next(iter(self._signed_urls)))
+            
             logger.info(f"Generated signed URL for {blob_name} (expires in {expiration_minutes} min)")
             return signed_url
             
@@ -323,25 +892,45 @@ class GCSService:
 
 # Global GCS service instance
 _gcs_service = None
+_gcs_service_lock = threading.Lock()
 
 def get_gcs_service() -> GCSService:
     """Get the global GCS service instance."""
     global _gcs_service
     
     if _gcs_service is None:
-        from app.core.config import settings
-        
-        bucket_name = getattr(settings, 'GCS_BUCKET_NAME', None)
-        service_account_key = getattr(settings, 'GCS_SERVICE_ACCOUNT_KEY', None)
-        
-        if bucket_name:
-            _gcs_service = GCSService(
-                bucket_name=bucket_name,
-                service_account_key_path=service_account_key
-            )
-        else:
-            logger.warning("GCS_BUCKET_NAME not configured")
-            # Create a dummy service that will always return is_available=False
-            _gcs_service = GCSService("")
+        # Construction does network I/O, so concurrent first callers must
+        # not each build their own client
+        with _gcs_service_lock:
+            if _gcs_service is None:
+                _gcs_service = _create_gcs_service()
     
     return _gcs_service
+
+
+async def aclose_gcs_service():
+    """Close the global GCS service's async client, if the service was created."""
+    if _gcs_service is not None:
+        await _gcs_service.aclose()
+
+
+def _create_gcs_service() -> GCSService:
+    """Build the GCS service from settings."""
+    from app.core.config import settings
+    
+    bucket_name = getattr(settings, 'GCS_BUCKET_NAME', None)
+    service_account_key = getattr(settings, 'GCS_SERVICE_ACCOUNT_KEY', None)
+    
+    if bucket_name:
+        return GCSService(
+            bucket_name=bucket_name,
+            service_account_key_path=service_account_key,
+            http_pool_size=settings.GCS_HTTP_POOL_SIZE,
+            signed_url_cache_ttl=settings.GCS_SIGNED_URL_CACHE_TTL,
+            download_cache_bytes=settings.GCS_DOWNLOAD_CACHE_BYTES,
+            download_cache_max_entry_bytes=settings.GCS_DOWNLOAD_CACHE_MAX_ENTRY_BYTES
+        )
+    else:
+        logger.warning("GCS_BUCKET_NAME not configured")
+        # Create a dummy service that will always return is_available=False
+        return GCSService("")
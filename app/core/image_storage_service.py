@@ -5,16 +5,47 @@ This service provides a consistent interface for storing and retrieving images,
 abstracting away the underlying storage mechanism.
 """
 
-from typing import Optional, Dict, Any
+import asyncio
+import io
+import mmap
+import os
+import tarfile
+import threading
+import time
+import uuid
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Iterable, List, Mapping, Tuple, Union
 from pathlib import Path
-from PIL import Image
+import orjson
+from PIL import Image, features
 
 from app.core.config import settings
 from app.core.gcs_service import get_gcs_service
 from app.core.logging_config import get_logger
+from app.core.user_id_utils import normalize_user_id
 
 logger = get_logger(__name__)
 
+# GCS rejects objects whose custom metadata keys and values exceed this in total
+_GCS_METADATA_LIMIT = 8 * 1024
+
+# ClothingAttributionService, resolved on first use: its module imports this one
+_attribution_service = None
+
+
+def _get_attribution_service():
+    """Get ClothingAttributionService without importing it on every call."""
+    global _attribution_service
+    
+    if _attribution_service is None:
+        from app.services.attribution_service import ClothingAttributionService
+        _attribution_service = ClothingAttributionService
+    
+    return _attribution_service
+
 
 class ImageStorageService:
     """Service for storing and retrieving images using either local storage or GCS."""
@@ -22,6 +53,12 @@ class ImageStorageService:
     def __init__(self):
         """Initialize the image storage service."""
         self.use_gcs = settings.USE_GCS and bool(settings.GCS_BUCKET_NAME)
+        self._gcs_prefix = f"gs://{settings.GCS_BUCKET_NAME}/"
+        # Created on first pooled call
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+        # Built on first get_storage_info call
+        self._storage_info: Optional[Dict[str, Any]] = None
         
         if self.use_gcs:
             self.gcs_service = get_gcs_service()
@@ -33,112 +70,455 @@ class ImageStorageService:
         
         if not self.use_gcs:
             logger.info("Using local filesystem for image storage")
+        
+        if not features.check_feature("libjpeg_turbo"):
+            logger.warning("Pillow is not built with libjpeg-turbo; JPEG encoding will be slower")
     
     def save_processed_image(
         self, 
-        image: Image.Image, 
+        image: Union[Image.Image, bytes, memoryview, Path], 
         unique_filename: str, 
-        user_id: str = None
+        user_id: str = None,
+        target_size: Optional[Tuple[int, int]] = None
     ) -> Optional[str]:
         """
         Save a processed image using the configured storage backend.
         
+        Already encoded JPEG data (bytes, a buffer or a file path) is stored
+        as-is; only PIL images are encoded.
+        
         Args:
-            image: PIL Image object to save
+            image: PIL Image, or JPEG bytes/buffer/file path to save
             unique_filename: Unique filename for the image
             user_id: User ID for organizing images
+            target_size: Optional (width, height) a PIL image is scaled down
+                to fit before encoding, e.g. for thumbnails
             
         Returns:
             Storage path/URL if successful, None otherwise
         """
         if not settings.SAVE_IMAGES or not settings.SAVE_PROCESSED:
-            logger.info(f"[user={user_id}] Skipping image save (SAVE_IMAGES or SAVE_PROCESSED is False)")
+            logger.info("[user=%s] Skipping image save (SAVE_IMAGES or SAVE_PROCESSED is False)", user_id)
+            return None
+        
+        try:
+            image_bytes = self._to_jpeg_bytes(image, target_size)
+        except Exception as e:
+            logger.error("[user=%s] Error encoding image: %s", user_id, e)
             return None
         
         if self.use_gcs:
-            return self._save_to_gcs(image, unique_filename, user_id)
+            return self._save_to_gcs(image_bytes, unique_filename, user_id)
         else:
-            return self._save_to_local(image, unique_filename, user_id)
+            return self._save_to_local(image_bytes, unique_filename, user_id)
     
-    def _save_to_gcs(
-        self, 
-        image: Image.Image, 
-        unique_filename: str, 
+    def save_processed_images_bulk(
+        self, items: Iterable[Tuple[Image.Image, str, Optional[str]]]
+    ) -> List[Optional[str]]:
+        """
+        Save several processed images concurrently.
+        
+        Each image is encoded and stored on its own pool thread, so the
+        upload round-trips overlap (Pillow releases the GIL while encoding).
+        
+        Args:
+            items: (image, unique_filename, user_id) triples
+            
+        Returns:
+            Storage path/URL per item in input order, None for items not saved
+        """
+        return list(self._get_pool().map(lambda item: self.save_processed_image(*item), items))
+    
+    def save_processed_image_bundle(
+        self,
+        images: Iterable[Tuple[Union[Image.Image, bytes, memoryview, Path], str]],
         user_id: str = None
     ) -> Optional[str]:
-        """Save image to Google Cloud Storage."""
-        try:
-            # Create GCS blob path
-            file_path = Path(unique_filename)
-            processed_filename = f"{file_path.stem}_processed.jpg"
+        """
+        Save several related processed images as one tar object.
+        
+        One upload replaces one per image. Use get_image_from_bundle to read a
+        single image back; on GCS the member offsets are kept in the object's
+        metadata, so that costs a metadata read plus one ranged GET. That
+        metadata is capped at 8 KiB, so GCS bundles hold roughly 100 images.
+        
+        Args:
+            images: (image, unique_filename) pairs, as for save_processed_image
+            user_id: User ID for organizing images
             
-            # Organize by user if specified
+        Returns:
+            Storage path/URL of the bundle if successful, None otherwise
+        """
+        if not settings.SAVE_IMAGES or not settings.SAVE_PROCESSED:
+            logger.info("[user=%s] Skipping image bundle save (SAVE_IMAGES or SAVE_PROCESSED is False)", user_id)
+            return None
+        
+        bundle_name = f"{uuid.uuid4().hex}.tar"
+        # member name -> (offset, size) of its data in the tar
+        manifest: Dict[str, Tuple[int, int]] = {}
+        try:
+            with io.BytesIO() as buffer:
+                # Uncompressed: JPEG data does not shrink further
+                with tarfile.open(fileobj=buffer, mode="w") as tar:
+                    now = time.time()
+                    for image, unique_filename in images:
+                        data = self._to_jpeg_bytes(image)
+                        info = tarfile.TarInfo(f"{Path(unique_filename).stem}_processed.jpg")
+                        info.size = len(data)
+                        info.mtime = now
+                        tar.addfile(info, io.BytesIO(data))
+                        # The data ends the archive so far, padded to a whole block
+                        padded = -(-info.size // tarfile.BLOCKSIZE) * tarfile.BLOCKSIZE
+                        manifest[info.name] = (tar.offset - padded, info.size)
+                bundle_bytes = buffer.getvalue()
+        except Exception as e:
+            logger.error("[user=%s] Error building image bundle: %s", user_id, e)
+            return None
+        
+        if self.use_gcs:
+            return self._save_bundle_to_gcs(bundle_bytes, bundle_name, manifest, user_id)
+        else:
+            return self._save_bundle_to_local(bundle_bytes, bundle_name, user_id)
+    
+    def _save_bundle_to_gcs(
+        self,
+        bundle_bytes: bytes,
+        bundle_name: str,
+        manifest: Dict[str, Tuple[int, int]],
+        user_id: str = None
+    ) -> Optional[str]:
+        """Upload a tar bundle to GCS, with its member offsets as metadata."""
+        try:
             if user_id and settings.CREATE_USER_SUBDIRS:
-                from app.core.user_id_utils import normalize_user_id
                 normalized_user_id = normalize_user_id(user_id, base_dir=settings.USER_DATA_DIRECTORY)
-                blob_name = f"{normalized_user_id}/processed/{processed_filename}"
+                blob_name = f"{normalized_user_id}/bundles/{bundle_name}"
             else:
-                blob_name = f"processed/{processed_filename}"
+                blob_name = f"bundles/{bundle_name}"
             
-            # Create metadata
             metadata = {
                 "user_id": user_id or "anonymous",
-                "original_filename": unique_filename,
-                "processed_filename": processed_filename,
+                "manifest": orjson.dumps(manifest).decode(),
                 "uploaded_by": "fashion-backend-api"
             }
-            
-            # Upload to GCS
-            gcs_url = self.gcs_service.upload_image(
-                image=image,
+            metadata_size = sum(len(k.encode()) + len(v.encode()) for k, v in metadata.items())
+            if metadata_size > _GCS_METADATA_LIMIT:
+                # Roughly 100 members fit; the upload would be rejected anyway
+                logger.error(
+                    "[user=%s] Image bundle of %s is too large for a GCS manifest (%s bytes of metadata)",
+                    user_id, len(manifest), metadata_size
+                )
+                return None
+            gcs_url = self.gcs_service.upload_image_bytes(
+                image_bytes=bundle_bytes,
                 blob_name=blob_name,
+                content_type="application/x-tar",
+                metadata=metadata
+            )
+            
+            if gcs_url:
+                logger.info("[user=%s] Image bundle of %s saved to GCS: %s", user_id, len(manifest), blob_name)
+            else:
+                logger.error("[user=%s] Failed to save image bundle to GCS", user_id)
+            return gcs_url
+            
+        except Exception as e:
+            logger.error("[user=%s] Error saving image bundle to GCS: %s", user_id, e)
+            return None
+    
+    def _save_bundle_to_local(
+        self,
+        bundle_bytes: bytes,
+        bundle_name: str,
+        user_id: str = None
+    ) -> Optional[str]:
+        """Write a tar bundle to the local filesystem."""
+        try:
+            bundles_dir = _get_attribution_service().ensure_images_directory(user_id) / "bundles"
+            bundles_dir.mkdir(exist_ok=True)
+            file_path = bundles_dir / bundle_name
+            self._write_file(file_path, bundle_bytes)
+            
+            logger.info("[user=%s] Image bundle saved locally: %s", user_id, file_path)
+            return str(file_path)
+            
+        except Exception as e:
+            logger.error("[user=%s] Error saving image bundle locally: %s", user_id, e)
+            return None
+    
+    def get_image_from_bundle(self, bundle_path: str, member: str) -> Optional[bytes]:
+        """
+        Read one image out of a bundle saved by save_processed_image_bundle.
+        
+        Args:
+            bundle_path: Local path or GCS URL of the bundle
+            member: Image name inside the bundle ("<stem>_processed.jpg")
+            
+        Returns:
+            Image bytes if found, None otherwise
+        """
+        try:
+            if bundle_path.startswith("gs://"):
+                blob_name = self._blob_name(bundle_path)
+                metadata = self.gcs_service.get_metadata(blob_name)
+                if not metadata or "manifest" not in metadata:
+                    return None
+                entry = orjson.loads(metadata["manifest"]).get(member)
+                if entry is None:
+                    logger.warning("Image %s not found in bundle %s", member, bundle_path)
+                    return None
+                offset, size = entry
+                if size == 0:
+                    return b""
+                return self.gcs_service.download_image_range(blob_name, offset, size)
+            
+            with tarfile.open(bundle_path, mode="r:") as tar:
+                try:
+                    return tar.extractfile(member).read()
+                except KeyError:
+                    logger.warning("Image %s not found in bundle %s", member, bundle_path)
+                    return None
+        except FileNotFoundError:
+            logger.warning("Image bundle not found: %s", bundle_path)
+            return None
+        except Exception as e:
+            logger.error("Error reading image bundle %s: %s", bundle_path, e)
+            return None
+    
+    async def asave_processed_image(
+        self,
+        image: Union[Image.Image, bytes, memoryview, Path],
+        unique_filename: str,
+        user_id: str = None,
+        target_size: Optional[Tuple[int, int]] = None
+    ) -> Optional[str]:
+        """
+        Async save_processed_image.
+        
+        The JPEG is encoded on the storage pool; GCS uploads then go out on
+        the event loop through the aiohttp-based client, so many uploads can
+        be in flight without a thread each. Local saves run on the pool.
+        """
+        if not self.use_gcs:
+            return await self._run_in_pool(
+                self.save_processed_image, image, unique_filename, user_id, target_size
+            )
+        
+        if not settings.SAVE_IMAGES or not settings.SAVE_PROCESSED:
+            logger.info("[user=%s] Skipping image save (SAVE_IMAGES or SAVE_PROCESSED is False)", user_id)
+            return None
+        
+        try:
+            image_bytes = await self._run_in_pool(self._to_jpeg_bytes, image, target_size)
+        except Exception as e:
+            logger.error("[user=%s] Error encoding image: %s", user_id, e)
+            return None
+        
+        try:
+            blob_name, metadata = self._gcs_target(unique_filename, user_id)
+            gcs_url = await self.gcs_service.aupload_image_bytes(
+                image_bytes, blob_name, "image/jpeg", metadata
+            )
+        except Exception as e:
+            logger.error("[user=%s] Error saving image to GCS: %s", user_id, e)
+            return None
+        
+        if gcs_url:
+            logger.info("[user=%s] Processed image saved to GCS: %s", user_id, blob_name)
+        else:
+            logger.error("[user=%s] Failed to save image to GCS", user_id)
+        return gcs_url
+    
+    async def aget_image(self, image_path: str) -> Optional[bytes]:
+        """Async get_image; the blocking read runs on the storage pool."""
+        return await self._run_in_pool(self.get_image, image_path)
+    
+    async def adelete_image(self, image_path: str) -> bool:
+        """Async delete_image; the blocking delete runs on the storage pool."""
+        return await self._run_in_pool(self.delete_image, image_path)
+    
+    async def _run_in_pool(self, func, *args):
+        """
+        Run one whole blocking storage call on the storage pool.
+        
+        A dedicated pool keeps JPEG encoding and uploads from queueing
+        behind model calls on the event loop's default executor.
+        """
+        return await asyncio.get_running_loop().run_in_executor(self._get_pool(), func, *args)
+    
+    def _get_pool(self) -> ThreadPoolExecutor:
+        """Get the shared thread pool used for storage calls and sharded listings."""
+        if self._pool is None:
+            with self._pool_lock:
+                if self._pool is None:
+                    self._pool = ThreadPoolExecutor(
+                        max_workers=settings.GCS_MAX_CONCURRENCY,
+                        thread_name_prefix="image-storage",
+                    )
+        return self._pool
+    
+    @staticmethod
+    def _fit_image(image: Image.Image, target_size: Tuple[int, int]) -> Image.Image:
+        """
+        Scale an image down to fit within target_size, keeping its aspect ratio.
+        
+        Args:
+            image: PIL Image object, ideally fresh from Image.open
+            target_size: Maximum (width, height)
+            
+        Returns:
+            The resized image, or the original if it already fits
+        """
+        # For a JPEG that is not loaded yet, libjpeg decodes straight to the
+        # smallest 1/2, 1/4 or 1/8 scale that is still at least target_size
+        image.draft("RGB", target_size)
+        scale = min(target_size[0] / image.width, target_size[1] / image.height)
+        if scale >= 1:
+            return image
+        
+        size = (max(1, round(image.width * scale)), max(1, round(image.height * scale)))
+        return image.resize(size, Image.Resampling.LANCZOS, reducing_gap=3.0)
+    
+    def _to_jpeg_bytes(
+        self,
+        image: Union[Image.Image, bytes, memoryview, Path],
+        target_size: Optional[Tuple[int, int]] = None
+    ) -> bytes:
+        """Get the JPEG bytes to store, encoding only PIL images."""
+        if isinstance(image, Image.Image):
+            if target_size:
+                image = self._fit_image(image, target_size)
+            return self._encode_jpeg(image)
+        elif isinstance(image, Path):
+            return image.read_bytes()
+        else:
+            return bytes(image)
+    
+    @staticmethod
+    def _encode_jpeg(image: Image.Image) -> bytes:
+        """
+        Encode an image as JPEG once, for whichever backend stores it.
+        
+        Stored images are encoded once and downloaded many times, so the
+        output is tuned for size (JPEG_OPTIMIZE, JPEG_PROGRESSIVE).
+        
+        A JPEG passed in unmodified (still a JpegImageFile, not resized or
+        converted) is re-encoded with its own quantization tables and
+        subsampling (quality="keep"), so it is not degraded a second time
+        by JPEG_QUALITY. Any edit returns a new image without them.
+        
+        Args:
+            image: PIL Image object to encode
+            
+        Returns:
+            JPEG bytes
+        """
+        image_to_save = image if image.mode in ("RGB", "L") else image.convert("RGB")
+        if (
+            settings.JPEG_KEEP_SOURCE_QUALITY
+            and image_to_save.format == "JPEG"
+            and getattr(image_to_save, "quantization", None)
+        ):
+            quality = subsampling = "keep"
+        else:
+            quality, subsampling = settings.JPEG_QUALITY, settings.JPEG_SUBSAMPLING
+        with io.BytesIO() as buffer:
+            image_to_save.save(
+                buffer,
                 format="JPEG",
-                quality=settings.JPEG_QUALITY,
+                quality=quality,
+                optimize=settings.JPEG_OPTIMIZE,
+                progressive=settings.JPEG_PROGRESSIVE,
+                subsampling=subsampling,
+            )
+            return buffer.getvalue()
+    
+    def _save_to_gcs(
+        self, 
+        image_bytes: bytes, 
+        unique_filename: str, 
+        user_id: str = None
+    ) -> Optional[str]:
+        """Save encoded image to Google Cloud Storage."""
+        try:
+            blob_name, metadata = self._gcs_target(unique_filename, user_id)
+            
+            # Upload the already encoded bytes to GCS
+            gcs_url = self.gcs_service.upload_image_bytes(
+                image_bytes=image_bytes,
+                blob_name=blob_name,
+                content_type="image/jpeg",
                 metadata=metadata
             )
             
             if gcs_url:
-                logger.info(f"[user={user_id}] Processed image saved to GCS: {blob_name}")
+                logger.info("[user=%s] Processed image saved to GCS: %s", user_id, blob_name)
                 return gcs_url
             else:
-                logger.error(f"[user={user_id}] Failed to save image to GCS")
+                logger.error("[user=%s] Failed to save image to GCS", user_id)
                 return None
                 
         except Exception as e:
-            logger.error(f"[user={user_id}] Error saving image to GCS: {e}")
+            logger.error("[user=%s] Error saving image to GCS: %s", user_id, e)
             return None
     
+    @staticmethod
+    def _gcs_target(unique_filename: str, user_id: str = None) -> Tuple[str, Dict[str, str]]:
+        """Get the blob name and metadata for a processed image."""
+        # Create GCS blob path
+        file_path = Path(unique_filename)
+        processed_filename = f"{file_path.stem}_processed.jpg"
+        
+        # Organize by user if specified
+        if user_id and settings.CREATE_USER_SUBDIRS:
+            normalized_user_id = normalize_user_id(user_id, base_dir=settings.USER_DATA_DIRECTORY)
+            blob_name = f"{normalized_user_id}/processed/{processed_filename}"
+        else:
+            blob_name = f"processed/{processed_filename}"
+        
+        # Create metadata
+        metadata = {
+            "user_id": user_id or "anonymous",
+            "original_filename": unique_filename,
+            "processed_filename": processed_filename,
+            "uploaded_by": "fashion-backend-api"
+        }
+        return blob_name, metadata
+    
     def _save_to_local(
         self, 
-        image: Image.Image, 
+        image_bytes: bytes, 
         unique_filename: str, 
         user_id: str = None
     ) -> Optional[str]:
-        """Save image to local filesystem."""
+        """Save encoded image to local filesystem."""
         try:
             # Use the existing local storage logic
-            from app.services.attribution_service import ClothingAttributionService
-            
-            images_dir = ClothingAttributionService.ensure_images_directory(user_id)
+            images_dir = _get_attribution_service().ensure_images_directory(user_id)
             processed_dir = images_dir / "processed"
             file_path = Path(unique_filename)
             processed_filename = f"{file_path.stem}_processed.jpg"
             file_path = processed_dir / processed_filename
-            image_to_save = image if image.mode in ("RGB", "L") else image.convert("RGB") 
-            image_to_save.save(
-                file_path, 
-                format="JPEG", 
-                quality=settings.JPEG_QUALITY, 
-                optimize=True
-            )
+            self._write_file(file_path, image_bytes)
             
-            logger.info(f"[user={user_id}] Processed image saved locally: {file_path}")
+            logger.info("[user=%s] Processed image saved locally: %s", user_id, file_path)
             return str(file_path)
             
         except Exception as e:
-            logger.error(f"[user={user_id}] Error saving image locally: {e}")
+            logger.error("[user=%s] Error saving image locally: %s", user_id, e)
             return None
     
+    @staticmethod
+    def _write_file(file_path: Path, data: bytes):
+        """Write a whole file with raw write() calls, bypassing Python's buffered I/O."""
+        fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            with memoryview(data) as view:
+                while view:
+                    # write() may be partial; the slice is a view, not a copy
+                    view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+    
     def get_image(self, image_path: str) -> Optional[bytes]:
         """
         Retrieve image bytes from storage.
@@ -154,17 +534,52 @@ class ImageStorageService:
         else:
             return self._get_from_local(image_path)
     
+    def get_image_buffer(self, image_path: str) -> Optional[Union[bytes, memoryview]]:
+        """
+        Retrieve an image as a read-only buffer.
+        
+        Like get_image, but local files are memory-mapped instead of copied
+        into a bytes object; use it for consumers that accept any buffer
+        (Image.open(io.BytesIO(...)), hashing, response bodies).
+        
+        Args:
+            image_path: Local path or GCS URL
+            
+        Returns:
+            Image buffer if found, None otherwise
+        """
+        if image_path.startswith("gs://"):
+            return self._get_from_gcs(image_path)
+        else:
+            return self._get_from_local_mmap(image_path)
+    
     def _get_from_gcs(self, gcs_url: str) -> Optional[bytes]:
         """Get image from GCS."""
         try:
-            # Extract blob name from GCS URL
-            # gs://bucket-name/path/to/file.jpg -> path/to/file.jpg
-            blob_name = gcs_url.replace(f"gs://{settings.GCS_BUCKET_NAME}/", "")
-            return self.gcs_service.download_image(blob_name)
+            return self.gcs_service.download_image(self._blob_name(gcs_url))
         except Exception as e:
-            logger.error(f"Error retrieving image from GCS: {e}")
+            logger.error("Error retrieving image from GCS: %s", e)
             return None
     
+    def _blob_name(self, gcs_url: str) -> str:
+        """
+        Extract the blob name from a GCS URL in the configured bucket.
+        
+        gs://bucket-name/path/to/file.jpg -> path/to/file.jpg
+        
+        Args:
+            gcs_url: GCS URL
+            
+        Returns:
+            Blob name
+            
+        Raises:
+            ValueError: If the URL is not in the configured bucket
+        """
+        if not gcs_url.startswith(self._gcs_prefix):
+            raise ValueError(f"GCS URL is not in bucket '{settings.GCS_BUCKET_NAME}': {gcs_url}")
+        return gcs_url[len(self._gcs_prefix):]
+    
     def _get_from_local(self, file_path: str) -> Optional[bytes]:
         """Get image from local filesystem."""
         try:
@@ -172,12 +587,69 @@ class ImageStorageService:
             if path.exists():
                 return path.read_bytes()
             else:
-                logger.warning(f"Local image file not found: {file_path}")
+                logger.warning("Local image file not found: %s", file_path)
                 return None
         except Exception as e:
-            logger.error(f"Error reading local image file: {e}")
+            logger.error("Error reading local image file: %s", e)
             return None
     
+    def _get_from_local_mmap(self, file_path: str) -> Optional[memoryview]:
+        """Map a local image file read-only."""
+        try:
+            with open(file_path, "rb") as f:
+                # The view holds a reference to the map, which stays valid
+                # after the file is closed and is unmapped once the view is freed
+                return memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+        except FileNotFoundError:
+            logger.warning("Local image file not found: %s", file_path)
+            return None
+        except ValueError:
+            # Empty files cannot be mapped
+            return memoryview(b"")
+        except Exception as e:
+            logger.error("Error reading local image file: %s", e)
+            return None
+    
+    def sendfile_to(self, file_path: str, out_fd: int) -> Optional[int]:
+        """
+        Copy a local image to a socket or file descriptor with os.sendfile.
+        
+        The data moves inside the kernel without being read into Python, so
+        nothing on the Python side can transform it on the way. HTTP routes
+        should return a FileResponse instead, which Starlette already sends
+        this way.
+        
+        Args:
+            file_path: Local image path
+            out_fd: Descriptor to write to (e.g. socket.fileno())
+        
+        Returns:
+            Number of bytes sent, or None if the file could not be sent
+        """
+        try:
+            in_fd = os.open(file_path, os.O_RDONLY)
+        except FileNotFoundError:
+            logger.warning("Local image file not found: %s", file_path)
+            return None
+        except Exception as e:
+            logger.error("Error reading local image file: %s", e)
+            return None
+        
+        try:
+            size = os.fstat(in_fd).st_size
+            offset = 0
+            while offset < size:
+                sent = os.sendfile(out_fd, in_fd, offset, size - offset)
+                if sent == 0:
+                    break
+                offset += sent
+            return offset
+        except Exception as e:
+            logger.error("Error sending local image file %s: %s", file_path, e)
+            return None
+        finally:
+            os.close(in_fd)
+    
     def delete_image(self, image_path: str) -> bool:
         """
         Delete an image from storage.
@@ -193,13 +665,43 @@ class ImageStorageService:
         else:
             return self._delete_from_local(image_path)
     
+    def delete_images(self, image_paths: List[str]) -> int:
+        """
+        Delete several images from storage.
+        
+        GCS images are deleted in batched requests (up to 100 per round-trip)
+        rather than one request each.
+        
+        Args:
+            image_paths: Local paths or GCS URLs
+            
+        Returns:
+            Number of images deleted
+        """
+        blob_names = []
+        deleted = 0
+        for image_path in image_paths:
+            if image_path.startswith("gs://"):
+                try:
+                    blob_names.append(self._blob_name(image_path))
+                except ValueError as e:
+                    logger.error("Error deleting image from GCS: %s", e)
+            elif self._delete_from_local(image_path):
+                deleted += 1
+        
+        if blob_names:
+            try:
+                deleted += self.gcs_service.delete_images(blob_names)
+            except Exception as e:
+                logger.error("Error deleting %s images from GCS: %s", len(blob_names), e)
+        return deleted
+    
     def _delete_from_gcs(self, gcs_url: str) -> bool:
         """Delete image from GCS."""
         try:
-            blob_name = gcs_url.replace(f"gs://{settings.GCS_BUCKET_NAME}/", "")
-            return self.gcs_service.delete_image(blob_name)
+            return self.gcs_service.delete_image(self._blob_name(gcs_url))
         except Exception as e:
-            logger.error(f"Error deleting image from GCS: {e}")
+            logger.error("Error deleting image from GCS: %s", e)
             return False
     
     def _delete_from_local(self, file_path: str) -> bool:
@@ -208,13 +710,13 @@ class ImageStorageService:
             path = Path(file_path)
             if path.exists():
                 path.unlink()
-                logger.info(f"Deleted local image: {file_path}")
+                logger.info("Deleted local image: %s", file_path)
                 return True
             else:
-                logger.warning(f"Local image file not found for deletion: {file_path}")
+                logger.warning("Local image file not found for deletion: %s", file_path)
                 return False
         except Exception as e:
-            logger.error(f"Error deleting local image file: {e}")
+            logger.error("Error deleting local image file: %s", e)
             return False
     
     def list_user_images(self, user_id: str) -> list:
@@ -232,38 +734,84 @@ class ImageStorageService:
         else:
             return self._list_from_local(user_id)
     
+    async def alist_user_images(self, user_id: str) -> list:
+        """
+        Async list_user_images; the listing runs in a worker thread.
+        
+        Not on the storage pool: sharded listings submit their ranges there
+        and would wait on themselves if every pool thread were listing.
+        """
+        return await asyncio.to_thread(self.list_user_images, user_id)
+    
     def _list_from_gcs(self, user_id: str) -> list:
         """List user images from GCS."""
         try:
             if settings.CREATE_USER_SUBDIRS:
-                from app.core.user_id_utils import normalize_user_id
                 normalized_user_id = normalize_user_id(user_id, base_dir=settings.USER_DATA_DIRECTORY)
                 prefix = f"{normalized_user_id}/processed/"
             else:
                 prefix = "processed/"
             
-            blob_names = self.gcs_service.list_images(prefix=prefix)
+            if settings.GCS_LIST_SHARD_MONTHS > 0:
+                blob_names = self._list_gcs_sharded(prefix, settings.GCS_LIST_SHARD_MONTHS)
+            else:
+                blob_names = self.gcs_service.list_images(prefix=prefix)
             # Convert to full GCS URLs
-            return [f"gs://{settings.GCS_BUCKET_NAME}/{blob_name}" for blob_name in blob_names]
+            return [self._gcs_prefix + blob_name for blob_name in blob_names]
         except Exception as e:
-            logger.error(f"Error listing images from GCS for user {user_id}: {e}")
+            logger.error("Error listing images from GCS for user %s: %s", user_id, e)
             return []
     
+    def _list_gcs_sharded(self, prefix: str, months: int) -> List[str]:
+        """
+        List blobs under a prefix as several key ranges fetched in parallel.
+        
+        Image names start with a YYYYMMDD timestamp, so the key space is cut
+        at the start of each of the last few months. The ranges are open at
+        both ends, so names that don't follow the pattern are still listed
+        exactly once, and the result keeps the order of a single listing.
+        
+        Args:
+            prefix: Blob name prefix
+            months: Number of recent months to cut at
+            
+        Returns:
+            Blob names
+        """
+        now = datetime.now()
+        year, month = now.year, now.month
+        cuts = []
+        for _ in range(months):
+            cuts.append(f"{prefix}{year:04d}{month:02d}")
+            year, month = (year, month - 1) if month > 1 else (year - 1, 12)
+        cuts.reverse()
+        
+        bounds = zip([None] + cuts, cuts + [None])
+        shards = self._get_pool().map(
+            lambda bound: list(self.gcs_service.list_images(
+                prefix=prefix, start_offset=bound[0], end_offset=bound[1]
+            )),
+            bounds,
+        )
+        return [name for shard in shards for name in shard]
+    
     def _list_from_local(self, user_id: str) -> list:
         """List user images from local filesystem."""
         try:
-            from app.services.attribution_service import ClothingAttributionService
-            
-            images_dir = ClothingAttributionService.ensure_images_directory(user_id)
+            images_dir = _get_attribution_service().ensure_images_directory(user_id)
             processed_dir = images_dir / "processed"
             
-            if processed_dir.exists():
-                image_files = list(processed_dir.glob("*.jpg"))
-                return [str(f) for f in image_files]
-            else:
-                return []
+            # scandir yields names (and, on Linux, file types) straight from
+            # the directory read, without a Path object or stat per entry
+            with os.scandir(processed_dir) as entries:
+                return [
+                    entry.path for entry in entries
+                    if entry.name.endswith(".jpg") and entry.is_file(follow_symlinks=False)
+                ]
+        except FileNotFoundError:
+            return []
         except Exception as e:
-            logger.error(f"Error listing local images for user {user_id}: {e}")
+            logger.error("Error listing local images for user %s: %s", user_id, e)
             return []
     
     def get_download_url(self, image_path: str, expiration_minutes: int = 60) -> Optional[str]:
@@ -283,8 +831,11 @@ class ImageStorageService:
         # For GCS storage
         if self.use_gcs:
             if image_path.startswith("gs://"):
-                # Extract blob name from GCS URL
-                blob_name = image_path.replace(f"gs://{settings.GCS_BUCKET_NAME}/", "")
+                try:
+                    blob_name = self._blob_name(image_path)
+                except ValueError as e:
+                    logger.error("Cannot create download URL: %s", e)
+                    return None
             else:
                 # Assume it's a blob name
                 blob_name = image_path
@@ -298,8 +849,22 @@ class ImageStorageService:
         else:
             return f"/images/{image_path}" if not image_path.startswith("/") else image_path
 
-    def get_storage_info(self) -> Dict[str, Any]:
-        """Get information about the current storage configuration."""
+    def get_storage_info(self) -> Mapping[str, Any]:
+        """
+        Get information about the current storage configuration.
+        
+        use_gcs and GCS availability are settled in __init__ and never
+        change afterwards, so the info is built once and reused.
+        
+        Returns:
+            Read-only view of the storage info
+        """
+        if self._storage_info is None:
+            self._storage_info = self._build_storage_info()
+        return MappingProxyType(self._storage_info)
+    
+    def _build_storage_info(self) -> Dict[str, Any]:
+        """Collect the storage info from the current settings."""
         info = {
             "storage_type": "gcs" if self.use_gcs else "local",
             "save_images": settings.SAVE_IMAGES,
@@ -309,7 +874,7 @@ class ImageStorageService:
         if self.use_gcs:
             info.update({
                 "gcs_bucket": settings.GCS_BUCKET_NAME,
-                "gcs_available": self.gcs_service.is_available if self.use_gcs else False,
+                "gcs_available": self.gcs_service.is_available,
             })
         else:
             info.update({
@@ -321,14 +886,10 @@ class ImageStorageService:
         return info
 
 
-# Global image storage service instance
-_image_storage_service = None
-
+# The cache holds the global instance; later calls return it from C code.
+# Two threads racing on the very first call may each build one, which is
+# harmless: construction only reads settings and the shared GCS client
+@lru_cache(maxsize=None)
 def get_image_storage_service() -> ImageStorageService:
     """Get the global image storage service instance."""
-    global _image_storage_service
-    
-    if _image_storage_service is None:
-        _image_storage_service = ImageStorageService()
-    
-    return _image_storage_service
+    return ImageStorageService()
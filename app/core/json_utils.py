@@ -0,0 +1,18 @@
+import re
+
+# Body of a ```json fenced block, which models often wrap their answer in
+_JSON_FENCE_RE = re.compile(r"```(?:json)?\s*(\{.*?\}|\[.*?\])\s*```", re.DOTALL)
+
+
+def strip_json_fence(response_text: str) -> str:
+    """
+    Return the JSON inside a ```json fenced block, or the text unchanged.
+
+    Args:
+        response_text: Raw response text from a model
+
+    Returns:
+        The fenced JSON object or array, or response_text if there is none
+    """
+    fenced = _JSON_FENCE_RE.search(response_text)
+    return fenced.group(1) if fenced else response_text
@@ -0,0 +1,121 @@
+"""
+Local on-disk cache for documents fetched from Firestore.
+
+A small SQLite table keyed by document ID. It is shared by every worker
+process on the host, so a document fetched (or invalidated) by one worker
+is visible to the others, and warm entries survive restarts.
+"""
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import orjson
+
+from app.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Expired and surplus rows are pruned once per this many writes
+_PRUNE_EVERY = 64
+
+
+class LocalDocumentCache:
+    """TTL cache of documents stored in a local SQLite file."""
+
+    def __init__(self, db_path: str, ttl: float = 300.0, max_entries: int = 10000):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            db_path: Path of the SQLite file
+            ttl: Age in seconds after which rows are pruned from the file
+            max_entries: Maximum number of rows kept; the oldest go first
+        """
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._writes = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        # WAL lets worker processes read while another one writes
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS documents "
+            "(key TEXT PRIMARY KEY, stored REAL NOT NULL, data BLOB NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS documents_stored ON documents (stored)")
+
+    def get(self, key: str, ttl: float) -> Optional[Dict[str, Any]]:
+        """
+        Get a document stored less than ttl seconds ago.
+
+        Args:
+            key: Document ID
+            ttl: Maximum age in seconds
+
+        Returns:
+            The document, or None if missing, expired or unreadable
+        """
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT data FROM documents WHERE key = ? AND stored > ?",
+                    (key, time.time() - ttl),
+                ).fetchone()
+            return orjson.loads(row[0]) if row else None
+        except Exception as e:
+            logger.warning(f"Local document cache read failed for {key}: {e}")
+            return None
+
+    def put(self, key: str, document: Dict[str, Any]):
+        """
+        Store a document, replacing any previous copy.
+
+        Values orjson cannot encode natively (e.g. Firestore timestamps or
+        references) are stored as their str() form, so a document read back
+        from this tier holds plain JSON types.
+
+        Args:
+            key: Document ID
+            document: Document data
+        """
+        try:
+            # JSON, not pickle: the file sits at a configurable shared path,
+            # and unpickling it would run whatever code was written there
+            data = orjson.dumps(document, default=str)
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO documents (key, stored, data) VALUES (?, ?, ?)",
+                    (key, time.time(), data),
+                )
+                self._writes += 1
+                if self._writes % _PRUNE_EVERY == 0:
+                    self._prune()
+        except Exception as e:
+            logger.warning(f"Local document cache write failed for {key}: {e}")
+
+    def delete(self, key: str):
+        """
+        Drop a document after it changed.
+
+        Args:
+            key: Document ID
+        """
+        try:
+            with self._lock:
+                self._conn.execute("DELETE FROM documents WHERE key = ?", (key,))
+        except Exception as e:
+            logger.warning(f"Local document cache delete failed for {key}: {e}")
+
+    def _prune(self):
+        """Delete expired rows, then the oldest rows beyond max_entries (lock held)."""
+        self._conn.execute("DELETE FROM documents WHERE stored <= ?", (time.time() - self.ttl,))
+        self._conn.execute(
+            "DELETE FROM documents WHERE key IN "
+            "(SELECT key FROM documents ORDER BY stored DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,),
+        )
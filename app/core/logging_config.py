@@ -1,14 +1,21 @@
 """
 Centralized logging configuration for the Fashion Backend API.
 """
+import atexit
 import logging
 import logging.handlers
+import os
+import queue
 import sys
 from pathlib import Path
 from typing import Optional, ClassVar
 from app.core.config import settings
 
 
+# Writes queued records to the real handlers on a background thread
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
+
 class ColoredFormatter(logging.Formatter):
     """Custom formatter with color support for console output."""
     
@@ -22,12 +29,36 @@ class ColoredFormatter(logging.Formatter):
         'RESET': '\033[0m'       # Reset
     }
     
+    def __init__(self, *args, stream=None, **kwargs):
+        """
+        Initialize the formatter.
+        
+        Args:
+            stream: Stream the output goes to; colors are only added when it
+                is a terminal, so files and container logs get plain text
+        """
+        super().__init__(*args, **kwargs)
+        # Colored level names, built once; the set of levels is fixed
+        self._colored: dict[str, str] = {}
+        if stream is not None and stream.isatty():
+            self._colored = {
+                level: f"{color}{level}{self.COLORS['RESET']}"
+                for level, color in self.COLORS.items() if level != 'RESET'
+            }
+    
     def format(self, record):
-        # Add color to levelname
-        if record.levelname in self.COLORS:
-            record.levelname = f"{self.COLORS[record.levelname]}{record.levelname}{self.COLORS['RESET']}"
+        colored = self._colored.get(record.levelname)
+        if colored is None:
+            return super().format(record)
         
-        return super().format(record)
+        # The record is shared with the other handlers (e.g. the log file),
+        # so the plain level name is put back afterwards
+        levelname = record.levelname
+        record.levelname = colored
+        try:
+            return super().format(record)
+        finally:
+            record.levelname = levelname
 
 
 def setup_logging(
@@ -40,6 +71,9 @@ def setup_logging(
     """
     Set up centralized logging configuration.
     
+    The logger itself only gets a QueueHandler, so a log call just enqueues
+    the record; the console and file handlers run on a listener thread.
+    
     Args:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_file: Path to log file (optional)
@@ -50,22 +84,27 @@ def setup_logging(
     Returns:
         Configured logger instance
     """
+    global _queue_listener
+    
     # Create logger
     logger = logging.getLogger("fashion_backend")
     logger.setLevel(getattr(logging, log_level.upper()))
     
     # Clear existing handlers
+    stop_logging()
     logger.handlers.clear()
+    handlers = []
     
     # Console handler
     if console_output:
         console_handler = logging.StreamHandler(sys.stdout)
         console_formatter = ColoredFormatter(
             fmt='%(asctime)s | %(levelname)s | %(name)s | %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
+            datefmt='%Y-%m-%d %H:%M:%S',
+            stream=sys.stdout
         )
         console_handler.setFormatter(console_formatter)
-        logger.addHandler(console_handler)
+        handlers.append(console_handler)
     
     # File handler with rotation
     if log_file:
@@ -82,11 +121,68 @@ def setup_logging(
             datefmt='%Y-%m-%d %H:%M:%S'
         )
         file_handler.setFormatter(file_formatter)
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
+    
+    if handlers:
+        log_queue = queue.SimpleQueue()
+        logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        _queue_listener = logging.handlers.QueueListener(
+            log_queue, *handlers, respect_handler_level=True
+        )
+        _queue_listener.start()
     
     return logger
 
 
+def stop_logging():
+    """
+    Flush queued records and stop the listener thread.
+    
+    The real handlers are attached to the logger directly afterwards, so
+    anything logged later (e.g. during interpreter shutdown) is still written.
+    """
+    global _queue_listener
+    
+    if _queue_listener is None:
+        return
+    listener, _queue_listener = _queue_listener, None
+    listener.stop()
+    
+    logger = logging.getLogger("fashion_backend")
+    for handler in list(logger.handlers):
+        if isinstance(handler, logging.handlers.QueueHandler):
+            logger.removeHandler(handler)
+    for handler in listener.handlers:
+        logger.addHandler(handler)
+
+
+def _restart_listener_after_fork():
+    """
+    Give a forked worker its own listener thread.
+    
+    Threads do not survive fork, so a worker forked after this module was
+    imported (e.g. gunicorn --preload) would otherwise queue every record
+    with nothing left to write it out.
+    """
+    global _queue_listener
+    
+    if _queue_listener is None:
+        return
+    log_queue = queue.SimpleQueue()
+    for handler in logging.getLogger("fashion_backend").handlers:
+        if isinstance(handler, logging.handlers.QueueHandler):
+            handler.queue = log_queue
+    _queue_listener = logging.handlers.QueueListener(
+        log_queue, *_queue_listener.handlers, respect_handler_level=True
+    )
+    _queue_listener.start()
+
+
+atexit.register(stop_logging)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_restart_listener_after_fork)
+
+
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger instance for a specific module.
@@ -5,12 +5,16 @@ This module provides a reusable retry mechanism with exponential backoff
 and jitter for handling rate limits and transient errors in API calls.
 """
 
+import re
 import time
 import random
 import json
 from typing import Callable, Any, Optional
 from app.core.logging_config import get_logger
 
+# One scan for every rate-limit marker ("rate" also covers "rate limit")
+_RATE_LIMIT_RE = re.compile(r"429|quota|rate|too many requests", re.IGNORECASE)
+
 
 class RetryConfig:
     """Configuration for retry behavior."""
@@ -63,6 +67,10 @@ class RetryHandler:
             config: Retry configuration, uses defaults if None
         """
         self.config = config or RetryConfig()
+        # Capped backoff (before jitter) for each attempt the handler makes
+        self._delays = tuple(
+            self._backoff_delay(attempt) for attempt in range(self.config.max_retries)
+        )
     
     def is_rate_limit_error(self, error_message: str) -> bool:
         """
@@ -74,14 +82,7 @@ class RetryHandler:
         Returns:
             bool: True if it's a rate limit error
         """
-        error_lower = error_message.lower()
-        return (
-            "429" in error_message
-            or "quota" in error_lower
-            or "rate" in error_lower
-            or "too many requests" in error_lower
-            or "rate limit" in error_lower
-        )
+        return _RATE_LIMIT_RE.search(error_message) is not None
     
     def is_retryable_error(self, error_message: str) -> bool:
         """
@@ -108,14 +109,17 @@ class RetryHandler:
         if attempt == 0:
             return self.config.initial_delay
         
-        # Exponential backoff
-        delay = self.config.base_delay * (self.config.backoff_multiplier ** attempt)
+        delay = self._delays[attempt] if attempt < len(self._delays) else self._backoff_delay(attempt)
         
-        # Apply jitter if enabled
+        # Apply jitter if enabled, keeping the cap
         if self.config.jitter:
-            delay += random.uniform(0, 1)
+            delay = min(delay + random.random(), self.config.max_delay)
         
-        # Cap the delay
+        return delay
+    
+    def _backoff_delay(self, attempt: int) -> float:
+        """Exponential backoff for an attempt after the first, capped, without jitter."""
+        delay = self.config.base_delay * (self.config.backoff_multiplier ** attempt)
         return min(delay, self.config.max_delay)
     
     def execute_with_retry(
@@ -0,0 +1,120 @@
+"""
+Streaming multipart upload parsing.
+
+Parses multipart/form-data directly from the request body stream, so each
+file part is type- and size-checked as its bytes arrive instead of after
+being spooled to a temporary file by the regular form parser.
+"""
+
+import io
+from typing import Callable, List, Optional
+
+from fastapi import HTTPException, Request, UploadFile
+
+from app.core.config import settings
+from app.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+try:
+    from streaming_form_data import StreamingFormDataParser
+    from streaming_form_data.targets import BaseTarget
+    STREAMING_FORM_DATA_AVAILABLE = True
+except ImportError:
+    BaseTarget = object
+    STREAMING_FORM_DATA_AVAILABLE = False
+
+
+class UploadFileTarget(BaseTarget):
+    """Collects every file part sent under one form field as in-memory UploadFiles."""
+
+    def __init__(self, check_upload: Optional[Callable[[UploadFile], None]] = None):
+        """
+        Initialize the target.
+
+        Args:
+            check_upload: Called with each new part (no body yet); raise to reject it
+        """
+        super().__init__()
+        self.check_upload = check_upload
+        self.files: List[UploadFile] = []
+        self._current: UploadFile = None
+        self._size = 0
+
+    def on_start(self):
+        """Start a new file part, refusing it before any bytes arrive if checks fail."""
+        # Parts are buffered in memory, so the file limit is enforced here
+        # rather than after the whole body has been read
+        if len(self.files) >= settings.MAX_FILES_PER_REQUEST:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Too many files. Maximum allowed: {settings.MAX_FILES_PER_REQUEST}",
+            )
+        upload = UploadFile(
+            io.BytesIO(),
+            filename=self.multipart_filename,
+            headers={"content-type": self.multipart_content_type or ""},
+        )
+        if self.check_upload:
+            self.check_upload(upload)
+        self._current = upload
+        self._size = 0
+
+    def on_data_received(self, chunk: bytes):
+        """Append a chunk of the current part, aborting once it is too large."""
+        self._size += len(chunk)
+        if self._size > settings.MAX_FILE_SIZE:
+            raise HTTPException(
+                status_code=413,
+                detail=f"File too large. Maximum size: {settings.MAX_FILE_SIZE // (1024*1024)}MB",
+            )
+        self._current.file.write(chunk)
+
+    def on_finish(self):
+        """Rewind the finished part and record its size."""
+        self._current.file.seek(0)
+        self._current.size = self._size
+        self.files.append(self._current)
+        self._current = None
+
+
+async def parse_upload_stream(
+    request: Request,
+    check_upload: Optional[Callable[[UploadFile], None]] = None,
+    field_name: str = "files",
+) -> List[UploadFile]:
+    """
+    Parse the uploaded files of a multipart request as the body streams in.
+
+    Args:
+        request: Incoming request with a multipart/form-data body
+        check_upload: Optional check run on each file part before its body
+        field_name: Form field holding the files
+
+    Returns:
+        List of UploadFile objects backed by in-memory buffers
+
+    Raises:
+        HTTPException: 501 if streaming-form-data is not installed, 400 for a
+            malformed body or more than MAX_FILES_PER_REQUEST files, 413/415
+            for rejected files
+    """
+    if not STREAMING_FORM_DATA_AVAILABLE:
+        raise HTTPException(
+            status_code=501,
+            detail="Streaming uploads are not available. Install with: pip install streaming-form-data",
+        )
+
+    target = UploadFileTarget(check_upload)
+    try:
+        parser = StreamingFormDataParser(headers=request.headers)
+        parser.register(field_name, target)
+        async for chunk in request.stream():
+            parser.data_received(chunk)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.warning(f"Failed to parse streamed multipart upload: {e}")
+        raise HTTPException(status_code=400, detail="Malformed multipart body")
+
+    return target.files
@@ -1,7 +1,11 @@
 import re
+from functools import lru_cache
 from fastapi import HTTPException
 from pathlib import Path
 
+# Anything but alphanumerics, dash, underscore and dot
+_UNSAFE_CHARS = re.compile(r"[^a-zA-Z0-9_.-]")
+
 
 def normalize_user_id(user_id: str, base_dir: str = None) -> str:
     """
@@ -15,6 +19,12 @@ def normalize_user_id(user_id: str, base_dir: str = None) -> str:
         raise HTTPException(
             status_code=400, detail="User ID is required and must be a string."
         )
+    return _normalize_user_id(user_id, base_dir)
+
+
+@lru_cache(maxsize=4096)
+def _normalize_user_id(user_id: str, base_dir: str = None) -> str:
+    """Memoized body of normalize_user_id; rejected IDs raise and are not cached."""
     user_id = user_id.strip()
     # Disallow path traversal and absolute paths
     if user_id.startswith(("/", "\\")) or ".." in user_id:
@@ -23,17 +33,23 @@ def normalize_user_id(user_id: str, base_dir: str = None) -> str:
             detail="Invalid user ID: path traversal or absolute path not allowed.",
         )
     # Only allow alphanumerics, dash, underscore, and dot
-    safe_id = re.sub(r"[^a-zA-Z0-9_.-]", "_", user_id)
+    safe_id = _UNSAFE_CHARS.sub("_", user_id)
     if not safe_id:
         raise HTTPException(
             status_code=400, detail="User ID is empty after normalization."
         )
     if base_dir:
         # Ensure the resolved path is a descendant of base_dir
-        base = Path(base_dir).resolve()
+        base = _resolve_base_dir(base_dir)
         candidate = (base / safe_id).resolve()
         if not str(candidate).startswith(str(base)):
             raise HTTPException(
                 status_code=400, detail="User ID resolves outside allowed directory."
             )
     return safe_id
+
+
+@lru_cache(maxsize=None)
+def _resolve_base_dir(base_dir: str) -> Path:
+    """Resolve a base directory once; only a few distinct ones are ever passed."""
+    return Path(base_dir).resolve()
@@ -1,6 +1,26 @@
 from fastapi import FastAPI
+from anyio import to_thread
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 from app.api.routes import router
 from app.core.config import settings
+from app.core.gcs_service import aclose_gcs_service
+from app.core.logging_config import stop_logging
+import asyncio
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Size the thread pools used for blocking work before serving requests, close clients and flush logs on shutdown"""
+    # Sync endpoints and run_in_threadpool go through anyio's limiter, while
+    # asyncio.to_thread (file I/O, model calls) uses the loop's default executor
+    to_thread.current_default_thread_limiter().total_tokens = settings.THREADPOOL_SIZE
+    executor = ThreadPoolExecutor(max_workers=settings.THREADPOOL_SIZE)
+    asyncio.get_running_loop().set_default_executor(executor)
+    yield
+    await aclose_gcs_service()
+    executor.shutdown(wait=False)
+    stop_logging()
 
 
 def create_app() -> FastAPI:
@@ -9,6 +29,7 @@ def create_app() -> FastAPI:
         title=settings.APP_NAME,
         description=settings.APP_DESCRIPTION,
         version=settings.APP_VERSION,
+        lifespan=lifespan,
     )
 
     # Include API routes
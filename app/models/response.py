@@ -35,6 +35,25 @@ class AttributeAnalysisResponse(BaseModel):
     results: List[ImageAnalysisResult]
 
 
+class AttributeJobResponse(BaseModel):
+    """Response model for images queued for background attribute analysis"""
+
+    success: bool
+    message: str
+    user_id: str
+    submitted_timestamp: str
+    status: str = "pending"
+    tokens: List[str]  # One polling token per uploaded image, in upload order
+
+
+class AttributeJobStatus(BaseModel):
+    """Status of a single background attribute analysis"""
+
+    token: str
+    status: str  # "pending" or "completed"
+    result: Optional[ImageAnalysisResult] = None
+
+
 class HealthResponse(BaseModel):
     """Health check response model"""
 
@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
 from PIL import Image
+from typing import List, Optional
+from app.core.json_utils import strip_json_fence
 
 
 class Attributor(ABC):
@@ -26,6 +28,30 @@ Analyze the provided image and generate the JSON now. Rules to read from the ima
 - If the item is not clearly visible, make your best guess based on visible features.
 - Pay special attention to color accuracy - distinguish between similar shades (e.g., Navy vs Royal Blue, Charcoal vs Black, Cream vs White)."""
 
+    def strip_json_fence(self, response_text: str) -> str:
+        """Return the JSON inside a ```json fenced block, or the text unchanged"""
+        return strip_json_fence(response_text)
+
+    def get_batch_prompt_text(self, image_count: int) -> str:
+        """Get the prompt text for analyzing several images in one request"""
+        return (
+            self.get_prompt_text()
+            + f"""
+
+You are given {image_count} images, each showing a separate clothing item. Analyze every image independently.
+Instead of a single object, your response MUST be a single, minified JSON array containing exactly {image_count} objects with the keys above, in the same order as the images."""
+        )
+
     @abstractmethod
     def extract(self, image: Image.Image, image_filename: str = None) -> dict:
         pass
+
+    def extract_batch(
+        self, images: List[Image.Image], image_filenames: Optional[List[str]] = None
+    ) -> List[dict]:
+        """Extract attributes for several images; defaults to one extract call each"""
+        image_filenames = image_filenames or [None] * len(images)
+        return [
+            self.extract(image, image_filename)
+            for image, image_filename in zip(images, image_filenames)
+        ]
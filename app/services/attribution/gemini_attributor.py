@@ -3,6 +3,8 @@ from app.core.config import settings
 from app.core.retry_utils import RetryHandler, RetryConfig, create_rate_limit_error
 from google import generativeai as genai
 from PIL import Image
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
 import json
 
 
@@ -14,8 +16,14 @@ class GeminiAttributor(Attributor):
         genai.configure(api_key=settings.GEMINI_API_KEY)
         self.model = genai.GenerativeModel("gemini-2.0-flash")
 
-    def extract(self, image: Image.Image, image_filename: str = None) -> dict:
-        """Extract clothing attributes from image using Gemini with retry logic."""
+    def extract(
+        self, image: Image.Image, image_filename: str = None, initial_delay: float = 1.0
+    ) -> dict:
+        """Extract clothing attributes from image using Gemini with retry logic.
+
+        initial_delay is the pause before the first attempt; extract_batch
+        passes 0 so its single-image and fallback calls start immediately.
+        """
         # Get the prompt without the image placeholder
         prompt = self.get_prompt_text()
         
@@ -23,7 +31,7 @@ class GeminiAttributor(Attributor):
         retry_config = RetryConfig(
             max_retries=3,
             base_delay=2.0,
-            initial_delay=1.0
+            initial_delay=initial_delay
         )
         retry_handler = RetryHandler(retry_config)
         
@@ -31,7 +39,7 @@ class GeminiAttributor(Attributor):
             """Execute Gemini API call."""
             # Generate content with both text and image
             response = self.model.generate_content([prompt, image])
-            response_text = response.text.strip()
+            response_text = self.strip_json_fence(response.text.strip())
             
             # Try to parse the JSON response
             try:
@@ -74,3 +82,71 @@ class GeminiAttributor(Attributor):
         except Exception as e:
             # Fallback error handling
             return {"error": f"Unexpected error in Gemini extraction: {str(e)}"}
+
+    def extract_batch(
+        self, images: List[Image.Image], image_filenames: Optional[List[str]] = None
+    ) -> List[dict]:
+        """Extract attributes for several images with a single Gemini request.
+
+        Falls back to concurrent per-image requests if the batched response
+        cannot be matched up with the images. Neither path waits before its
+        first attempt.
+        """
+        image_filenames = image_filenames or [None] * len(images)
+        if len(images) == 1:
+            return [self.extract(images[0], image_filenames[0], initial_delay=0.0)]
+
+        prompt = self.get_batch_prompt_text(len(images))
+        retry_handler = RetryHandler(
+            RetryConfig(max_retries=3, base_delay=2.0, initial_delay=0.0)
+        )
+
+        def gemini_operation():
+            """Execute the batched Gemini API call."""
+            response = self.model.generate_content([prompt, *images])
+            response_text = self.strip_json_fence(response.text.strip())
+
+            start_idx = response_text.find("[")
+            end_idx = response_text.rfind("]") + 1
+            if start_idx == -1 or end_idx == 0:
+                raise ValueError("Could not find JSON array in batched response")
+            results = json.loads(response_text[start_idx:end_idx])
+            if (
+                not isinstance(results, list)
+                or len(results) != len(images)
+                or not all(isinstance(result, dict) for result in results)
+            ):
+                raise ValueError("Batched response did not contain one object per image")
+
+            for result, image_filename in zip(results, image_filenames):
+                if image_filename:
+                    result["image"] = image_filename
+            return results
+
+        def error_handler(error_message: str, attempts: int) -> Optional[List[dict]]:
+            """Report rate limits per image; anything else falls back to single calls."""
+            if retry_handler.is_rate_limit_error(error_message):
+                return [create_rate_limit_error(attempts) for _ in images]
+            return None
+
+        try:
+            results = retry_handler.execute_with_retry(
+                gemini_operation,
+                error_handler,
+                context="Gemini batched attribute extraction",
+            )
+        except Exception:
+            results = None
+
+        if results is None:
+            with ThreadPoolExecutor(max_workers=len(images)) as pool:
+                return list(
+                    pool.map(
+                        lambda image, image_filename: self.extract(
+                            image, image_filename, initial_delay=0.0
+                        ),
+                        images,
+                        image_filenames,
+                    )
+                )
+        return results
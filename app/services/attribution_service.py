@@ -1,9 +1,12 @@
 from fastapi import UploadFile, HTTPException
 from pathlib import Path
 from app.core.config import settings
+from app.core.batch_queue import AsyncBatchQueue
 from app.models.response import (
     ImageInfo,
     AttributeAnalysisResponse,
+    AttributeJobResponse,
+    AttributeJobStatus,
     ImageAnalysisResult,
 )
 from app.services.attribution.gemini_attributor import GeminiAttributor
@@ -12,15 +15,24 @@ from app.core.data_service import get_data_service
 from app.core.image_storage_service import get_image_storage_service
 from app.core.logging_config import get_logger
 from datetime import datetime
-from typing import Any, Dict, Tuple, List
+from typing import Any, Dict, Tuple, List, Optional
 import io
 import asyncio
 import uuid
 import os
 import json
 import hashlib
+import tempfile
+import time
 from PIL import Image, ImageOps
 
+# Background attribute analyses keyed by polling token. Jobs live in this
+# worker process, so polls must reach the worker that accepted the upload
+_attribute_jobs: Dict[str, Dict[str, Any]] = {}
+
+# Shared across requests so images arriving together go to the model as one call
+_attribute_batch_queue: Optional[AsyncBatchQueue] = None
+
 
 class ClothingAttributionService:
     """Service for processing and analyzing clothing images"""
@@ -45,6 +57,36 @@ class ClothingAttributionService:
 
         return True
 
+    @staticmethod
+    def check_upload_before_read(file: UploadFile) -> None:
+        """
+        Reject an upload by extension, content type or declared size
+
+        Runs before any of the body is read so bad uploads cost nothing to
+        refuse. Uploads without a declared size are still capped while
+        streaming in read_upload_file.
+
+        Args:
+            file: Uploaded file to check
+
+        Raises:
+            HTTPException: 415 for unsupported types, 413 for oversized files
+        """
+        file_extension = Path(file.filename or "").suffix.lower()
+        if file_extension not in settings.ALLOWED_EXTENSIONS or not (
+            file.content_type and file.content_type.startswith("image/")
+        ):
+            raise HTTPException(
+                status_code=415,
+                detail=f"Unsupported file type for '{file.filename}'. Allowed extensions: {', '.join(sorted(settings.ALLOWED_EXTENSIONS))}",
+            )
+
+        if file.size is not None and file.size > settings.MAX_FILE_SIZE:
+            raise HTTPException(
+                status_code=413,
+                detail=f"File too large. Maximum size: {settings.MAX_FILE_SIZE // (1024*1024)}MB",
+            )
+
     @staticmethod
     async def validate_file_size(file: UploadFile) -> int:
         """Validate file size and return the size in bytes"""
@@ -61,6 +103,33 @@ class ClothingAttributionService:
         await file.seek(0)
         return file_size
 
+    @staticmethod
+    async def read_upload_file(file: UploadFile) -> Tuple[bytes, str]:
+        """
+        Read an uploaded file in chunks, hashing as it goes
+
+        Stops as soon as the running size exceeds MAX_FILE_SIZE instead of
+        buffering the whole body first.
+
+        Args:
+            file: Uploaded file to read
+
+        Returns:
+            Tuple of (file_bytes, image_hash)
+        """
+        hasher = ClothingAttributionService.new_image_hasher()
+        buffer = bytearray()
+        while chunk := await file.read(settings.UPLOAD_CHUNK_SIZE):
+            buffer.extend(chunk)
+            if len(buffer) > settings.MAX_FILE_SIZE:
+                raise HTTPException(
+                    status_code=413,
+                    detail=f"File too large. Maximum size: {settings.MAX_FILE_SIZE // (1024*1024)}MB",
+                )
+            hasher.update(chunk)
+
+        return bytes(buffer), hasher.hexdigest()
+
     @staticmethod
     def create_image_info(file: UploadFile, file_size: int) -> ImageInfo:
         """Create ImageInfo object from uploaded file"""
@@ -88,6 +157,10 @@ class ClothingAttributionService:
         original_size = image.size
         original_format = image.format or "JPEG"
 
+        # Let libjpeg decode at a reduced scale (never below the target size);
+        # no-op for other formats or images that are already loaded
+        image.draft("RGB", (settings.TARGET_WIDTH, settings.TARGET_HEIGHT))
+
         # Convert to RGB if necessary (handles RGBA, P mode images)
         if image.mode not in ("RGB", "L"):
             image = image.convert("RGB")
@@ -105,8 +178,11 @@ class ClothingAttributionService:
             new_width = settings.TARGET_WIDTH
             new_height = settings.TARGET_HEIGHT
 
-        # Resize image using high-quality resampling
-        resized_image = image.resize((new_width, new_height), Image.Resampling.LANCZOS)
+        # Resize image using high-quality resampling; reducing_gap does a cheap
+        # integer reduce() first so LANCZOS only runs on a near-target image
+        resized_image = image.resize(
+            (new_width, new_height), Image.Resampling.LANCZOS, reducing_gap=3.0
+        )
 
         # Apply additional optimization for clothing recognition
         # Enhance image for better texture and material detection
@@ -201,6 +277,24 @@ class ClothingAttributionService:
         image_storage = get_image_storage_service()
         return image_storage.save_processed_image(image, unique_filename, user_id)
 
+    @staticmethod
+    async def asave_processed_image(
+        image: Image.Image, unique_filename: str, user_id: str = None
+    ) -> str:
+        """
+        Async save_processed_image; encoding and upload run off the event loop.
+        
+        Args:
+            image: PIL Image object to save
+            unique_filename: Unique filename for the image
+            user_id: User ID for organizing images
+            
+        Returns:
+            Storage path/URL if successful, None otherwise
+        """
+        image_storage = get_image_storage_service()
+        return await image_storage.asave_processed_image(image, unique_filename, user_id)
+
     @staticmethod
     def get_user_json_file_path(user_id: str) -> Path:
         """
@@ -223,6 +317,19 @@ class ClothingAttributionService:
             filename = f"{user_id}_{settings.ATTRIBUTES_JSON_FILE}"
             return Path(filename)
 
+    @staticmethod
+    def new_image_hasher():
+        """
+        Create the incremental hasher used for duplicate detection
+
+        Stored images are keyed by this digest, so changing the algorithm
+        would stop every existing image from matching its re-uploads.
+
+        Returns:
+            hashlib hash object
+        """
+        return hashlib.sha256()
+
     @staticmethod
     def calculate_image_hash(image_data: bytes) -> str:
         """
@@ -234,14 +341,16 @@ class ClothingAttributionService:
         Returns:
             SHA-256 hash string
         """
-        return hashlib.sha256(image_data).hexdigest()
+        hasher = ClothingAttributionService.new_image_hasher()
+        hasher.update(image_data)
+        return hasher.hexdigest()
 
     @staticmethod
-    def load_existing_attributes(user_id: str) -> Dict[str, Any]:
+    async def load_existing_attributes(user_id: str) -> Dict[str, Any]:
         logger = get_logger(__name__)
         user_id_norm = normalize_user_id(user_id, base_dir=settings.USER_DATA_DIRECTORY)
         data_service = get_data_service()
-        user_data = data_service.load_user_data(user_id_norm)
+        user_data = await data_service.aload_user_data(user_id_norm)
         if user_data:
             logger.debug(f"[user={user_id}] Loaded existing attributes from data service.")
             return user_data
@@ -252,7 +361,7 @@ class ClothingAttributionService:
         }
 
     @staticmethod
-    def save_attributes_to_json(
+    async def save_attributes_to_json(
         image_hash: str,
         attributes: Dict[str, Any],
         image_info: ImageInfo,
@@ -264,7 +373,6 @@ class ClothingAttributionService:
             logger.info(f"[user={user_id}] Skipping attribute save (SAVE_ATTRIBUTES_JSON is False)")
             return
         user_id_norm = normalize_user_id(user_id, base_dir=settings.USER_DATA_DIRECTORY)
-        data = ClothingAttributionService.load_existing_attributes(user_id_norm)
         entry = {
             "filename": image_info.filename,
             "content_type": image_info.content_type,
@@ -277,19 +385,17 @@ class ClothingAttributionService:
         }
         if saved_paths:
             entry["saved_images"] = saved_paths
-        data["images"][image_hash] = entry
-        data["metadata"]["total_images"] = len(data["images"])
-        data["metadata"]["last_updated"] = datetime.now().isoformat()
-        data["metadata"]["user_id"] = user_id
+        # Only the new image is written; both backends update metadata
+        # (total_images, last_updated, and user_id from entry["user_id"]) with it
         data_service = get_data_service()
-        success = data_service.save_user_data(user_id_norm, data)
+        success = await data_service.aupdate_user_image(user_id_norm, image_hash, entry)
         if success:
             logger.info(f"[user={user_id}] Attributes saved for image {image_info.filename} (hash={image_hash})")
         else:
             logger.error(f"[user={user_id}] Failed to save attributes for image {image_info.filename} (hash={image_hash})")
 
     @staticmethod
-    def is_duplicate_image(
+    async def is_duplicate_image(
         image_hash: str, user_id: str
     ) -> Tuple[bool, Dict[str, Any]]:
         logger = get_logger(__name__)
@@ -297,7 +403,7 @@ class ClothingAttributionService:
         if not settings.AVOID_DUPLICATES:
             logger.debug(f"[user={user_id}] Duplicate check skipped (AVOID_DUPLICATES is False)")
             return False, {}
-        existing_data = ClothingAttributionService.load_existing_attributes(user_id_norm)
+        existing_data = await ClothingAttributionService.load_existing_attributes(user_id_norm)
         if image_hash in existing_data.get("images", {}):
             logger.info(f"[user={user_id}] Duplicate image detected (hash={image_hash})")
             return True, existing_data["images"][image_hash]
@@ -325,7 +431,7 @@ class ClothingAttributionService:
         logger.debug(f"[user={user_id}] Normalized user ID: {user_id_norm}")
 
         # Limit the number of files to prevent abuse
-        max_files = 10  # You can make this configurable
+        max_files = settings.MAX_FILES_PER_REQUEST
         if len(files) > max_files:
             logger.warning(f"[user={user_id}] Too many files provided ({len(files)} > {max_files})")
             raise HTTPException(
@@ -336,51 +442,58 @@ class ClothingAttributionService:
         file_names = [f.filename for f in files]
         logger.info(f"[user={user_id}] Files to process: {', '.join(file_names)}")
 
-        results = []
-        successful_analyses = 0
-        failed_analyses = 0
+        # Bound the number of in-flight AI calls; each image is dominated by the
+        # model round-trip, so images are analyzed concurrently rather than in turn
+        semaphore = asyncio.Semaphore(settings.MLLM_CONCURRENCY or 5)
+        batch_key = ClothingAttributionService.new_batch_key(files)
 
-        # Process each image
-        for i, file in enumerate(files, 1):
-            try:
-                logger.info(f"[user={user_id}] 🔄 Processing image {i}/{len(files)}: {file.filename}")
-                result = await ClothingAttributionService.process_single_image_analysis(
-                    file, user_id
-                )
-                results.append(result)
-                
-                if result.error is None:
-                    successful_analyses += 1
-                    category = result.attributes.get('category', 'Unknown') if result.attributes else 'Unknown'
-                    status_emoji = "✅" if result.status == "attributes_extracted" else "🔄"
-                    logger.info(f"[user={user_id}] {status_emoji} Success {i}/{len(files)}: {file.filename} | Category: {category}")
-                else:
-                    failed_analyses += 1
-                    logger.warning(f"[user={user_id}] ❌ Failed {i}/{len(files)}: {file.filename} | Error: {result.error}")
-            except Exception as e:
-                # Create error result for this image
+        async def analyze_one(i: int, file: UploadFile) -> ImageAnalysisResult:
+            async with semaphore:
                 try:
-                    file_size = await ClothingAttributionService.validate_file_size(
-                        file
-                    )
-                    image_info = ClothingAttributionService.create_image_info(
-                        file, file_size
+                    logger.info(f"[user={user_id}] 🔄 Processing image {i}/{len(files)}: {file.filename}")
+                    return await ClothingAttributionService.process_single_image_analysis(
+                        file, user_id, batch_key=batch_key
                     )
-                except:
-                    # If we can't even get file info, create a minimal one
-                    image_info = ImageInfo(
-                        filename=file.filename or "unknown",
-                        content_type=file.content_type or "unknown",
-                        file_size_bytes=0,
-                        file_size_mb=0.0,
+                except Exception as e:
+                    # Create error result for this image
+                    try:
+                        file_size = await ClothingAttributionService.validate_file_size(
+                            file
+                        )
+                        image_info = ClothingAttributionService.create_image_info(
+                            file, file_size
+                        )
+                    except:
+                        # If we can't even get file info, create a minimal one
+                        image_info = ImageInfo(
+                            filename=file.filename or "unknown",
+                            content_type=file.content_type or "unknown",
+                            file_size_bytes=0,
+                            file_size_mb=0.0,
+                        )
+
+                    logger.error(f"[user={user_id}] ❌ Exception during processing {i}/{len(files)}: {file.filename} | Error: {e}")
+                    return ImageAnalysisResult(
+                        image_info=image_info, status="error", attributes=None, error=str(e)
                     )
 
-                error_result = ImageAnalysisResult(
-                    image_info=image_info, status="error", attributes=None, error=str(e)
-                )
-                results.append(error_result)
+        # gather preserves input order, so results line up with the uploaded files
+        results = await asyncio.gather(
+            *(analyze_one(i, file) for i, file in enumerate(files, 1))
+        )
+
+        successful_analyses = 0
+        failed_analyses = 0
+        for i, (file, result) in enumerate(zip(files, results), 1):
+            if result.error is None:
+                successful_analyses += 1
+                category = result.attributes.get('category', 'Unknown') if result.attributes else 'Unknown'
+                status_emoji = "✅" if result.status == "attributes_extracted" else "🔄"
+                logger.info(f"[user={user_id}] {status_emoji} Success {i}/{len(files)}: {file.filename} | Category: {category}")
+            else:
                 failed_analyses += 1
-                logger.error(f"[user={user_id}] ❌ Exception during processing {i}/{len(files)}: {file.filename} | Error: {e}")
+                logger.warning(f"[user={user_id}] ❌ Failed {i}/{len(files)}: {file.filename} | Error: {result.error}")
+
         # Determine overall success
         overall_success = successful_analyses > 0
 
@@ -405,9 +518,136 @@ class ClothingAttributionService:
             results=results,
         )
 
+    @staticmethod
+    async def submit_images_for_attributes(
+        files: List[UploadFile],
+        user_id: str,
+    ) -> AttributeJobResponse:
+        """
+        Queue uploaded images for attribute analysis and return immediately
+
+        Each image is analyzed in a background task with the same pipeline as
+        process_images_for_attributes; clients poll get_attribute_job with
+        the returned tokens instead of holding the connection open.
+
+        Args:
+            files: List of image files to be processed
+            user_id: User identifier
+
+        Returns:
+            AttributeJobResponse with one polling token per image
+        """
+        logger = get_logger(__name__)
+
+        if not files:
+            raise HTTPException(status_code=400, detail="No files provided")
+        if not user_id or not user_id.strip():
+            raise HTTPException(status_code=400, detail="User ID is required")
+        normalize_user_id(user_id, base_dir=settings.USER_DATA_DIRECTORY)
+
+        max_files = settings.MAX_FILES_PER_REQUEST
+        if len(files) > max_files:
+            raise HTTPException(
+                status_code=400, detail=f"Too many files. Maximum allowed: {max_files}"
+            )
+
+        ClothingAttributionService._prune_attribute_jobs()
+
+        # Request bodies are closed once the response is sent, so each upload
+        # is read now and the background analysis gets an in-memory copy
+        uploads = []
+        for file in files:
+            image_data, _ = await ClothingAttributionService.read_upload_file(file)
+            # An unrolled SpooledTemporaryFile is what UploadFile treats as in
+            # memory, so reading the copy back skips the threadpool hop;
+            # read_upload_file already capped it at MAX_FILE_SIZE
+            copy = tempfile.SpooledTemporaryFile(max_size=settings.MAX_FILE_SIZE)
+            copy.write(image_data)
+            copy.seek(0)
+            uploads.append(
+                UploadFile(
+                    copy,
+                    size=len(image_data),
+                    filename=file.filename,
+                    headers=file.headers,
+                )
+            )
+
+        semaphore = asyncio.Semaphore(settings.MLLM_CONCURRENCY or 5)
+        batch_key = ClothingAttributionService.new_batch_key(uploads)
+
+        async def analyze_in_background(token: str, upload: UploadFile) -> None:
+            async with semaphore:
+                try:
+                    result = await ClothingAttributionService.process_single_image_analysis(
+                        upload, user_id, batch_key=batch_key
+                    )
+                except Exception as e:
+                    logger.error(f"[user={user_id}] ❌ Background analysis failed for {upload.filename}: {e}")
+                    result = ImageAnalysisResult(
+                        image_info=ClothingAttributionService.create_image_info(
+                            upload, upload.size or 0
+                        ),
+                        status="error",
+                        attributes=None,
+                        error=str(e),
+                    )
+            job = _attribute_jobs.get(token)
+            if job is not None:
+                job.update(status="completed", result=result, finished=time.monotonic())
+                job.pop("task", None)
+
+        tokens = []
+        for upload in uploads:
+            token = uuid.uuid4().hex
+            _attribute_jobs[token] = {"status": "pending", "user_id": user_id, "result": None}
+            _attribute_jobs[token]["task"] = asyncio.create_task(
+                analyze_in_background(token, upload)
+            )
+            tokens.append(token)
+
+        logger.info(f"[user={user_id}] 📥 Queued {len(tokens)} images for background attribute analysis")
+        return AttributeJobResponse(
+            success=True,
+            message=f"{len(tokens)} images queued for analysis for user {user_id}",
+            user_id=user_id,
+            submitted_timestamp=datetime.now().isoformat(),
+            tokens=tokens,
+        )
+
+    @staticmethod
+    def get_attribute_job(token: str) -> AttributeJobStatus:
+        """
+        Get the status of a background attribute analysis
+
+        Args:
+            token: Polling token returned by submit_images_for_attributes
+
+        Returns:
+            AttributeJobStatus with the analysis result once completed
+        """
+        ClothingAttributionService._prune_attribute_jobs()
+        job = _attribute_jobs.get(token)
+        if job is None:
+            raise HTTPException(status_code=404, detail="Unknown or expired token")
+        return AttributeJobStatus(token=token, status=job["status"], result=job["result"])
+
+    @staticmethod
+    def _prune_attribute_jobs() -> None:
+        """Drop completed jobs older than ATTRIBUTE_JOB_TTL"""
+        now = time.monotonic()
+        expired = [
+            token
+            for token, job in _attribute_jobs.items()
+            if job["status"] == "completed"
+            and now - job["finished"] > settings.ATTRIBUTE_JOB_TTL
+        ]
+        for token in expired:
+            del _attribute_jobs[token]
+
     @staticmethod
     async def process_single_image_analysis(
-        file: UploadFile, user_id: str
+        file: UploadFile, user_id: str, batch_key: Optional[str] = None
     ) -> ImageAnalysisResult:
         logger = get_logger(__name__)
         logger.info(f"[user={user_id}] Starting image analysis for: {file.filename}")
@@ -420,20 +660,17 @@ class ClothingAttributionService:
                     f"Invalid file type. Allowed extensions: {', '.join(settings.ALLOWED_EXTENSIONS)}"
                 )
 
-            # Validate file size
-            file_size = await ClothingAttributionService.validate_file_size(file)
+            # Stream the upload, validating size and hashing for duplicate detection
+            image_data, image_hash = await ClothingAttributionService.read_upload_file(file)
+            file_size = len(image_data)
             logger.debug(f"[user={user_id}] File size validated: {file_size} bytes for {file.filename}")
 
             # Create image info
             image_info = ClothingAttributionService.create_image_info(file, file_size)
-
-            # Load and calculate hash for duplicate detection
-            image_data = await file.read()
-            image_hash = ClothingAttributionService.calculate_image_hash(image_data)
             logger.debug(f"[user={user_id}] Generated image hash: {image_hash[:8]}... for {file.filename}")
 
             # Check for duplicates for this specific user
-            is_duplicate, existing_data = ClothingAttributionService.is_duplicate_image(
+            is_duplicate, existing_data = await ClothingAttributionService.is_duplicate_image(
                 image_hash, user_id
             )
 
@@ -484,7 +721,7 @@ class ClothingAttributionService:
 
             if settings.SAVE_IMAGES and settings.SAVE_PROCESSED:
                 logger.debug(f"[user={user_id}] Saving processed image: {unique_filename}")
-                processed_path = ClothingAttributionService.save_processed_image(
+                processed_path = await ClothingAttributionService.asave_processed_image(
                     processed_image, unique_filename, user_id
                 )
                 saved_paths["processed"] = processed_path
@@ -499,7 +736,7 @@ class ClothingAttributionService:
             # Extract clothing attributes using Gemini (async to avoid blocking event loop)
             logger.info(f"[user={user_id}] Starting AI attribute extraction for: {file.filename}")
             attributes = await ClothingAttributionService.extract_clothing_attributes(
-                processed_image, file.filename
+                processed_image, file.filename, batch_key=batch_key
             )
 
             # Hardened error handling for Gemini extraction
@@ -527,7 +764,7 @@ class ClothingAttributionService:
 
             # Only persist attributes if Gemini extraction succeeded
             logger.debug(f"[user={user_id}] Saving attributes to data store for: {file.filename}")
-            ClothingAttributionService.save_attributes_to_json(
+            await ClothingAttributionService.save_attributes_to_json(
                 image_hash, attributes, image_info, user_id, saved_paths
             )
 
@@ -583,20 +820,22 @@ class ClothingAttributionService:
 
     @staticmethod
     async def extract_clothing_attributes(
-        image: Image.Image, image_filename: str = None
+        image: Image.Image, image_filename: str = None, batch_key: Optional[str] = None
     ) -> Dict[str, Any]:
         logger = get_logger(__name__)
         logger.debug(f"🧠 Starting AI attribute extraction | Image: {image_filename} | Size: {image.size}")
         
         try:
-            # Initialize Gemini attributor
-            gemini_attributor = GeminiAttributor()
-
-            # Use asyncio.to_thread to run the blocking Gemini extraction in a thread
-            # This prevents blocking the FastAPI event loop
-            attributes = await asyncio.to_thread(
-                gemini_attributor.extract, image, image_filename
-            )
+            if batch_key is None:
+                # A lone image has nothing to share a request with, so skip the batch wait
+                (attributes,) = await ClothingAttributionService.extract_attribute_batch(
+                    [(image, image_filename)]
+                )
+            else:
+                # Images of one upload submitted within MLLM_BATCH_WAIT share one Gemini request
+                attributes = await ClothingAttributionService.get_attribute_batch_queue().add_request(
+                    (image, image_filename), key=batch_key
+                )
 
             # Add processing metadata
             width, height = image.size
@@ -622,6 +861,58 @@ class ClothingAttributionService:
                 },
             }
 
+    @staticmethod
+    def new_batch_key(files: List[UploadFile]) -> Optional[str]:
+        """
+        Get the key under which one upload's images are batched together
+
+        Args:
+            files: Files of the upload
+
+        Returns:
+            A key unique to this upload, or None for a single file
+        """
+        return uuid.uuid4().hex if len(files) > 1 else None
+
+    @staticmethod
+    def get_attribute_batch_queue() -> AsyncBatchQueue:
+        """
+        Get the shared queue that batches attribute extraction requests
+
+        Returns:
+            AsyncBatchQueue taking (image, image_filename) items
+        """
+        global _attribute_batch_queue
+        if _attribute_batch_queue is None:
+            _attribute_batch_queue = AsyncBatchQueue(
+                ClothingAttributionService.extract_attribute_batch,
+                max_batch_size=settings.MLLM_BATCH_SIZE,
+                max_wait_time=settings.MLLM_BATCH_WAIT,
+            )
+        return _attribute_batch_queue
+
+    @staticmethod
+    async def extract_attribute_batch(
+        requests: List[Tuple[Image.Image, str]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Extract attributes for a batch of images with one Gemini call
+
+        Args:
+            requests: List of (image, image_filename) pairs
+
+        Returns:
+            List of attribute dicts in the same order as requests
+        """
+        gemini_attributor = GeminiAttributor()
+        images = [image for image, _ in requests]
+        image_filenames = [image_filename for _, image_filename in requests]
+
+        # Run the blocking Gemini call in a thread to keep the event loop free
+        return await asyncio.to_thread(
+            gemini_attributor.extract_batch, images, image_filenames
+        )
+
     @staticmethod
     def get_compressed_image_bytes(image: Image.Image, format: str = "JPEG") -> bytes:
         """
@@ -642,7 +933,7 @@ class ClothingAttributionService:
                 img_byte_arr,
                 format=format,
                 quality=settings.JPEG_QUALITY,
-                optimize=True,
+                optimize=False,
             )
         else:
             image.save(img_byte_arr, format=format, optimize=True)
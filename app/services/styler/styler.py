@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 from app.core.retry_utils import RetryHandler, RetryConfig, create_rate_limit_error
+from app.core.json_utils import strip_json_fence
 import json
 
 
@@ -125,6 +126,7 @@ Your response must be a single, valid JSON object with no additional text, prose
         Returns:
             str: Validated JSON string
         """
+        response_text = strip_json_fence(response_text)
         try:
             # Attempt to parse the JSON to ensure it's valid
             outfit_json = json.loads(response_text)
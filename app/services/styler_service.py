@@ -7,10 +7,21 @@ from app.services.styler.openai_styler import OpenAIStyler
 from app.core.user_id_utils import normalize_user_id
 from app.core.data_service import get_data_service
 from app.core.logging_config import get_logger
+from collections import OrderedDict
 from datetime import datetime
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
+import asyncio
 import json
 import os
+import time
+
+# Identical styling requests (normalized user, the user's data write version,
+# city, weather, occasion) share one model call while in flight, and successful
+# results are reused for STYLER_CACHE_TTL or until the user's data changes
+_StylingKey = Tuple[str, int, str, str, str]
+_inflight_recommendations: Dict[_StylingKey, asyncio.Future] = {}
+_recommendation_cache: "OrderedDict[_StylingKey, Tuple[float, StylerResponse]]" = OrderedDict()
+_RECOMMENDATION_CACHE_SIZE = 256
 
 
 class StylerService:
@@ -31,10 +42,10 @@ class StylerService:
         return json_path
 
     @staticmethod
-    def load_user_attributes(user_id: str) -> Dict[str, Any]:
+    async def load_user_attributes(user_id: str) -> Dict[str, Any]:
         """Load user's clothing attributes using unified data service"""
         data_service = get_data_service()
-        user_data = data_service.load_user_data(user_id)
+        user_data = await data_service.aload_user_data(user_id)
         
         if not user_data:
             raise HTTPException(
@@ -178,7 +189,7 @@ class StylerService:
         try:
             # Load user's clothing data
             logger.debug(f"[user={user_id}] Loading user clothing data")
-            user_data = StylerService.load_user_attributes(user_id)
+            user_data = await StylerService.load_user_attributes(user_id)
 
             # Extract clothing attributes for styling
             logger.debug(f"[user={user_id}] Extracting clothing attributes for styling")
@@ -223,7 +234,8 @@ class StylerService:
             # Generate outfit recommendation
             try:
                 logger.info(f"[user={user_id}] 🧠 Generating AI outfit recommendation using {styler_type}")
-                outfit_json = styler.style(
+                outfit_json = await asyncio.to_thread(
+                    styler.style,
                     clothing_attributes=clothing_attributes,
                     city=city,
                     weather=weather,
@@ -293,6 +305,68 @@ class StylerService:
                 detail=f"Unexpected error in outfit generation: {str(e)}",
             )
 
+    @staticmethod
+    async def get_outfit_recommendation(
+        user_id: str, city: str, weather: str, occasion: str
+    ) -> StylerResponse:
+        """
+        Generate an outfit recommendation, sharing work between identical requests
+
+        Concurrent calls with the same parameters await a single
+        generate_outfit_recommendation call, and a successful result is
+        reused for STYLER_CACHE_TTL seconds unless the user's data is
+        written in the meantime.
+
+        Args:
+            user_id: Unique identifier for the user
+            city: City for the occasion
+            weather: Weather conditions
+            occasion: The occasion type
+
+        Returns:
+            StylerResponse with outfit recommendation
+        """
+        normalized_user_id = normalize_user_id(user_id, base_dir=settings.USER_DATA_DIRECTORY)
+        version = get_data_service().get_write_version(normalized_user_id)
+        key = (normalized_user_id, version, city, weather, occasion)
+
+        cached = _recommendation_cache.get(key)
+        if cached is not None:
+            if time.monotonic() - cached[0] < settings.STYLER_CACHE_TTL:
+                _recommendation_cache.move_to_end(key)
+                return cached[1]
+            del _recommendation_cache[key]
+
+        inflight = _inflight_recommendations.get(key)
+        if inflight is not None:
+            # Shield so a disconnecting follower doesn't cancel the shared call
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        _inflight_recommendations[key] = future
+        try:
+            response = await StylerService.generate_outfit_recommendation(
+                user_id=user_id, city=city, weather=weather, occasion=occasion
+            )
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved in case nobody else was waiting
+            raise
+        else:
+            future.set_result(response)
+        finally:
+            _inflight_recommendations.pop(key, None)
+
+        if response.success:
+            _recommendation_cache[key] = (time.monotonic(), response)
+            while len(_recommendation_cache) > _RECOMMENDATION_CACHE_SIZE:
+                _recommendation_cache.popitem(last=False)
+
+        return response
+
     @staticmethod
     def validate_styling_parameters(
         city: str, weather: str, occasion: str
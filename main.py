@@ -4,4 +4,13 @@ from app.core.config import settings
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run("main:app", host=settings.HOST, port=settings.PORT, reload=True)
+    # uvicorn picks uvloop and httptools automatically when they are installed
+    uvicorn.run(
+        "main:app",
+        host=settings.HOST,
+        port=settings.PORT,
+        reload=True,
+        limit_concurrency=settings.LIMIT_CONCURRENCY,
+        backlog=settings.BACKLOG,
+        timeout_keep_alive=settings.TIMEOUT_KEEP_ALIVE,
+    )
@@ -1,6 +1,6 @@
 import pytest
 from unittest.mock import Mock, patch, AsyncMock
-from fastapi import UploadFile
+from fastapi import UploadFile, HTTPException
 from PIL import Image
 import io
 from app.services.attribution_service import ClothingAttributionService
@@ -72,6 +72,36 @@ class TestClothingAttributionService:
             with pytest.raises(Exception):  # Should raise HTTPException
                 await ClothingAttributionService.validate_file_size(mock_file)
 
+    @pytest.mark.asyncio
+    async def test_read_upload_file_in_chunks(self):
+        """Test chunked upload reading returns the full body and its hash"""
+        import hashlib
+
+        mock_file = AsyncMock(spec=UploadFile)
+        mock_file.read.side_effect = [b"abc", b"def", b""]
+
+        with patch("app.core.config.settings.MAX_FILE_SIZE", 1024):
+            data, image_hash = await ClothingAttributionService.read_upload_file(
+                mock_file
+            )
+
+        assert data == b"abcdef"
+        assert image_hash == hashlib.sha256(b"abcdef").hexdigest()
+        assert image_hash == ClothingAttributionService.calculate_image_hash(b"abcdef")
+
+    @pytest.mark.asyncio
+    async def test_read_upload_file_too_large_stops_early(self):
+        """Test chunked upload reading aborts once MAX_FILE_SIZE is exceeded"""
+        mock_file = AsyncMock(spec=UploadFile)
+        mock_file.read.side_effect = [b"x" * 8, b"x" * 8, b"x" * 8, b""]
+
+        with patch("app.core.config.settings.MAX_FILE_SIZE", 10):
+            with pytest.raises(Exception):  # Should raise HTTPException
+                await ClothingAttributionService.read_upload_file(mock_file)
+
+        # The third chunk is never requested
+        assert mock_file.read.call_count == 2
+
     def test_create_image_info(self):
         """Test ImageInfo creation"""
         mock_file = Mock(spec=UploadFile)
@@ -104,6 +134,24 @@ class TestClothingAttributionService:
         assert "original_size" in info
         assert info["original_size"] == (800, 600)
 
+    def test_compress_and_resize_image_jpeg_draft(self):
+        """Test JPEG inputs decoded at reduced scale keep original size info"""
+        buffer = io.BytesIO()
+        Image.new("RGB", (2048, 1536), color="blue").save(buffer, format="JPEG")
+        buffer.seek(0)
+        test_image = Image.open(buffer)
+
+        with patch("app.core.config.settings.TARGET_WIDTH", 512):
+            with patch("app.core.config.settings.TARGET_HEIGHT", 512):
+                with patch("app.core.config.settings.MAINTAIN_ASPECT_RATIO", True):
+                    processed_image, info = (
+                        ClothingAttributionService.compress_and_resize_image(test_image)
+                    )
+
+        assert info["original_size"] == (2048, 1536)
+        assert processed_image.size == (512, 384)
+        assert info["processed_size"] == (512, 384)
+
     def test_compress_and_resize_image_rgb_conversion(self):
         """Test RGB conversion during compression"""
         # Create a RGBA test image (needs conversion)
@@ -115,3 +163,109 @@ class TestClothingAttributionService:
 
         # Should be converted to RGB
         assert processed_image.mode == "RGB"
+
+    @pytest.mark.asyncio
+    async def test_process_images_runs_concurrently_and_preserves_order(self):
+        """Test that images are analyzed concurrently and results keep input order"""
+        import asyncio
+
+        in_flight = 0
+        max_in_flight = 0
+
+        async def fake_analysis(file, user_id, batch_key=None):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            # Earlier files finish last to prove ordering is not completion order
+            await asyncio.sleep(0.01 * (3 - int(file.filename[0])))
+            in_flight -= 1
+            return ImageAnalysisResult(
+                image_info=ImageInfo(
+                    filename=file.filename,
+                    content_type="image/jpeg",
+                    file_size_bytes=1,
+                    file_size_mb=0.0,
+                ),
+                status="attributes_extracted",
+                attributes={"category": "T-Shirt"},
+            )
+
+        files = []
+        for i in range(3):
+            mock_file = Mock(spec=UploadFile)
+            mock_file.filename = f"{i}.jpg"
+            files.append(mock_file)
+
+        with patch(
+            "app.services.attribution_service.ClothingAttributionService.process_single_image_analysis",
+            side_effect=fake_analysis,
+        ), patch("app.core.config.settings.MLLM_CONCURRENCY", 2):
+            response = await ClothingAttributionService.process_images_for_attributes(
+                files, "test_user"
+            )
+
+        assert [r.image_info.filename for r in response.results] == [
+            "0.jpg",
+            "1.jpg",
+            "2.jpg",
+        ]
+        assert response.successful_analyses == 3
+        assert max_in_flight == 2
+
+    @pytest.mark.asyncio
+    async def test_submit_images_returns_tokens_and_completes_in_background(self):
+        """Test queued images get polling tokens and finish after the response"""
+        import asyncio
+
+        release = asyncio.Event()
+
+        async def fake_analysis(file, user_id, batch_key=None):
+            assert await file.read() == b"image-bytes"
+            await release.wait()
+            return ImageAnalysisResult(
+                image_info=ImageInfo(
+                    filename=file.filename,
+                    content_type="image/jpeg",
+                    file_size_bytes=file.size,
+                    file_size_mb=0.0,
+                ),
+                status="attributes_extracted",
+                attributes={"category": "T-Shirt"},
+            )
+
+        mock_file = AsyncMock(spec=UploadFile)
+        mock_file.filename = "shirt.jpg"
+        mock_file.headers = {"content-type": "image/jpeg"}
+        mock_file.read.side_effect = [b"image-bytes", b""]
+
+        with patch(
+            "app.services.attribution_service.ClothingAttributionService.process_single_image_analysis",
+            side_effect=fake_analysis,
+        ):
+            response = await ClothingAttributionService.submit_images_for_attributes(
+                [mock_file], "test_user"
+            )
+            assert response.status == "pending"
+            assert len(response.tokens) == 1
+            token = response.tokens[0]
+
+            status = ClothingAttributionService.get_attribute_job(token)
+            assert status.status == "pending"
+            assert status.result is None
+
+            release.set()
+            # Poll with a deadline rather than counting loop ticks
+            for _ in range(200):
+                status = ClothingAttributionService.get_attribute_job(token)
+                if status.status == "completed":
+                    break
+                await asyncio.sleep(0.01)
+
+        assert status.status == "completed"
+        assert status.result.attributes == {"category": "T-Shirt"}
+
+    def test_get_attribute_job_unknown_token(self):
+        """Test polling an unknown token returns 404"""
+        with pytest.raises(HTTPException) as exc_info:
+            ClothingAttributionService.get_attribute_job("missing")
+        assert exc_info.value.status_code == 404
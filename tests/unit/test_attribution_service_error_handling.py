@@ -28,7 +28,7 @@ class TestAttributionServiceErrorHandling:
         mock_file = AsyncMock(spec=UploadFile)
         mock_file.filename = "test.jpg"
         mock_file.content_type = "image/jpeg"
-        mock_file.read.return_value = b"fake_image_data"
+        mock_file.read.side_effect = [b"fake_image_data", b""]
         mock_file.seek = AsyncMock()
         mock_file.close = AsyncMock()
 
@@ -87,7 +87,7 @@ class TestAttributionServiceErrorHandling:
         mock_file = AsyncMock(spec=UploadFile)
         mock_file.filename = "test.jpg"
         mock_file.content_type = "image/jpeg"
-        mock_file.read.return_value = b"fake_image_data"
+        mock_file.read.side_effect = [b"fake_image_data", b""]
         mock_file.seek = AsyncMock()
         mock_file.close = AsyncMock()
 
@@ -152,7 +152,7 @@ class TestAttributionServiceErrorHandling:
         mock_file = AsyncMock(spec=UploadFile)
         mock_file.filename = "test.jpg"
         mock_file.content_type = "image/jpeg"
-        mock_file.read.return_value = b"fake_image_data"
+        mock_file.read.side_effect = [b"fake_image_data", b""]
         mock_file.seek = AsyncMock()
         mock_file.close = AsyncMock()
 
@@ -28,6 +28,22 @@ class TestAttributor:
         assert "category" in prompt
         assert "primary_color" in prompt
 
+    def test_strip_json_fence(self):
+        """Test fenced JSON is unwrapped and plain text is left alone"""
+
+        class TestAttributor(Attributor):
+            def extract(self, image, image_filename=None):
+                return {}
+
+        attributor = TestAttributor()
+        fenced = 'Sure!\n```json\n{"category": "T-Shirt", "tags": {"a": 1}}\n```'
+
+        assert (
+            attributor.strip_json_fence(fenced)
+            == '{"category": "T-Shirt", "tags": {"a": 1}}'
+        )
+        assert attributor.strip_json_fence('{"category": "Jeans"}') == '{"category": "Jeans"}'
+
 
 @pytest.mark.unit
 @pytest.mark.service
@@ -75,3 +91,66 @@ class TestGeminiAttributor:
         assert result["category"] == "T-Shirt"
         assert result["primary_color"] == "blue"
         assert result["image"] == "test.jpg"
+
+    @patch("app.core.config.settings.GEMINI_API_KEY", "test_key")
+    @patch("google.generativeai.configure")
+    @patch("google.generativeai.GenerativeModel")
+    def test_extract_batch_single_request(self, mock_model_class, mock_configure):
+        """Test batched extraction sends all images in one request"""
+        mock_model = Mock()
+        mock_response = Mock()
+        mock_response.text = '[{"category": "T-Shirt"}, {"category": "Jeans"}]'
+        mock_model.generate_content.return_value = mock_response
+        mock_model_class.return_value = mock_model
+
+        attributor = GeminiAttributor()
+        images = [Image.new("RGB", (100, 100), color=c) for c in ("red", "blue")]
+
+        results = attributor.extract_batch(images, ["shirt.jpg", "jeans.jpg"])
+
+        assert mock_model.generate_content.call_count == 1
+        assert [r["category"] for r in results] == ["T-Shirt", "Jeans"]
+        assert [r["image"] for r in results] == ["shirt.jpg", "jeans.jpg"]
+
+    @patch("app.core.config.settings.GEMINI_API_KEY", "test_key")
+    @patch("google.generativeai.configure")
+    @patch("google.generativeai.GenerativeModel")
+    def test_extract_batch_falls_back_on_mismatched_response(
+        self, mock_model_class, mock_configure
+    ):
+        """Test batched extraction falls back to per-image calls"""
+        batched = Mock(text='[{"category": "T-Shirt"}]')
+        single = Mock(text='{"category": "Jeans"}')
+        mock_model = Mock()
+        mock_model.generate_content.side_effect = [batched, single, single]
+        mock_model_class.return_value = mock_model
+
+        attributor = GeminiAttributor()
+        images = [Image.new("RGB", (100, 100), color=c) for c in ("red", "blue")]
+
+        results = attributor.extract_batch(images, ["a.jpg", "b.jpg"])
+
+        assert mock_model.generate_content.call_count == 3
+        assert [r["image"] for r in results] == ["a.jpg", "b.jpg"]
+
+    @patch("app.core.config.settings.GEMINI_API_KEY", "test_key")
+    @patch("google.generativeai.configure")
+    @patch("google.generativeai.GenerativeModel")
+    def test_extract_batch_does_not_wait_before_first_attempt(
+        self, mock_model_class, mock_configure
+    ):
+        """Test the batched call and its fallback skip the initial retry delay"""
+        batched = Mock(text="not json")
+        single = Mock(text='{"category": "Jeans"}')
+        mock_model = Mock()
+        mock_model.generate_content.side_effect = [batched, single, single]
+        mock_model_class.return_value = mock_model
+
+        attributor = GeminiAttributor()
+        images = [Image.new("RGB", (100, 100), color=c) for c in ("red", "blue")]
+
+        with patch("app.core.retry_utils.time.sleep") as mock_sleep:
+            results = attributor.extract_batch(images, ["a.jpg", "b.jpg"])
+
+        mock_sleep.assert_not_called()
+        assert [r["category"] for r in results] == ["Jeans", "Jeans"]
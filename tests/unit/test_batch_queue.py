@@ -0,0 +1,66 @@
+import asyncio
+import pytest
+from app.core.batch_queue import AsyncBatchQueue
+
+
+@pytest.mark.unit
+class TestAsyncBatchQueue:
+    """Test AsyncBatchQueue batching behaviour"""
+
+    @pytest.mark.asyncio
+    async def test_requests_are_batched_and_results_routed(self):
+        """Test concurrent requests share batches and get their own results"""
+        batches = []
+
+        async def process(items):
+            batches.append(list(items))
+            return [item * 2 for item in items]
+
+        queue = AsyncBatchQueue(process, max_batch_size=3, max_wait_time=0.05)
+        results = await asyncio.gather(*(queue.add_request(i) for i in range(7)))
+
+        assert results == [0, 2, 4, 6, 8, 10, 12]
+        assert batches == [[0, 1, 2], [3, 4, 5], [6]]
+
+    @pytest.mark.asyncio
+    async def test_requests_with_different_keys_are_not_batched_together(self):
+        """Test items only share a batch with items queued under the same key"""
+        batches = []
+
+        async def process(items):
+            batches.append(list(items))
+            return items
+
+        queue = AsyncBatchQueue(process, max_batch_size=8, max_wait_time=0.05)
+        await asyncio.gather(
+            queue.add_request("a1", key="alice"),
+            queue.add_request("b1", key="bob"),
+            queue.add_request("a2", key="alice"),
+        )
+
+        assert sorted(batches) == [["a1", "a2"], ["b1"]]
+
+    @pytest.mark.asyncio
+    async def test_batch_failure_propagates_to_each_caller(self):
+        """Test an exception from the batch function reaches every waiter"""
+
+        async def process(items):
+            raise RuntimeError("model unavailable")
+
+        queue = AsyncBatchQueue(process, max_batch_size=4, max_wait_time=0.01)
+        results = await asyncio.gather(
+            queue.add_request(1), queue.add_request(2), return_exceptions=True
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_wrong_result_count_is_an_error(self):
+        """Test a batch function returning too few results fails the batch"""
+
+        async def process(items):
+            return items[:1]
+
+        queue = AsyncBatchQueue(process, max_batch_size=2, max_wait_time=0.01)
+        with pytest.raises(ValueError):
+            await asyncio.gather(queue.add_request(1), queue.add_request(2))
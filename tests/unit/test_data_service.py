@@ -0,0 +1,163 @@
+import mmap
+import pytest
+from unittest.mock import patch
+from app.core.data_service import UnifiedDataService
+
+
+@pytest.mark.unit
+@pytest.mark.service
+class TestUnifiedDataService:
+    """Test UnifiedDataService local storage"""
+
+    @pytest.fixture
+    def data_service(self, tmp_path):
+        """Local-storage data service rooted in a temporary directory"""
+        with patch("app.core.config.settings.USER_DATA_DIRECTORY", str(tmp_path)), \
+                patch("app.core.config.settings.CREATE_USER_SUBDIRS", True), \
+                patch("app.core.config.settings.USE_FIREBASE", False):
+            yield UnifiedDataService()
+
+    def test_load_missing_user_returns_none(self, data_service):
+        """Test loading a user with no stored data"""
+        assert data_service.load_user_data("nobody") is None
+
+    def test_update_user_image_appends_to_log(self, data_service):
+        """Test image updates are appended to the log and merged on load"""
+        data_service.save_user_data("test_user", {"images": {"a": {"filename": "a.jpg"}}})
+
+        assert data_service.update_user_image("test_user", "b", {"filename": "b.jpg"})
+
+        # The base JSON file is untouched; the new image lives in the log
+        assert data_service.get_user_image_log_path("test_user").exists()
+        user_data = data_service.load_user_data("test_user")
+        assert set(user_data["images"]) == {"a", "b"}
+        assert user_data["metadata"]["total_images"] == 2
+
+    def test_logged_images_keep_callers_user_id_in_metadata(self, data_service):
+        """Test metadata names the user as the image entries do, not normalized"""
+        data_service.update_user_image("test_user", "a", {"user_id": "Test_User"})
+
+        metadata = data_service.load_user_data("test_user")["metadata"]
+        assert metadata["user_id"] == "Test_User"
+        assert metadata["total_images"] == 1
+
+    def test_later_log_records_win(self, data_service):
+        """Test repeated updates for the same hash keep the latest data"""
+        data_service.update_user_image("test_user", "a", {"filename": "old.jpg"})
+        data_service.update_user_image("test_user", "a", {"filename": "new.jpg"})
+
+        user_data = data_service.load_user_data("test_user")
+        assert user_data["images"]["a"]["filename"] == "new.jpg"
+
+    def test_compaction_folds_log_into_json(self, data_service):
+        """Test the log is folded into the JSON file once it passes the threshold"""
+        with patch("app.core.config.settings.USER_DATA_COMPACT_THRESHOLD", 0):
+            data_service.update_user_image("test_user", "a", {"filename": "a.jpg"})
+
+        assert not data_service.get_user_image_log_path("test_user").exists()
+        assert data_service.get_user_json_file_path("test_user").exists()
+        assert "a" in data_service.load_user_data("test_user")["images"]
+
+    def test_large_files_are_read_through_mmap(self, data_service):
+        """Test JSON files over the mmap threshold load the same data"""
+        data = {"images": {"hash1": {"category": "T-Shirt"}}}
+        data_service.save_user_data("test_user", data)
+        data_service._invalidate_cache("test_user")
+
+        with patch("app.core.data_service._MMAP_THRESHOLD", 0), \
+                patch("app.core.data_service.mmap.mmap", wraps=mmap.mmap) as mock_mmap:
+            assert data_service.load_user_data("test_user") == data
+        assert mock_mmap.call_count == 1
+
+    def test_load_user_data_is_cached_until_files_change(self, data_service):
+        """Test repeat loads reuse cached data until the user's files change"""
+        data_service.save_user_data("test_user", {"images": {"a": {}}})
+        first = data_service.load_user_data("test_user")
+
+        with patch.object(data_service, "_load_from_json") as mock_load:
+            assert data_service.load_user_data("test_user") is first
+            mock_load.assert_not_called()
+
+        data_service.update_user_image("test_user", "b", {})
+        assert set(data_service.load_user_data("test_user")["images"]) == {"a", "b"}
+
+    def test_cache_evicts_least_recently_used(self, data_service):
+        """Test the cache is capped at USER_DATA_CACHE_SIZE entries"""
+        with patch("app.core.config.settings.USER_DATA_CACHE_SIZE", 2):
+            for user in ("u1", "u2", "u3"):
+                data_service.save_user_data(user, {"images": {}})
+                data_service.load_user_data(user)
+
+        assert list(data_service._cache) == ["u2", "u3"]
+
+    def test_write_version_changes_on_every_write(self, data_service):
+        """Test the write version moves on saves and image updates only"""
+        version = data_service.get_write_version("test_user")
+
+        data_service.save_user_data("test_user", {"images": {}})
+        after_save = data_service.get_write_version("test_user")
+        assert after_save > version
+
+        data_service.load_user_data("test_user")
+        assert data_service.get_write_version("test_user") == after_save
+
+        data_service.update_user_image("test_user", "a", {})
+        assert data_service.get_write_version("test_user") > after_save
+        assert data_service.get_write_version("other_user") == 0
+
+    @pytest.mark.asyncio
+    async def test_async_methods_match_sync_results(self, data_service):
+        """Test the async wrappers read and write the same data"""
+        assert await data_service.asave_user_data("test_user", {"images": {}})
+        assert await data_service.aupdate_user_image("test_user", "a", {"filename": "a.jpg"})
+
+        user_data = await data_service.aload_user_data("test_user")
+        assert user_data == data_service.load_user_data("test_user")
+        assert "a" in user_data["images"]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_image_updates_are_batched(self, data_service):
+        """Test concurrent updates for one user are coalesced into fewer writes"""
+        import asyncio
+
+        write_sizes = []
+        original = data_service.update_user_images
+
+        def record_write(user_id, images):
+            write_sizes.append(len(images))
+            return original(user_id, images)
+
+        with patch.object(data_service, "update_user_images", side_effect=record_write):
+            results = await asyncio.gather(*(
+                data_service.aupdate_user_image("test_user", f"hash{i}", {"index": i})
+                for i in range(10)
+            ))
+
+        assert all(results)
+        assert sum(write_sizes) == 10
+        assert len(write_sizes) < 10
+        assert len(data_service.load_user_data("test_user")["images"]) == 10
+        # Per-user bookkeeping is released once no update is in flight
+        assert data_service._update_locks == {}
+
+    @pytest.mark.asyncio
+    async def test_failed_image_update_exception_is_retrieved(self, data_service):
+        """Test a failed write raises to its caller without leaving an unretrieved future"""
+        import asyncio
+        import gc
+
+        unhandled = []
+        loop = asyncio.get_running_loop()
+        loop.set_exception_handler(lambda loop, context: unhandled.append(context))
+        try:
+            with patch.object(
+                data_service, "update_user_images", side_effect=RuntimeError("disk full")
+            ):
+                with pytest.raises(RuntimeError):
+                    await data_service.aupdate_user_image("test_user", "a", {})
+            await asyncio.sleep(0)
+            gc.collect()
+        finally:
+            loop.set_exception_handler(None)
+
+        assert unhandled == []
@@ -0,0 +1,146 @@
+import pytest
+from unittest.mock import MagicMock, Mock, patch
+from app.core.firebase_utils import FirebaseService
+
+
+@pytest.mark.unit
+@pytest.mark.service
+class TestFirebaseService:
+    """Test FirebaseService against a mocked Firestore client"""
+
+    @pytest.fixture
+    def firebase_service(self):
+        """Firebase service whose Firestore client is a MagicMock"""
+
+        def initialize(service):
+            service._db = MagicMock()
+            service._initialized = True
+
+        with patch("app.core.firebase_utils.FIREBASE_AVAILABLE", True), \
+                patch("app.core.firebase_utils.firestore", MagicMock(), create=True), \
+                patch("app.core.firebase_utils.settings.FIRESTORE_LOCAL_CACHE_PATH", ""), \
+                patch.object(FirebaseService, "_initialize_firebase", initialize):
+            yield FirebaseService()
+
+    def test_list_users_where_pages_with_filter_field_projected(self, firebase_service):
+        """Test filtered listings keep the filter field so cursors work past one page"""
+        query = firebase_service._db.collection.return_value.where.return_value
+        projected = query.select.return_value
+        first_page = [Mock(id=f"user{i}") for i in range(500)]
+        second_page = [Mock(id="user500")]
+        projected.limit.return_value.stream.return_value = first_page
+        projected.start_after.return_value.limit.return_value.stream.return_value = second_page
+
+        user_ids = firebase_service.list_users_where("age", ">", 18, limit=1000)
+
+        query.select.assert_called_once_with(["age"])
+        projected.start_after.assert_called_once_with(first_page[-1])
+        assert len(user_ids) == 501
+        assert user_ids[-1] == "user500"
+
+    def test_list_users_reads_names_only(self, firebase_service):
+        """Test unfiltered listings project no fields"""
+        users = firebase_service._db.collection.return_value
+        users.select.return_value.limit.return_value.stream.return_value = [
+            Mock(id="alice"),
+            Mock(id="bob"),
+        ]
+
+        assert firebase_service.list_users(limit=10) == ["alice", "bob"]
+        users.select.assert_called_once_with([])
+
+    @staticmethod
+    def serve_documents(firebase_service, documents: dict) -> dict:
+        """Serve user_id -> document data from the mocked users collection"""
+        doc_refs = {
+            user_id: Mock(get=Mock(return_value=Mock(exists=True, to_dict=Mock(return_value=data))))
+            for user_id, data in documents.items()
+        }
+        firebase_service._db.collection.return_value.document.side_effect = doc_refs.get
+        return doc_refs
+
+    def test_read_cache_reuses_documents_until_ttl(self, firebase_service):
+        """Test a document is read from Firestore once per FIRESTORE_CACHE_TTL"""
+        doc_refs = self.serve_documents(firebase_service, {"alice": {"images": {}}})
+
+        with patch("app.core.firebase_utils.settings.FIRESTORE_CACHE_TTL", 60.0):
+            with patch("app.core.firebase_utils.time.monotonic", return_value=1000.0):
+                firebase_service.get_user_data("alice")
+            with patch("app.core.firebase_utils.time.monotonic", return_value=1059.0):
+                assert firebase_service.get_user_data("Alice") == {"images": {}}
+            assert doc_refs["alice"].get.call_count == 1
+
+            with patch("app.core.firebase_utils.time.monotonic", return_value=1061.0):
+                firebase_service.get_user_data("alice")
+            assert doc_refs["alice"].get.call_count == 2
+
+    def test_read_cache_evicts_least_recently_used(self, firebase_service):
+        """Test the read cache holds FIRESTORE_CACHE_SIZE documents, oldest use first out"""
+        doc_refs = self.serve_documents(
+            firebase_service, {user_id: {"id": user_id} for user_id in ("a", "b", "c")}
+        )
+
+        with patch("app.core.firebase_utils.settings.FIRESTORE_CACHE_SIZE", 2):
+            firebase_service.get_user_data("a")
+            firebase_service.get_user_data("b")
+            firebase_service.get_user_data("a")
+            firebase_service.get_user_data("c")
+
+        assert list(firebase_service._read_cache) == ["a", "c"]
+        assert doc_refs["a"].get.call_count == 1
+
+    def test_write_invalidates_cached_document(self, firebase_service):
+        """Test a document written through the service is read fresh afterwards"""
+        doc_refs = self.serve_documents(firebase_service, {"alice": {"images": {}}})
+        firebase_service.get_user_data("alice")
+
+        assert firebase_service.update_user_images("alice", "hash1", {"category": "Jeans"})
+
+        assert "alice" not in firebase_service._read_cache
+        firebase_service.get_user_data("alice")
+        assert doc_refs["alice"].get.call_count == 2
+
+    def test_read_racing_a_write_is_not_cached(self, firebase_service):
+        """Test a read that started before a write does not cache the old document"""
+        doc_refs = self.serve_documents(firebase_service, {"alice": {"images": {"a": {}}}})
+        old_snapshot = doc_refs["alice"].get.return_value
+
+        def slow_get():
+            # The write lands while this read is still in flight
+            assert firebase_service.update_user_images("alice", "b", {"category": "Jeans"})
+            return old_snapshot
+
+        doc_refs["alice"].get.side_effect = slow_get
+        assert firebase_service.get_user_data("alice") == {"images": {"a": {}}}
+
+        assert "alice" not in firebase_service._read_cache
+        doc_refs["alice"].get.side_effect = None
+        firebase_service.get_user_data("alice")
+        assert doc_refs["alice"].get.call_count == 2
+
+    def test_image_update_keeps_metadata_in_step(self, firebase_service):
+        """Test image updates count only new hashes and stamp the user's metadata"""
+        from app.core import firebase_utils
+
+        firestore = firebase_utils.firestore
+        firestore.transactional.side_effect = lambda write: write
+        firestore.Increment.side_effect = lambda count: ("increment", count)
+        doc_ref = firebase_service._db.collection.return_value.document.return_value
+        doc_ref.get.return_value = Mock(
+            exists=True, to_dict=Mock(return_value={"images": {"old": {}}})
+        )
+        transaction = firebase_service._db.transaction.return_value
+
+        assert firebase_service.update_user_images_bulk(
+            "Alice", {"old": {"user_id": "Alice"}, "new": {"user_id": "Alice"}}
+        )
+
+        doc_ref.get.assert_called_once_with(
+            field_paths=["images.old", "images.new"], transaction=transaction
+        )
+        (_, update_data), kwargs = transaction.set.call_args
+        assert update_data["metadata"]["total_images"] == ("increment", 1)
+        assert update_data["metadata"]["user_id"] == "Alice"
+        assert {"metadata.total_images", "metadata.last_updated", "metadata.user_id"} <= set(
+            kwargs["merge"]
+        )
@@ -0,0 +1,117 @@
+import pytest
+from unittest.mock import MagicMock, Mock, patch
+from app.core.gcs_service import GCSService
+
+
+@pytest.mark.unit
+@pytest.mark.service
+class TestGCSServiceCaches:
+    """Test GCSService's download and signed URL caches against a mocked bucket"""
+
+    @pytest.fixture(autouse=True)
+    def gcs_available(self):
+        with patch("app.core.gcs_service.GCS_AVAILABLE", True), \
+                patch("app.core.gcs_service.TRANSFER_MANAGER_AVAILABLE", False):
+            yield
+
+    @staticmethod
+    def make_service(**kwargs) -> GCSService:
+        """Service whose bucket is a MagicMock"""
+        service = GCSService("", **kwargs)
+        service._bucket = MagicMock()
+        service._initialized = True
+        return service
+
+    @staticmethod
+    def put_blobs(service: GCSService, contents: dict) -> dict:
+        """Serve blob_name -> content from the mocked bucket, generation 1"""
+        blobs = {
+            blob_name: Mock(
+                generation=1,
+                size=len(content),
+                download_as_bytes=Mock(return_value=content),
+            )
+            for blob_name, content in contents.items()
+        }
+        service._bucket.get_blob.side_effect = blobs.get
+        return blobs
+
+    def test_repeat_download_is_served_from_cache(self):
+        """Test an unchanged blob's body is only transferred once"""
+        service = self.make_service()
+        blobs = self.put_blobs(service, {"a.jpg": b"a" * 10})
+
+        assert service.download_image("a.jpg") == b"a" * 10
+        assert service.download_image("a.jpg") == b"a" * 10
+
+        assert blobs["a.jpg"].download_as_bytes.call_count == 1
+        assert service._downloads_size == 10
+
+    def test_new_generation_is_downloaded_again(self):
+        """Test a cached body is not served once the blob has been replaced"""
+        service = self.make_service()
+        blobs = self.put_blobs(service, {"a.jpg": b"old"})
+        service.download_image("a.jpg")
+
+        blobs["a.jpg"].generation = 2
+        blobs["a.jpg"].download_as_bytes.return_value = b"new"
+
+        assert service.download_image("a.jpg") == b"new"
+
+    def test_download_cache_stays_within_byte_budget(self):
+        """Test least recently used downloads are evicted to stay in budget"""
+        service = self.make_service(download_cache_bytes=100, download_cache_max_entry_bytes=25)
+        contents = {f"{i}.jpg": bytes([i]) * 20 for i in range(6)}
+        self.put_blobs(service, contents)
+
+        for blob_name in contents:
+            service.download_image(blob_name)
+        # A cache hit makes the blob the most recently used again
+        service.download_image("1.jpg")
+
+        assert service._downloads_size <= 100
+        assert list(service._downloads) == ["2.jpg", "3.jpg", "4.jpg", "5.jpg", "1.jpg"]
+
+    def test_large_download_is_not_cached(self):
+        """Test blobs over the per-entry limit do not displace the cache"""
+        service = self.make_service(download_cache_bytes=100, download_cache_max_entry_bytes=50)
+        self.put_blobs(service, {"small.jpg": b"s" * 10, "large.jpg": b"l" * 30})
+
+        service.download_image("small.jpg")
+        service.download_image("large.jpg")
+
+        # 30 bytes is under the entry limit but over a quarter of the budget
+        assert list(service._downloads) == ["small.jpg"]
+        assert service._downloads_size == 10
+
+    def test_signed_url_is_reused_until_forgotten(self):
+        """Test signing happens once per blob and method until the blob changes"""
+        service = self.make_service(signed_url_cache_ttl=300.0)
+        sign = service._bucket.blob.return_value.generate_signed_url
+        sign.side_effect = lambda **kwargs: f"https://signed/{sign.call_count}"
+
+        first = service.generate_signed_url("a.jpg")
+        assert service.generate_signed_url("a.jpg") == first
+        assert service.generate_signed_url("a.jpg", method="PUT") != first
+        assert sign.call_count == 2
+
+        service._forget_blob("a.jpg")
+        assert service.generate_signed_url("a.jpg") != first
+        assert sign.call_count == 3
+        assert service._signed_url_keys["a.jpg"] == {("a.jpg", "GET", 60)}
+
+    def test_signed_url_expires_after_cache_ttl(self):
+        """Test a cached signed URL is re-signed once it is older than the TTL"""
+        service = self.make_service(signed_url_cache_ttl=10.0)
+        sign = service._bucket.blob.return_value.generate_signed_url
+        sign.return_value = "https://signed"
+
+        with patch("app.core.gcs_service.time.monotonic", return_value=1000.0):
+            service.generate_signed_url("a.jpg")
+        with patch("app.core.gcs_service.time.monotonic", return_value=1005.0):
+            service.generate_signed_url("a.jpg")
+        assert sign.call_count == 1
+
+        with patch("app.core.gcs_service.time.monotonic", return_value=1011.0):
+            service.generate_signed_url("a.jpg")
+        assert sign.call_count == 2
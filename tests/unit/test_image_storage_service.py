@@ -0,0 +1,112 @@
+import pytest
+from unittest.mock import Mock, patch
+from app.core.image_storage_service import ImageStorageService
+
+
+class FakeGCSService:
+    """In-memory stand-in for GCSService's bundle operations"""
+
+    def __init__(self):
+        self.is_available = True
+        self.blobs = {}
+        self.range_reads = []
+
+    def upload_image_bytes(self, image_bytes, blob_name, content_type, metadata):
+        self.blobs[blob_name] = (bytes(image_bytes), metadata)
+        return f"gs://test-bucket/{blob_name}"
+
+    def get_metadata(self, blob_name):
+        return self.blobs[blob_name][1]
+
+    def download_image_range(self, blob_name, start, size):
+        self.range_reads.append((blob_name, start, size))
+        return self.blobs[blob_name][0][start:start + size]
+
+
+# Sizes around the 512-byte tar block boundary exercise the offset padding
+MEMBER_SIZES = [1, 511, 512, 513, 2000]
+
+
+@pytest.mark.unit
+@pytest.mark.service
+class TestImageBundles:
+    """Test writing image bundles and reading members back"""
+
+    @pytest.fixture(autouse=True)
+    def storage_settings(self):
+        """Save processed images without per-user directories"""
+        with patch("app.core.config.settings.SAVE_IMAGES", True), \
+                patch("app.core.config.settings.SAVE_PROCESSED", True), \
+                patch("app.core.config.settings.CREATE_USER_SUBDIRS", False), \
+                patch("app.core.config.settings.GCS_BUCKET_NAME", "test-bucket"):
+            yield
+
+    @pytest.fixture
+    def gcs(self):
+        return FakeGCSService()
+
+    @pytest.fixture
+    def gcs_storage(self, gcs):
+        """Storage service backed by the in-memory GCS fake"""
+        with patch("app.core.config.settings.USE_GCS", True), \
+                patch("app.core.image_storage_service.get_gcs_service", return_value=gcs):
+            yield ImageStorageService()
+
+    @pytest.fixture
+    def local_storage(self, tmp_path):
+        """Storage service writing bundles under a temporary directory"""
+        attribution_service = Mock()
+        attribution_service.ensure_images_directory.return_value = tmp_path
+        with patch("app.core.config.settings.USE_GCS", False), \
+                patch(
+                    "app.core.image_storage_service._get_attribution_service",
+                    return_value=attribution_service,
+                ):
+            yield ImageStorageService()
+
+    @staticmethod
+    def make_images():
+        return [
+            (bytes([i]) * size, f"image{i}.jpg") for i, size in enumerate(MEMBER_SIZES)
+        ]
+
+    def test_gcs_bundle_members_read_back_with_ranged_gets(self, gcs_storage, gcs):
+        """Test each member comes back through one ranged read at its manifest offset"""
+        images = self.make_images()
+
+        bundle_url = gcs_storage.save_processed_image_bundle(images)
+
+        assert bundle_url.startswith("gs://test-bucket/bundles/")
+        for data, filename in images:
+            member = f"{filename[:-4]}_processed.jpg"
+            assert gcs_storage.get_image_from_bundle(bundle_url, member) == data
+
+        blob_name = bundle_url[len("gs://test-bucket/"):]
+        assert [read[2] for read in gcs.range_reads] == MEMBER_SIZES
+        assert all(read[0] == blob_name for read in gcs.range_reads)
+        # Each member's data starts on a block after its header
+        assert all(start % 512 == 0 for _, start, _ in gcs.range_reads)
+
+    def test_gcs_bundle_missing_member_returns_none(self, gcs_storage):
+        """Test asking for a name outside the manifest"""
+        bundle_url = gcs_storage.save_processed_image_bundle(self.make_images())
+
+        assert gcs_storage.get_image_from_bundle(bundle_url, "absent_processed.jpg") is None
+
+    def test_gcs_bundle_over_metadata_limit_is_not_uploaded(self, gcs_storage, gcs):
+        """Test a manifest over GCS's 8 KiB metadata cap is rejected before upload"""
+        images = [(b"x", f"{i:040d}.jpg") for i in range(200)]
+
+        assert gcs_storage.save_processed_image_bundle(images) is None
+        assert gcs.blobs == {}
+
+    def test_local_bundle_members_read_back(self, local_storage, tmp_path):
+        """Test a local bundle is written under bundles/ and members read back"""
+        images = self.make_images()
+
+        bundle_path = local_storage.save_processed_image_bundle(images)
+
+        assert bundle_path.startswith(str(tmp_path / "bundles"))
+        for data, filename in images:
+            member = f"{filename[:-4]}_processed.jpg"
+            assert local_storage.get_image_from_bundle(bundle_path, member) == data
@@ -0,0 +1,64 @@
+import pytest
+from unittest.mock import patch
+from app.core.local_document_cache import LocalDocumentCache
+
+
+@pytest.mark.unit
+class TestLocalDocumentCache:
+    """Test LocalDocumentCache storage and expiry"""
+
+    def test_put_get_shared_between_instances(self, tmp_path):
+        """Test a stored document is visible through another connection"""
+        db_path = str(tmp_path / "cache" / "documents.db")
+        writer = LocalDocumentCache(db_path)
+        writer.put("user1", {"images": {"abc": {"color": "red"}}})
+
+        reader = LocalDocumentCache(db_path)
+        assert reader.get("user1", ttl=60) == {"images": {"abc": {"color": "red"}}}
+
+    def test_expired_and_deleted_documents_are_missing(self, tmp_path):
+        """Test expired or deleted documents are not returned"""
+        cache = LocalDocumentCache(str(tmp_path / "documents.db"))
+        cache.put("user1", {"images": {}})
+
+        assert cache.get("user1", ttl=0) is None
+        cache.delete("user1")
+        assert cache.get("user1", ttl=60) is None
+        assert cache.get("missing", ttl=60) is None
+
+    def test_expired_and_surplus_rows_are_pruned(self, tmp_path):
+        """Test writes prune expired rows and cap the row count"""
+        cache = LocalDocumentCache(str(tmp_path / "documents.db"), ttl=60, max_entries=3)
+        with patch("app.core.local_document_cache.time.time", return_value=1000.0):
+            cache.put("stale", {"images": {}})
+
+        with patch("app.core.local_document_cache._PRUNE_EVERY", 1):
+            for i in range(5):
+                cache.put(f"user{i}", {"images": {}})
+
+        keys = {row[0] for row in cache._conn.execute("SELECT key FROM documents")}
+        assert "stale" not in keys
+        assert len(keys) == 3
+
+    def test_documents_are_not_unpickled(self, tmp_path):
+        """Test stored rows are decoded as JSON, never executed as pickles"""
+        import pickle
+
+        cache = LocalDocumentCache(str(tmp_path / "documents.db"))
+        cache._conn.execute(
+            "INSERT INTO documents (key, stored, data) VALUES (?, ?, ?)",
+            ("evil", 1e12, pickle.dumps({"images": {}})),
+        )
+
+        with patch("pickle.loads") as mock_loads:
+            assert cache.get("evil", ttl=60) is None
+        mock_loads.assert_not_called()
+
+    def test_non_json_values_are_stored_as_strings(self, tmp_path):
+        """Test values orjson cannot encode round-trip as their str() form"""
+        from decimal import Decimal
+
+        cache = LocalDocumentCache(str(tmp_path / "documents.db"))
+        cache.put("user1", {"price": Decimal("1.5")})
+
+        assert cache.get("user1", ttl=60) == {"price": "1.5"}
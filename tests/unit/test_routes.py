@@ -2,6 +2,7 @@ import pytest
 from fastapi.testclient import TestClient
 from unittest.mock import patch, AsyncMock
 from app.main import app
+from app.models.response import StylerResponse
 
 
 @pytest.mark.unit
@@ -21,6 +22,22 @@ class TestRoutes:
         data = response.json()
         assert data["status"] == "healthy"
         assert "timestamp" in data
+        assert response.headers["cache-control"] == "no-store"
+
+    def test_storage_info_etag(self):
+        """Test storage-info is cacheable and honours If-None-Match"""
+        response = self.client.get("/api/v1/storage-info")
+
+        assert response.status_code == 200
+        assert "storage_type" in response.json()
+        assert response.headers["cache-control"] == "public, max-age=300"
+        etag = response.headers["etag"]
+
+        cached = self.client.get(
+            "/api/v1/storage-info", headers={"If-None-Match": etag}
+        )
+        assert cached.status_code == 304
+        assert cached.content == b""
 
     def test_root_endpoint(self):
         """Test root endpoint returns API information"""
@@ -45,6 +62,35 @@ class TestRoutes:
 
         assert response.status_code == 422  # Validation error
 
+    @patch(
+        "app.services.attribution_service.ClothingAttributionService.process_images_for_attributes"
+    )
+    def test_attribute_clothes_rejects_unsupported_type(self, mock_process):
+        """Test attribute_clothes refuses non-image uploads before processing"""
+        response = self.client.post(
+            "/api/v1/attribute_clothes",
+            params={"user_id": "test_user"},
+            files=[("files", ("notes.txt", b"not an image", "text/plain"))],
+        )
+
+        assert response.status_code == 415
+        mock_process.assert_not_called()
+
+    @patch(
+        "app.services.attribution_service.ClothingAttributionService.process_images_for_attributes"
+    )
+    def test_attribute_clothes_rejects_oversized_file(self, mock_process):
+        """Test attribute_clothes refuses files over MAX_FILE_SIZE before processing"""
+        with patch("app.core.config.settings.MAX_FILE_SIZE", 10):
+            response = self.client.post(
+                "/api/v1/attribute_clothes",
+                params={"user_id": "test_user"},
+                files=[("files", ("shirt.jpg", b"x" * 100, "image/jpeg"))],
+            )
+
+        assert response.status_code == 413
+        mock_process.assert_not_called()
+
     @patch("app.services.styler_service.StylerService.generate_outfit_recommendation")
     def test_styler_missing_user_id(self, mock_generate):
         """Test styler endpoint requires user_id"""
@@ -70,7 +116,7 @@ class TestRoutes:
             "outfit_recommendation": {"top": "shirt.jpg"},
             "available_items_count": 5,
         }
-        mock_generate.return_value = mock_response
+        mock_generate.return_value = StylerResponse(**mock_response)
 
         response = self.client.post(
             "/api/v1/styler",
@@ -3,6 +3,7 @@ from unittest.mock import Mock, patch, MagicMock
 from pathlib import Path
 import tempfile
 import json
+from collections import OrderedDict
 from app.services.styler_service import StylerService
 from app.models.response import StylerResponse
 
@@ -139,3 +140,98 @@ class TestStylerService:
         assert response.success is False
         assert response.available_items_count == 0
         assert "No valid clothing items found" in response.message
+
+    @pytest.mark.asyncio
+    async def test_get_outfit_recommendation_coalesces_identical_requests(self):
+        """Test concurrent identical styling requests share one generation call"""
+        import asyncio
+
+        calls = 0
+
+        async def fake_generate(user_id, city, weather, occasion):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return StylerResponse(
+                success=True,
+                message="ok",
+                user_id=user_id,
+                styling_timestamp="2023-01-01T00:00:00",
+                request_parameters={"city": city, "weather": weather, "occasion": occasion},
+                available_items_count=1,
+            )
+
+        with patch(
+            "app.services.styler_service.StylerService.generate_outfit_recommendation",
+            side_effect=fake_generate,
+        ), patch("app.services.styler_service._recommendation_cache", OrderedDict()), patch(
+            "app.core.config.settings.STYLER_CACHE_TTL", 60.0
+        ):
+            args = ("coalesce_user", "Toronto", "cold", "work")
+            first, second = await asyncio.gather(
+                StylerService.get_outfit_recommendation(*args),
+                StylerService.get_outfit_recommendation(*args),
+            )
+            # A later identical call is served from the result cache
+            third = await StylerService.get_outfit_recommendation(*args)
+
+        assert calls == 1
+        assert first is second is third
+
+    @pytest.mark.asyncio
+    async def test_get_outfit_recommendation_cache_follows_user_data(self):
+        """Test cached recommendations are keyed by normalized user and dropped after a data write"""
+        ok = StylerResponse(
+            success=True,
+            message="ok",
+            user_id="bob",
+            styling_timestamp="2023-01-01T00:00:00",
+            request_parameters={},
+            available_items_count=1,
+        )
+        data_service = Mock()
+        data_service.get_write_version.side_effect = [0, 0, 1]
+
+        with patch(
+            "app.services.styler_service.StylerService.generate_outfit_recommendation",
+            return_value=ok,
+        ) as mock_generate, patch(
+            "app.services.styler_service._recommendation_cache", OrderedDict()
+        ), patch(
+            "app.services.styler_service.get_data_service", return_value=data_service
+        ), patch(
+            "app.core.config.settings.STYLER_CACHE_TTL", 60.0
+        ):
+            await StylerService.get_outfit_recommendation("bob", "Toronto", "cold", "work")
+            # Same user after normalization, data unchanged: served from cache
+            await StylerService.get_outfit_recommendation(" bob ", "Toronto", "cold", "work")
+            assert mock_generate.call_count == 1
+            # The user's data was written since: regenerated
+            await StylerService.get_outfit_recommendation("bob", "Toronto", "cold", "work")
+
+        assert mock_generate.call_count == 2
+        data_service.get_write_version.assert_called_with("bob")
+
+    @pytest.mark.asyncio
+    async def test_get_outfit_recommendation_does_not_cache_failures(self):
+        """Test unsuccessful recommendations are regenerated on the next call"""
+        failed = StylerResponse(
+            success=False,
+            message="failed",
+            user_id="failing_user",
+            styling_timestamp="2023-01-01T00:00:00",
+            request_parameters={},
+            available_items_count=0,
+        )
+
+        with patch(
+            "app.services.styler_service.StylerService.generate_outfit_recommendation",
+            return_value=failed,
+        ) as mock_generate, patch(
+            "app.services.styler_service._recommendation_cache", OrderedDict()
+        ):
+            args = ("failing_user", "Toronto", "cold", "work")
+            await StylerService.get_outfit_recommendation(*args)
+            await StylerService.get_outfit_recommendation(*args)
+
+        assert mock_generate.call_count == 2
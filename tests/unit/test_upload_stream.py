@@ -0,0 +1,76 @@
+import pytest
+from unittest.mock import Mock, patch
+from fastapi import HTTPException
+from app.core.upload_stream import UploadFileTarget, parse_upload_stream
+
+
+@pytest.mark.unit
+class TestUploadFileTarget:
+    """Test UploadFileTarget part handling"""
+
+    def start_part(self, target, filename="shirt.jpg", content_type="image/jpeg"):
+        target.multipart_filename = filename
+        target.multipart_content_type = content_type
+        target.on_start()
+
+    @pytest.mark.asyncio
+    async def test_collects_parts_as_upload_files(self):
+        """Test each finished part becomes a rewound in-memory UploadFile"""
+        target = UploadFileTarget()
+        for name, body in (("a.jpg", [b"ab", b"cd"]), ("b.png", [b"xyz"])):
+            self.start_part(target, name)
+            for chunk in body:
+                target.on_data_received(chunk)
+            target.on_finish()
+
+        assert [f.filename for f in target.files] == ["a.jpg", "b.png"]
+        assert [f.size for f in target.files] == [4, 3]
+        assert await target.files[0].read() == b"abcd"
+        assert target.files[0].content_type == "image/jpeg"
+
+    def test_check_runs_before_body(self):
+        """Test the upload check can reject a part when it starts"""
+        check = Mock(side_effect=HTTPException(status_code=415, detail="nope"))
+        target = UploadFileTarget(check)
+
+        with pytest.raises(HTTPException) as exc_info:
+            self.start_part(target, "notes.txt", "text/plain")
+
+        assert exc_info.value.status_code == 415
+        assert check.call_args[0][0].filename == "notes.txt"
+
+    def test_oversized_part_aborts_mid_stream(self):
+        """Test a part is refused as soon as it exceeds MAX_FILE_SIZE"""
+        target = UploadFileTarget()
+        self.start_part(target)
+
+        with patch("app.core.config.settings.MAX_FILE_SIZE", 5):
+            target.on_data_received(b"1234")
+            with pytest.raises(HTTPException) as exc_info:
+                target.on_data_received(b"5678")
+
+        assert exc_info.value.status_code == 413
+
+    def test_too_many_parts_are_refused_while_parsing(self):
+        """Test a part past MAX_FILES_PER_REQUEST is refused before its body"""
+        target = UploadFileTarget()
+
+        with patch("app.core.config.settings.MAX_FILES_PER_REQUEST", 2):
+            for name in ("a.jpg", "b.jpg"):
+                self.start_part(target, name)
+                target.on_data_received(b"data")
+                target.on_finish()
+            with pytest.raises(HTTPException) as exc_info:
+                self.start_part(target, "c.jpg")
+
+        assert exc_info.value.status_code == 400
+        assert len(target.files) == 2
+
+    @pytest.mark.asyncio
+    async def test_parse_without_library_is_not_implemented(self):
+        """Test a clear 501 when streaming-form-data is missing"""
+        with patch("app.core.upload_stream.STREAMING_FORM_DATA_AVAILABLE", False):
+            with pytest.raises(HTTPException) as exc_info:
+                await parse_upload_stream(Mock())
+
+        assert exc_info.value.status_code == 501